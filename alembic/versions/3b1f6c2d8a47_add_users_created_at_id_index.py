@@ -0,0 +1,38 @@
+"""add users (created_at, id) index for keyset pagination
+
+Revision ID: 3b1f6c2d8a47
+Revises: 9e6637e6b059
+Create Date: 2026-10-18 10:12:03.418211
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b1f6c2d8a47'
+down_revision: Union[str, None] = '9e6637e6b059'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 대용량 테이블에서 쓰기 잠금을 피하기 위해 CONCURRENTLY로 생성
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_users_created_at_id",
+            "users",
+            ["created_at", "id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_users_created_at_id",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
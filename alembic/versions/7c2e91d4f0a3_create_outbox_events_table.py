@@ -0,0 +1,34 @@
+"""create outbox_events table
+
+Revision ID: 7c2e91d4f0a3
+Revises: 3b1f6c2d8a47
+Create Date: 2026-10-18 11:04:27.530914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e91d4f0a3'
+down_revision: Union[str, None] = '3b1f6c2d8a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('outbox_events',
+    sa.Column('id', sa.BigInteger(), nullable=False, comment='PK: 이벤트 ID'),
+    sa.Column('exchange', sa.String(length=100), nullable=False, comment='발행 대상 exchange'),
+    sa.Column('routing_key', sa.String(length=100), nullable=False, comment='발행 routing key'),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False, comment='이벤트 본문 (JSON)'),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False, comment='생성 시각'),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('outbox_events')
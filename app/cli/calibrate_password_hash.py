@@ -0,0 +1,84 @@
+"""
+비밀번호 해시 비용 측정
+
+이 서버(배포 대상 호스트)에서 해싱 시간을 측정해 목표 지연 시간 이내의 가장 높은 비용을 추천합니다.
+
+    python -m app.cli.calibrate_password_hash --target-ms 250
+    python -m app.cli.calibrate_password_hash --scheme argon2 --target-ms 250
+"""
+import argparse
+import statistics
+import time
+
+from passlib.hash import argon2, bcrypt
+
+from app.common.config import settings
+from app.common.security import HAS_ARGON2
+
+SAMPLE_PASSWORD = "calibration-password-1234"
+
+
+def measure_ms(handler, samples: int) -> float:
+    # 해시 1회 소요 시간의 중앙값(ms). 검증도 같은 비용이 듭니다.
+    durations = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        handler.hash(SAMPLE_PASSWORD)
+        durations.append((time.perf_counter() - started) * 1000)
+    return statistics.median(durations)
+
+
+def calibrate(make_handler, costs: range, target_ms: float, samples: int) -> tuple[int | None, list[tuple[int, float]]]:
+    """
+    비용을 올려가며 측정하고, 목표 시간 이내인 가장 높은 비용을 반환합니다.
+    (목표를 넘는 첫 비용에서 측정을 멈춤)
+    """
+    # 첫 호출의 backend 로딩 시간이 측정에 섞이지 않도록 미리 한 번 실행
+    make_handler(costs[0]).hash(SAMPLE_PASSWORD)
+    chosen = None
+    measured = []
+    for cost in costs:
+        elapsed = measure_ms(make_handler(cost), samples)
+        measured.append((cost, elapsed))
+        if elapsed > target_ms:
+            break
+        chosen = cost
+    return chosen, measured
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비밀번호 해시 비용 측정")
+    parser.add_argument("--scheme", choices=["bcrypt", "argon2"], default=settings.PASSWORD_HASH_SCHEME)
+    parser.add_argument("--target-ms", type=float, default=250.0, help="로그인 1회당 목표 해싱 시간(ms)")
+    parser.add_argument("--samples", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.scheme == "argon2":
+        if not HAS_ARGON2:
+            parser.error("argon2를 측정하려면 argon2-cffi 패키지가 필요합니다.")
+        # 메모리 비용은 설정값으로 고정하고 time cost(반복 횟수)를 조정
+        env_name = "ARGON2_TIME_COST"
+        chosen, measured = calibrate(
+            lambda cost: argon2.using(
+                type="ID", rounds=cost,
+                memory_cost=settings.ARGON2_MEMORY_COST, parallelism=settings.ARGON2_PARALLELISM,
+            ),
+            range(1, 21), args.target_ms, args.samples,
+        )
+    else:
+        env_name = "BCRYPT_ROUNDS"
+        chosen, measured = calibrate(lambda cost: bcrypt.using(rounds=cost), range(4, 32), args.target_ms, args.samples)
+
+    print(f"{'cost':>6} {'ms':>10} {'logins/s/core':>14}")
+    for cost, elapsed in measured:
+        print(f"{cost:>6} {elapsed:>10.1f} {1000 / elapsed:>14.1f}")
+
+    if chosen is None:
+        print(f"⚠️ 가장 낮은 비용도 목표({args.target_ms}ms)를 넘습니다.")
+        return
+    print(f"\n✅ 추천: PASSWORD_HASH_SCHEME={args.scheme} {env_name}={chosen}")
+    print("   (PASSWORD_REHASH_ON_LOGIN=true이면 기존 해시는 다음 로그인 시 새 비용으로 변경됩니다.)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import argparse
+import asyncio
+from typing import AsyncIterator
+from app.common.config import settings
+from app.common.security import PasswordHasher
+from app.db.session import async_session_factory
+from app.domain.user.user_enum import UserFileFormat
+from app.repository.persistence.user_import_repository_impl import UserImportRepositoryImpl
+from app.service.user_import_service import UserImportService
+
+CHUNK_SIZE = 1 << 16
+
+
+async def _read_chunks(path: str) -> AsyncIterator[bytes]:
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+async def import_file(path: str, fmt: UserFileFormat, batch_size: int, workers: int) -> None:
+    # API 서버와 달리 전용 프로세스이므로 모든 코어를 해싱에 사용
+    hasher = PasswordHasher(executor_type="process", max_workers=workers)
+    try:
+        async with async_session_factory() as session:
+            service = UserImportService(
+                UserImportRepositoryImpl(session), hasher=hasher, batch_size=batch_size, max_plain_passwords=None
+            )
+            result = await service.import_users(_read_chunks(path), fmt)
+    finally:
+        hasher.shutdown()
+    print(result.model_dump_json(indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사용자 대량 가져오기 (CSV/NDJSON)")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=[f.value for f in UserFileFormat], default=UserFileFormat.CSV.value)
+    parser.add_argument("--batch-size", type=int, default=settings.USER_IMPORT_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=0, help="해싱 프로세스 수 (0이면 CPU 코어 수)")
+    args = parser.parse_args()
+    asyncio.run(import_file(args.path, UserFileFormat(args.format), args.batch_size, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import asyncio
+import math
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable
+
+from app.common.config import settings
+from app.common.local_cache import LocalLRUCache
+from app.common.logger import logger
+from app.common.redis_utils import safe_redis_get, safe_redis_get_with_ttl, safe_redis_set
+from app.common.single_flight import SingleFlight
+
+# 키별 최근 적재 소요 시간(초). XFetch의 delta로 사용
+DEFAULT_RECOMPUTE_SECONDS = 0.05
+
+single_flight = SingleFlight()
+_recompute_seconds = LocalLRUCache(maxsize=10000, ttl=3600)
+
+
+async def get_or_load(redis, key: str, loader: Callable[[], Awaitable[Any]], ex: int = 300) -> Any:
+    """
+    캐시를 조회하고, 미스이면 loader 결과를 캐싱하여 반환합니다.
+    - 같은 키의 동시 미스는 워커 내에서 loader 한 번으로 합칩니다. (single-flight)
+    - CACHE_STAMPEDE_LOCK_ENABLED이면 워커 간에도 Redis 락으로 한 곳에서만 적재합니다.
+    - CACHE_EARLY_REFRESH_BETA > 0이면 만료 직전 확률적으로 미리 갱신합니다. (XFetch)
+      남은 TTL은 값과 같은 파이프라인으로 조회하므로 캐시 히트당 Redis 왕복은 1회입니다.
+    """
+    if settings.CACHE_EARLY_REFRESH_BETA > 0:
+        cached, ttl_ms = await safe_redis_get_with_ttl(redis, key)
+    else:
+        cached, ttl_ms = await safe_redis_get(redis, key), -1
+    if cached:
+        if ttl_ms >= 0 and key not in single_flight and _should_refresh_early(key, ttl_ms):
+            return await single_flight.do(key, lambda: _load_and_store(redis, key, loader, ex))
+        return cached
+
+    return await single_flight.do(key, lambda: _load_with_lock(redis, key, loader, ex))
+
+
+def _should_refresh_early(key: str, ttl_ms: int) -> bool:
+
+    delta = _recompute_seconds.get(key) or DEFAULT_RECOMPUTE_SECONDS
+    # XFetch: 남은 TTL이 짧고 적재가 오래 걸릴수록 높은 확률로 갱신
+    return -delta * settings.CACHE_EARLY_REFRESH_BETA * math.log(1.0 - random.random()) >= ttl_ms / 1000
+
+
+async def _load_and_store(redis, key: str, loader, ex: int) -> Any:
+    started = time.perf_counter()
+    value = await loader()
+    _recompute_seconds.set(key, time.perf_counter() - started)
+    await safe_redis_set(redis, key, value, ex=ex)
+    return value
+
+
+async def _load_with_lock(redis, key: str, loader, ex: int) -> Any:
+    if not settings.CACHE_STAMPEDE_LOCK_ENABLED:
+        return await _load_and_store(redis, key, loader, ex)
+
+    lock_key = f"lock:{key}"
+    token = uuid.uuid4().hex
+    try:
+        acquired = await redis.acquire_lock(lock_key, token, settings.CACHE_STAMPEDE_LOCK_TTL_MS)
+    except Exception as e:
+        logger.warning(f"❌ Redis 캐시 락 획득 실패: {e}")
+        return await _load_and_store(redis, key, loader, ex)
+
+    if not acquired:
+        # 다른 워커가 적재 중: 잠시 캐시를 다시 확인하고, 시간 내에 채워지지 않으면 직접 적재
+        deadline = time.monotonic() + settings.CACHE_STAMPEDE_WAIT_MS / 1000
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            cached = await safe_redis_get(redis, key)
+            if cached:
+                return cached
+        return await _load_and_store(redis, key, loader, ex)
+
+    try:
+        return await _load_and_store(redis, key, loader, ex)
+    finally:
+        try:
+            await redis.release_lock(lock_key, token)
+        except Exception as e:
+            logger.warning(f"❌ Redis 캐시 락 해제 실패: {e}")
@@ -8,17 +8,130 @@ class Settings(BaseSettings):
     DB_NAME: str = "DB_NAME"
     DB_ECHO: bool = False
 
+    # DB 커넥션 풀 (프로세스별)
+    # 최대 커넥션 = 프로세스 수 x (DB_POOL_SIZE + DB_MAX_OVERFLOW) 이므로 postgres max_connections(기본 100) 이내로 설정
+    # 기본값: API 워커 4 + consumer 1 + outbox relay 1 = 6 x 15 = 90 (alembic 등 여유 10)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # 커넥션을 얻기 위해 기다리는 최대 시간(초)
+    DB_POOL_RECYCLE: int = 1800  # 이 시간(초)보다 오래된 커넥션은 재연결 (-1이면 비활성화)
+    # True: 체크아웃마다 ping (왕복 1회 추가)
+    # False: ping 없이 사용하고, 끊긴 커넥션은 오류 발생 시 풀에서 폐기 (pool_recycle과 함께 사용)
+    DB_POOL_PRE_PING: bool = True
+    # 컴파일된 SQL 캐시(SQLAlchemy) / 커넥션별 prepared statement 캐시(asyncpg) 크기
+    DB_QUERY_CACHE_SIZE: int = 1200
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+
     JWT_SECRET_KEY: str = "JWT_SECRET_KEY"
 
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # 비대칭 서명(JWT_ALGORITHM=RS256/ES256 등) 시 키 파일(`<kid>.pem`) 디렉토리와 서명에 쓸 kid
+    JWT_KEYS_DIR: str = "/run/secrets/jwt"
+    JWT_ACTIVE_KID: str = ""  # 비워두면 파일명 순으로 마지막 키
+    JWT_ACCEPT_LEGACY_HMAC: bool = False  # 비대칭 전환 중 kid 없는 HS256 토큰(JWT_SECRET_KEY)도 허용
+    JWT_JWKS_MAX_AGE: int = 300  # /.well-known/jwks.json 캐시 시간(초)
+    # 로그인/회원가입 요청 제한 (슬라이딩 윈도우, window 초 동안 최대 횟수)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_WINDOW: float = 60.0
+    RATE_LIMIT_IP_LIMIT: int = 30  # IP별
+    RATE_LIMIT_EMAIL_LIMIT: int = 5  # 이메일별
+    RATE_LIMIT_LOCAL_MAXSIZE: int = 100000  # 워커별 토큰 버킷 최대 키 수
+    # X-Forwarded-For/X-Real-IP를 신뢰할 프록시(nginx) 주소/대역 (쉼표 구분). 비워두면 연결 주소를 그대로 사용
+    TRUSTED_PROXIES: str = ""
+    INTROSPECTION_TOKEN: str = ""  # 게이트웨이용 토큰 검증 API 인증 값 (X-Introspection-Token, 비워두면 Admin만 허용)
+    JWT_VERIFY_CACHE_SIZE: int = 10000  # 검증된 토큰 claims 캐시 크기 (0이면 비활성화)
+
+    # 토큰 폐기 목록: Redis(원본) + 워커별 Bloom filter(로컬 사전 확인)
+    REVOCATION_SYNC_INTERVAL: float = 1.0  # 다른 워커의 폐기 내역을 가져오는 주기(초)
+    REVOCATION_BLOOM_CAPACITY: int = 100000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    REVOCATION_REBUILD_INTERVAL: float = 3600.0  # 만료된 항목을 정리하고 Bloom filter를 다시 만드는 주기(초)
 
     RABBITMQ_URL: str = "RABBITMQ_URL"
+    RABBITMQ_CHANNEL_POOL_SIZE: int = 4
+    RABBITMQ_PUBLISHER_CONFIRMS: bool = True
+
+    # 이벤트 consumer: prefetch, 동시 처리 수, ack 배치, 재시도
+    CONSUMER_PREFETCH_COUNT: int = 200
+    CONSUMER_CONCURRENCY: int = 50
+    CONSUMER_ACK_BATCH_SIZE: int = 50
+    CONSUMER_ACK_FLUSH_INTERVAL: float = 0.5
+    CONSUMER_MAX_RETRIES: int = 5
+    CONSUMER_RETRY_BASE_DELAY: float = 1.0  # 재시도 n회차 지연 = base * 2^(n-1) 초
+
+    # 트랜잭션 아웃박스 relay
+    OUTBOX_RELAY_BATCH_SIZE: int = 500
+    OUTBOX_RELAY_POLL_INTERVAL: float = 1.0
+    OUTBOX_RELAY_METRICS_PORT: int = 9101  # relay 프로세스의 /metrics 포트 (0이면 비활성화)
 
     REDIS_HOST: str = "REDIS_HOST"
     REDIS_PORT: int = 6379
 
+    # 2단 캐시(L1 프로세스 내 LRU + Redis). 워커 간 무효화는 Redis pub/sub 사용
+    CACHE_L1_ENABLED: bool = False
+    CACHE_L1_MAXSIZE: int = 10000
+    CACHE_L1_TTL: float = 30.0
+    CACHE_L1_PREFIXES: str = "user:"  # 콤마로 구분
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"
+
+    # 캐시 stampede 방지: 워커 간 Redis 락, 만료 전 확률적 갱신(XFetch, 0이면 사용 안 함)
+    CACHE_STAMPEDE_LOCK_ENABLED: bool = False
+    CACHE_STAMPEDE_LOCK_TTL_MS: int = 5000
+    CACHE_STAMPEDE_WAIT_MS: int = 1000
+    CACHE_EARLY_REFRESH_BETA: float = 0.0
+
+    # Redis 캐시 값 직렬화 형식: orjson | msgpack | json (읽기는 모든 형식 지원)
+    CACHE_SERIALIZER: str = "orjson"
+
+    # 비밀번호 해싱 executor: thread | process
+    PASSWORD_HASH_EXECUTOR: str = "thread"
+    # 비밀번호 해시 방식과 비용 (python -m app.cli.calibrate_password_hash로 측정 후 설정)
+    PASSWORD_HASH_SCHEME: str = "bcrypt"  # "bcrypt" 또는 "argon2" (argon2-cffi 필요)
+    BCRYPT_ROUNDS: int = 12
+    ARGON2_TIME_COST: int = 2
+    ARGON2_MEMORY_COST: int = 19456  # KiB
+    ARGON2_PARALLELISM: int = 1
+    PASSWORD_REHASH_ON_LOGIN: bool = True  # 로그인 시 저장된 해시의 방식/비용이 설정과 다르면 다시 해싱하여 저장
+    PASSWORD_HASH_MAX_WORKERS: int = 0  # 0이면 CPU 코어 수
+    PASSWORD_HASH_MAX_PENDING: int = 64  # 실행 + 대기 중인 해싱 작업 상한
+
+    # 사용자 목록 total 계산 방식: exact | cached | estimated
+    USER_COUNT_MODE: str = "cached"
+    USER_COUNT_CACHE_TTL: int = 300
+
+    # 인증 주체(principal) 캐시: 프로세스 내 캐시 + Redis
+    PRINCIPAL_CACHE_TTL: int = 300
+    PRINCIPAL_TOMBSTONE_TTL: int = 10  # 무효화 후 이 시간(초) 동안은 캐시에 다시 저장하지 않음 (DB 조회~저장 사이 경합 방지)
+    PRINCIPAL_LOCAL_CACHE_TTL: float = 5.0
+    PRINCIPAL_LOCAL_CACHE_SIZE: int = 10000
+
+    # 요청 단위 샘플링 프로파일러 (비활성화 시 미들웨어 자체를 등록하지 않음)
+    PROFILER_ENABLED: bool = False
+    PROFILER_TOKEN: str = ""  # X-Profile 헤더 값이 일치하면 해당 요청을 프로파일링
+    PROFILER_SAMPLE_RATE: float = 0.0  # 헤더 없이 무작위로 프로파일링할 요청 비율 (0~1)
+    PROFILER_INTERVAL: float = 0.001  # 스택 샘플링 간격(초)
+    PROFILER_DIR: str = "/tmp/profiles"
+    PROFILER_MAX_PROFILES: int = 200  # 보관 개수 초과 시 오래된 것부터 삭제
+
+    # 역할 목록 메모리 캐시 갱신 주기(초)
+    ROLE_REGISTRY_LOAD_ATTEMPTS: int = 5  # 시작 시 역할 목록 로드 시도 횟수 (모두 실패하면 기동 중단)
+    ROLE_REGISTRY_LOAD_RETRY_DELAY: float = 1.0
+    ROLE_REGISTRY_REFRESH_INTERVAL: float = 300.0
+
+    # 사용자 대량 가져오기: 배치 단위로 해싱 → COPY → 병합 (메모리 사용량 상한)
+    USER_IMPORT_BATCH_SIZE: int = 5000
+    USER_IMPORT_ERROR_SAMPLE: int = 100  # 응답에 담을 오류/충돌 예시 최대 개수
+    # API 가져오기 전용 해싱 스레드 수 (로그인/회원가입용 executor와 분리하여 코어 일부만 사용)
+    USER_IMPORT_HASH_WORKERS: int = 1
+    # API 가져오기 요청당 평문 비밀번호 행 상한 (초과 행은 invalid 처리, 0이면 제한 없음)
+    # bcrypt cost 12 기준 스레드 1개당 약 4건/초이므로 200행 ≈ 50초. 대량은 password_hash 또는 CLI 사용
+    USER_IMPORT_MAX_PLAIN_PASSWORDS: int = 200
+
+    # 사용자 내보내기: 서버 사이드 커서에서 한 번에 가져올 행 수
+    USER_EXPORT_CHUNK_SIZE: int = 1000
+
     @property
     def DATABASE_URL(self) -> str:
         return (
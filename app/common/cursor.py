@@ -0,0 +1,25 @@
+import base64
+import json
+from datetime import datetime
+
+from app.common.exception import InvalidCursorException
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """
+    (created_at, id) 정렬 키를 불투명한 cursor 문자열로 인코딩합니다.
+    """
+    raw = json.dumps([created_at.isoformat(), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    cursor 문자열을 (created_at, id)로 디코딩합니다.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(id)
+    except (ValueError, TypeError):
+        raise InvalidCursorException()
@@ -26,4 +26,44 @@ class InvalidEmailOrPasswordException(HTTPException):
 
 class IsActivePermissionException(HTTPException):
     def __init__(self):
-        super().__init__(status_code=status.HTTP_403_FORBIDDEN, detail="is_active는 Admin만 수정할 수 있습니다.")
\ No newline at end of file
+        super().__init__(status_code=status.HTTP_403_FORBIDDEN, detail="is_active는 Admin만 수정할 수 있습니다.")
+
+class PasswordHashingBusyException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "1"},
+        )
+
+class TokenStoreUnavailableException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="토큰 저장소에 연결할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "1"},
+        )
+
+class TooManyRequestsException(HTTPException):
+    def __init__(self, retry_after: str):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="요청 횟수가 너무 많습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": retry_after},
+        )
+
+class RoleNotFoundException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="역할 정보를 확인할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "1"},
+        )
+
+class InvalidCursorException(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 cursor 값입니다.")
+
+class ProfileNotFoundException(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail="존재하지 않는 프로파일입니다.")
@@ -0,0 +1,102 @@
+from pathlib import Path
+from typing import Optional
+
+from jose import jwk
+
+from app.common.config import settings
+from app.common.logger import logger
+
+HMAC_ALGORITHMS = ("HS256", "HS384", "HS512")
+
+
+class SigningKey:
+    def __init__(self, kid: str, algorithm: str, key):
+        self.kid = kid
+        self.algorithm = algorithm
+        self.key = key
+        # 검증은 공개키로 수행 (python-jose는 개인키 객체로 서명을 검증하지 못함)
+        self.public_key = key if key.is_public() else key.public_key()
+
+    @property
+    def can_sign(self) -> bool:
+        return not self.key.is_public()
+
+    def public_jwk(self) -> dict:
+        return {**self.public_key.to_dict(), "kid": self.kid, "use": "sig"}
+
+
+class KeyRing:
+    """
+    JWT 서명 키 목록 (kid 기준)
+    - 비대칭 알고리즘(RS256/ES256 등)이면 keys_dir의 `<kid>.pem` 파일을 모두 읽습니다.
+      서명은 active_kid(미지정 시 파일명 순으로 마지막) 키로만 하고,
+      검증과 JWKS 공개는 디렉토리의 모든 키로 합니다. (공개키만 있는 파일은 검증 전용)
+    - 키 교체: 새 키를 추가해 JWKS에 먼저 공개하고(캐시 max-age 이상 대기) active_kid를 바꾼 뒤,
+      이전 키는 그 키로 발급된 토큰이 모두 만료된 후 삭제합니다.
+    - HMAC 알고리즘이면 기존처럼 JWT_SECRET_KEY 하나로 서명/검증하며 kid를 쓰지 않습니다.
+    """
+
+    def __init__(self, algorithm: str, secret: str, keys_dir: str = "", active_kid: str = "",
+                 accept_legacy_hmac: bool = False):
+        self.algorithm = algorithm
+        self._secret = secret
+        self._keys: dict[str, SigningKey] = {}
+        self._active: Optional[SigningKey] = None
+        # 비대칭 키로 전환하는 동안 kid 없는(HMAC) 토큰을 계속 허용할지 여부
+        self._accept_legacy_hmac = accept_legacy_hmac
+        if self.asymmetric:
+            self._load(Path(keys_dir), active_kid)
+
+    @property
+    def asymmetric(self) -> bool:
+        return self.algorithm not in HMAC_ALGORITHMS
+
+    def _load(self, keys_dir: Path, active_kid: str) -> None:
+        for path in sorted(keys_dir.glob("*.pem")):
+            kid = path.stem
+            self._keys[kid] = SigningKey(kid, self.algorithm, jwk.construct(path.read_bytes(), self.algorithm))
+
+        signers = [key for key in self._keys.values() if key.can_sign]
+        self._active = self._keys.get(active_kid) if active_kid else (signers[-1] if signers else None)
+        if self._active is None or not self._active.can_sign:
+            raise RuntimeError(f"JWT 서명 키가 없습니다: dir={keys_dir}, kid={active_kid or '-'}")
+        logger.info(f"🔑 JWT 서명 키 로드: active={self._active.kid}, keys={list(self._keys)}")
+
+    def signing_args(self) -> tuple:
+        """
+        jwt.encode에 넘길 (key, algorithm, headers)
+        """
+        if not self.asymmetric:
+            return self._secret, self.algorithm, None
+        return self._active.key, self.algorithm, {"kid": self._active.kid}
+
+    def verification_args(self, headers: dict) -> Optional[tuple]:
+        """
+        토큰 헤더의 kid로 검증 키를 찾아 (key, algorithms)를 반환합니다. 알 수 없는 kid면 None
+        - 알고리즘은 키 설정으로 고정하며, 토큰 헤더의 alg는 신뢰하지 않습니다.
+        """
+        kid = headers.get("kid")
+        if kid is None:
+            if not self.asymmetric:
+                return self._secret, [self.algorithm]
+            if self._accept_legacy_hmac:
+                return self._secret, ["HS256"]
+            return None
+
+        key = self._keys.get(kid)
+        if key is None:
+            return None
+        return key.public_key, [key.algorithm]
+
+    def jwks(self) -> dict:
+        return {"keys": [key.public_jwk() for key in self._keys.values()]}
+
+
+# 전역 인스턴스
+key_ring = KeyRing(
+    algorithm=settings.JWT_ALGORITHM,
+    secret=settings.JWT_SECRET_KEY,
+    keys_dir=settings.JWT_KEYS_DIR,
+    active_kid=settings.JWT_ACTIVE_KID,
+    accept_legacy_hmac=settings.JWT_ACCEPT_LEGACY_HMAC,
+)
@@ -1,40 +1,81 @@
 
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta, UTC
 from typing import Optional
 
 from jose import JWTError, jwt
 from app.common.config import settings
+from app.common.jwt_keys import key_ring
+from app.common.local_cache import LocalLRUCache
+from app.common.metrics import observe
 
-# JWT 설정
-SECRET_KEY = settings.JWT_SECRET_KEY
-ALGORITHM = settings.JWT_ALGORITHM
+# JWT 설정 (서명/검증 키는 key_ring에서 관리)
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
 REFRESH_TOKEN_EXPIRE_DAYS = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS
 
+# 토큰 종류 (typ 클레임)
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
+
+# 검증된 토큰의 claims 캐시 (키: 토큰 SHA-256 digest, 항목별 만료: 토큰 exp)
+_verified_tokens = LocalLRUCache(maxsize=max(settings.JWT_VERIFY_CACHE_SIZE, 1), ttl=0)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Access token 생성
     """
     to_encode = data.copy()
     expire = datetime.now(UTC) + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    to_encode.update({"exp": expire, "typ": ACCESS_TOKEN_TYPE})
+    to_encode.setdefault("jti", uuid.uuid4().hex)
+    return _encode(to_encode)
 
 def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Refresh token 생성
+    - jti(토큰 ID)와 fam(로그인 세션 단위의 토큰 계열 ID)은 data로 지정하지 않으면 새로 생성합니다.
     """
     to_encode = data.copy()
     expire = datetime.now(UTC) + (expires_delta or timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    to_encode.update({"exp": expire, "typ": REFRESH_TOKEN_TYPE})
+    to_encode.setdefault("jti", uuid.uuid4().hex)
+    to_encode.setdefault("fam", uuid.uuid4().hex)
+    return _encode(to_encode)
+
+def _encode(claims: dict) -> str:
+    key, algorithm, headers = key_ring.signing_args()
+    return jwt.encode(claims, key, algorithm=algorithm, headers=headers)
 
+@observe("jwt.decode")
 def decode_token(token: str) -> Optional[dict]:
     """
     JWT 토큰을 디코딩하여 payload를 반환합니다.
+    - 한 번 검증된 토큰은 exp까지 프로세스 내 캐시에서 claims를 반환하여 서명 검증을 생략합니다.
     """
+    if settings.JWT_VERIFY_CACHE_SIZE <= 0:
+        return _verify(token)
+
+    digest = hashlib.sha256(token.encode()).digest()
+    payload = _verified_tokens.get(digest)
+    if payload is not None:
+        return dict(payload)
+
+    payload = _verify(token)
+    if payload is not None and "exp" in payload:
+        ttl = payload["exp"] - time.time()
+        if ttl > 0:
+            _verified_tokens.set(digest, payload, ttl=ttl)
+        return dict(payload)
+    return payload
+
+def _verify(token: str) -> Optional[dict]:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        verification = key_ring.verification_args(jwt.get_unverified_header(token))
+        if verification is None:
+            return None
+        key, algorithms = verification
+        return jwt.decode(token, key, algorithms=algorithms)
     except JWTError:
         return None
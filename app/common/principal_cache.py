@@ -0,0 +1,122 @@
+from typing import Optional
+
+from app.common.config import settings
+from app.common.local_cache import LocalLRUCache
+from app.common.redis import redis_cache
+from app.common.redis_utils import safe_redis_get, safe_redis_set, safe_redis_mget, safe_redis_set_many, \
+    safe_redis_publish_invalidation
+from app.domain.auth.auth_schema import Principal
+
+
+# 무효화 표시 값 ({"invalidated": true})
+TOMBSTONE_FIELD = "invalidated"
+
+
+class PrincipalCache:
+    """
+    인증 주체(Principal) 캐시
+    - 1차: 프로세스 내 TTL/LRU 캐시 (짧은 TTL)
+    - 2차: Redis (`principal:{user_id}`)
+    - 사용자 수정/탈퇴 시 invalidate()로 무효화하고, tombstone_ttl 동안 tombstone을 남깁니다.
+      캐시 저장은 키가 없을 때만(SET NX) 하므로, 무효화 직전에 DB에서 읽은 이전 값이
+      무효화 이후에 다시 저장되지 않습니다. (tombstone이 있는 동안은 DB에서 직접 조회)
+    - 다른 워커의 프로세스 내 캐시는 L1 캐시(CACHE_L1_ENABLED) 사용 여부와 무관하게
+      pub/sub 무효화 메시지로 제거하고, 같은 기간 동안 로컬 tombstone을 남깁니다.
+    """
+
+    def __init__(self, redis, local_maxsize: int, local_ttl: float, ttl: int, tombstone_ttl: int):
+        self._redis = redis
+        self._local = LocalLRUCache(maxsize=local_maxsize, ttl=local_ttl)
+        self._tombstones = LocalLRUCache(maxsize=local_maxsize, ttl=tombstone_ttl)
+        self._ttl = ttl
+        self._tombstone_ttl = tombstone_ttl
+        redis.add_invalidation_listener(self._on_invalidate)
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"principal:{user_id}"
+
+    def _on_invalidate(self, key: Optional[str]) -> None:
+        if key is None:
+            # 구독 재연결: 놓친 무효화가 있을 수 있으므로 전체 비움
+            self._local.clear()
+            return
+        prefix, _, user_id = key.partition(":")
+        if prefix == "principal" and user_id.isdigit():
+            # 다른 워커가 무효화 전에 DB에서 읽은 이전 값을 이 워커에 저장하지 않도록 tombstone도 남김
+            self._local.delete(int(user_id))
+            self._tombstones.set(int(user_id), True)
+
+    async def get(self, user_id: int) -> Optional[Principal]:
+        principal = self._local.get(user_id)
+        if principal is not None:
+            return principal
+
+        cached = await safe_redis_get(self._redis, self._key(user_id))
+        if not cached or cached.get(TOMBSTONE_FIELD):
+            return None
+
+        principal = Principal(**cached)
+        self._set_local(principal)
+        return principal
+
+    def _set_local(self, principal: Principal) -> None:
+        # 이 워커에서 방금 무효화한 사용자는 저장하지 않음
+        if self._tombstones.get(principal.id) is None:
+            self._local.set(principal.id, principal)
+
+    async def get_many(self, user_ids: list[int]) -> dict[int, Principal]:
+        found = {}
+        misses = []
+        for user_id in user_ids:
+            principal = self._local.get(user_id)
+            if principal is not None:
+                found[user_id] = principal
+            else:
+                misses.append(user_id)
+
+        if misses:
+            cached = await safe_redis_mget(self._redis, [self._key(user_id) for user_id in misses])
+            for user_id, value in zip(misses, cached):
+                if value and not value.get(TOMBSTONE_FIELD):
+                    principal = Principal(**value)
+                    self._set_local(principal)
+                    found[user_id] = principal
+        return found
+
+    async def set_many(self, principals: list[Principal]) -> None:
+        for principal in principals:
+            self._set_local(principal)
+        await safe_redis_set_many(
+            self._redis, {self._key(principal.id): principal.model_dump() for principal in principals},
+            ex=self._ttl, nx=True,
+        )
+
+    async def set(self, principal: Principal) -> None:
+        self._set_local(principal)
+        await safe_redis_set(self._redis, self._key(principal.id), principal.model_dump(), ex=self._ttl, nx=True)
+
+    async def invalidate(self, user_id: int) -> None:
+        self._local.delete(user_id)
+        self._tombstones.set(user_id, True)
+        # 이전 값을 tombstone으로 덮어쓴 뒤 다른 워커에 무효화 발행
+        # (메시지를 받은 워커가 Redis를 다시 읽어도 이전 값이 아닌 tombstone을 보게 됨)
+        await safe_redis_set(self._redis, self._key(user_id), {TOMBSTONE_FIELD: True}, ex=self._tombstone_ttl)
+        await safe_redis_publish_invalidation(self._redis, self._key(user_id))
+
+    def stats(self) -> dict:
+        return {
+            "local_hits": self._local.hits,
+            "local_misses": self._local.misses,
+            "local_size": len(self._local),
+        }
+
+
+# 전역 인스턴스
+principal_cache = PrincipalCache(
+    redis_cache,
+    local_maxsize=settings.PRINCIPAL_LOCAL_CACHE_SIZE,
+    local_ttl=settings.PRINCIPAL_LOCAL_CACHE_TTL,
+    ttl=settings.PRINCIPAL_CACHE_TTL,
+    tombstone_ttl=settings.PRINCIPAL_TOMBSTONE_TTL,
+)
@@ -0,0 +1,170 @@
+import asyncio
+import os
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from app.common.config import settings
+from app.common.logger import logger
+
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+PROFILE_SUFFIX = ".collapsed"
+PROFILE_ID_PATTERN = re.compile(r"^[0-9A-Za-z_.-]+$")
+
+
+class StackSampler:
+    """
+    통계적(샘플링) 프로파일러
+    - 별도 스레드가 interval마다 대상 스레드(이벤트 루프)의 현재 스택을 읽어 횟수를 셉니다.
+    - 결과는 flamegraph.pl / speedscope에서 읽을 수 있는 collapsed stack 형식입니다.
+    - 이벤트 루프 스레드를 샘플링하므로 같은 시간에 처리 중인 다른 요청의 스택도 섞일 수 있습니다.
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[self._collapse(frame)] += 1
+
+    @staticmethod
+    def _collapse(frame) -> str:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+            frame = frame.f_back
+        return ";".join(reversed(stack))
+
+    def to_collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+class ProfileStore:
+    """
+    프로파일 결과를 로컬 디스크에 보관합니다. (워커 간 공유 디렉터리)
+    """
+
+    def __init__(self, directory: str, max_profiles: int):
+        self.directory = directory
+        self.max_profiles = max_profiles
+
+    def _path(self, profile_id: str) -> Optional[str]:
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        return os.path.join(self.directory, profile_id + PROFILE_SUFFIX)
+
+    def save(self, profile_id: str, content: str) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(profile_id), "w", encoding="utf-8") as f:
+            f.write(content)
+        self._prune()
+
+    def _prune(self) -> None:
+        profiles = self.list()
+        for profile in profiles[self.max_profiles:]:
+            try:
+                os.remove(self._path(profile["id"]))
+            except FileNotFoundError:
+                pass
+
+    def list(self) -> list[dict]:
+        """
+        최신순 프로파일 목록
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(PROFILE_SUFFIX):
+                stat = entry.stat()
+                profiles.append({
+                    "id": entry.name[:-len(PROFILE_SUFFIX)],
+                    "created_at": stat.st_mtime,
+                    "size": stat.st_size,
+                })
+        return sorted(profiles, key=lambda profile: profile["created_at"], reverse=True)
+
+    def load(self, profile_id: str) -> Optional[str]:
+        path = self._path(profile_id)
+        if path is None or not os.path.isfile(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+
+class ProfilerMiddleware:
+    """
+    요청 단위 샘플링 프로파일러 미들웨어 (ASGI)
+    - X-Profile 헤더가 PROFILER_TOKEN과 일치하거나, PROFILER_SAMPLE_RATE 확률에 걸린 요청만 프로파일링합니다.
+    - 워커당 동시에 하나의 요청만 프로파일링하여 오버헤드를 제한합니다.
+    - 응답에 X-Profile-Id 헤더로 결과 ID를 붙이며, 결과는 /ops/profiles/{id}에서 조회합니다.
+    - PROFILER_ENABLED=false이면 main에서 등록하지 않으므로 오버헤드가 없습니다.
+    """
+
+    def __init__(self, app, store: Optional[ProfileStore] = None):
+        self.app = app
+        self.store = store or profile_store
+        self._busy = False
+
+    def _should_profile(self, scope) -> bool:
+        if self._busy:
+            return False
+        if settings.PROFILER_TOKEN:
+            for name, value in scope.get("headers", []):
+                if name == PROFILE_HEADER.encode():
+                    # 헤더는 임의의 바이트일 수 있으므로 bytes로 비교 (str 비교는 비 ASCII 값에서 TypeError)
+                    return secrets.compare_digest(value, settings.PROFILER_TOKEN.encode())
+        return settings.PROFILER_SAMPLE_RATE > 0 and random.random() < settings.PROFILER_SAMPLE_RATE
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        path = re.sub(r"[^0-9A-Za-z_.-]", "", scope["path"].strip("/").replace("/", "_"))[:60] or "root"
+        profile_id = f"{int(time.time() * 1000)}-{scope['method']}-{path}-{secrets.token_hex(4)}"
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (PROFILE_ID_HEADER, profile_id.encode())]
+            await send(message)
+
+        self._busy = True
+        sampler = StackSampler(threading.get_ident(), settings.PROFILER_INTERVAL)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            self._busy = False
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            try:
+                await asyncio.to_thread(self.store.save, profile_id, sampler.to_collapsed())
+                logger.info(f"🔬 프로파일 저장: {profile_id} ({elapsed_ms:.1f}ms, {sum(sampler.samples.values())} samples)")
+            except Exception as e:
+                logger.warning(f"❌ 프로파일 저장 실패: {e}")
+
+
+# 전역 인스턴스
+profile_store = ProfileStore(settings.PROFILER_DIR, settings.PROFILER_MAX_PROFILES)
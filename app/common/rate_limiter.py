@@ -0,0 +1,108 @@
+import ipaddress
+import math
+import time
+import uuid
+
+from app.common.config import settings
+from app.common.local_cache import LocalLRUCache
+from app.common.logger import logger
+from app.common.metrics import observe
+from app.common.redis import redis_cache
+
+
+class RateLimiter:
+    """
+    슬라이딩 윈도우 요청 제한 (키: IP, 이메일 등)
+    - 1차: 워커별 토큰 버킷(용량 limit, window 동안 limit개 충전)으로 먼저 거절하여
+      공격 트래픽 대부분은 Redis까지 가지 않습니다.
+    - 2차: Redis sorted set 슬라이딩 윈도우(Lua 스크립트)로 워커 간 합산 횟수를 원자적으로 확인합니다.
+      여러 키를 스크립트 한 번(왕복 1회)으로 확인하며, 모든 키가 허용될 때만 기록합니다.
+    - Redis 장애 시에는 로컬 토큰 버킷만으로 제한합니다. (fail-open)
+    """
+
+    def __init__(self, redis, window: float, local_maxsize: int):
+        self._redis = redis
+        self._window = window
+        # 마지막 사용 후 window가 지나면 버킷이 가득 찬 것과 같으므로 항목을 만료시킴
+        self._buckets = LocalLRUCache(maxsize=local_maxsize, ttl=window)
+
+    def _take_local(self, key: str, limit: int, now: float) -> float:
+        """
+        로컬 토큰 버킷에서 토큰 하나를 꺼냅니다. 부족하면 다음 토큰까지 남은 시간(초)을 반환
+        """
+        rate = limit / self._window
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = [float(limit), now]
+        tokens = min(limit, bucket[0] + (now - bucket[1]) * rate)
+        if tokens < 1:
+            return (1 - tokens) / rate
+
+        bucket[0], bucket[1] = tokens - 1, now
+        self._buckets.set(key, bucket)
+        return 0.0
+
+    @observe("ratelimit.check")
+    async def hit(self, limits: list[tuple[str, int]]) -> float:
+        """
+        요청 1회를 기록하고, 제한을 넘었으면 재시도까지 대기할 시간(초)을 반환합니다. (허용 시 0)
+        """
+        now = time.monotonic()
+        retry_after = max(self._take_local(key, limit, now) for key, limit in limits)
+        if retry_after > 0:
+            return retry_after
+
+        try:
+            retry_after_ms = await self._redis.sliding_window_hit(
+                [key for key, _ in limits],
+                [limit for _, limit in limits],
+                window_ms=int(self._window * 1000),
+                member=uuid.uuid4().hex,
+            )
+        except Exception as e:
+            logger.warning(f"❌ Redis 요청 제한 확인 실패: {e}")
+            return 0.0
+        return retry_after_ms / 1000
+
+
+def parse_networks(value: str) -> list:
+    return [ipaddress.ip_network(item.strip(), strict=False) for item in value.split(",") if item.strip()]
+
+
+def _is_trusted(address: str, trusted: list) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in trusted)
+
+
+def resolve_client_ip(peer: str | None, headers, trusted: list) -> str:
+    """
+    요청 제한 키로 쓸 클라이언트 IP
+    - 연결 주소가 신뢰하는 프록시일 때만 X-Forwarded-For를 오른쪽부터 읽어
+      신뢰하지 않는 첫 주소를 사용합니다. (클라이언트가 앞부분을 위조해도 무시됨)
+    - X-Forwarded-For가 없으면 X-Real-IP, 그것도 없으면 연결 주소를 사용합니다.
+    """
+    if not peer or not _is_trusted(peer, trusted):
+        return peer or "-"
+
+    forwarded = [item.strip() for item in headers.get("x-forwarded-for", "").split(",") if item.strip()]
+    for address in reversed(forwarded):
+        if not _is_trusted(address, trusted):
+            return address
+    if forwarded:
+        return forwarded[0]
+    return headers.get("x-real-ip") or peer
+
+
+def retry_after_header(seconds: float) -> str:
+    return str(max(1, math.ceil(seconds)))
+
+
+# 전역 인스턴스
+rate_limiter = RateLimiter(
+    redis_cache,
+    window=settings.RATE_LIMIT_WINDOW,
+    local_maxsize=settings.RATE_LIMIT_LOCAL_MAXSIZE,
+)
@@ -1,37 +1,311 @@
 import redis.asyncio as redis
-import json
+import asyncio
+from typing import Callable, Optional
 
 from app.common.config import settings
+from app.common.local_cache import LocalLRUCache
+from app.common.logger import logger
+from app.common.serializer import VersionedCodec
 
 # 환경변수에서 Redis 호스트/포트 로드
 REDIS_HOST = settings.REDIS_HOST
 REDIS_PORT = settings.REDIS_PORT
 
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+# 슬라이딩 윈도우 요청 제한: 모든 키가 limit 미만일 때만 기록하고, 초과 시 재시도까지 남은 ms 반환
+SLIDING_WINDOW_SCRIPT = """
+local now = redis.call("TIME")
+now = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local window = tonumber(ARGV[1])
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    redis.call("ZREMRANGEBYSCORE", key, "-inf", now - window)
+    if redis.call("ZCARD", key) >= tonumber(ARGV[i + 2]) then
+        local oldest = redis.call("ZRANGE", key, 0, 0, "WITHSCORES")
+        retry_after = math.max(retry_after, tonumber(oldest[2]) + window - now)
+    end
+end
+if retry_after > 0 then
+    return retry_after
+end
+for _, key in ipairs(KEYS) do
+    redis.call("ZADD", key, now, ARGV[2])
+    redis.call("PEXPIRE", key, window)
+end
+return 0
+"""
+
 class RedisCache:
-    def __init__(self):
+    """
+    Redis 캐시 클라이언트
+    - 프로세스 내 캐시를 두는 모듈은 add_invalidation_listener()로 등록하고,
+      publish_invalidation()으로 발행한 키 무효화를 listen_invalidations()로 모든 워커에서 받습니다.
+    """
+
+    def __init__(self, serializer: str = settings.CACHE_SERIALIZER, channel: str = settings.CACHE_INVALIDATION_CHANNEL):
+        # 값은 형식 태그가 붙은 바이너리로 저장하므로 응답을 문자열로 디코딩하지 않음
         self._redis = redis.from_url(
             f"redis://{REDIS_HOST}:{REDIS_PORT}",
-            encoding="utf-8",
-            decode_responses=True
+            decode_responses=False
         )
+        self._codec = VersionedCodec(serializer)
+        self._channel = channel
+        self._listeners: list[Callable[[Optional[str]], None]] = []
+        # EVALSHA로 호출 (스크립트 본문은 최초 1회만 전송)
+        self._sliding_window = self._redis.register_script(SLIDING_WINDOW_SCRIPT)
+
+    def _encode(self, value):
+        return value if isinstance(value, str) else self._codec.encode(value)
 
     async def get(self, key: str):
         return await self._redis.get(key)
 
-    async def set(self, key: str, value, ex: int = 300):
-        val = value if isinstance(value, str) else json.dumps(value)
-        await self._redis.set(key, val, ex=ex)
+    async def set(self, key: str, value, ex: int = 300, nx: bool = False) -> bool:
+        # nx=True: 키가 없을 때만 저장 (저장 여부 반환)
+        return bool(await self._redis.set(key, self._encode(value), ex=ex, nx=nx))
 
     async def delete(self, key: str):
         await self._redis.delete(key)
 
-    async def delete_pattern(self, pattern: str):
-        async for key in self._redis.scan_iter(match=pattern):
-            await self._redis.delete(key)
+    async def getdel(self, key: str):
+        return await self._redis.getdel(key)
+
+    async def set_many_raw(self, mapping: dict[str, str], ex: int):
+        # 문자열 값을 직렬화 없이 파이프라인 한 번으로 저장
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=ex)
+            await pipe.execute()
+
+    async def exists(self, key: str) -> bool:
+        return bool(await self._redis.exists(key))
+
+    async def set_and_log(self, key: str, value: str, ex: int, log_key: str, member: str) -> str:
+        # 값 저장과 변경 로그(stream) 기록을 한 트랜잭션으로 수행
+        # 로그 id는 Redis 서버가 단조 증가하도록 부여하므로 워커 간 시계 차이와 무관하게 순서가 보장됨
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(key, value, ex=ex)
+            pipe.xadd(log_key, {"member": member})
+            _, entry_id = await pipe.execute()
+        return entry_id.decode() if isinstance(entry_id, bytes) else entry_id
+
+    async def read_log(self, log_key: str, after_id: Optional[str] = None) -> list[tuple[str, str]]:
+        # after_id 이후(해당 id 제외)의 로그를 (id, member) 순서대로 조회
+        entries = await self._redis.xrange(log_key, min=f"({after_id}" if after_id else "-")
+        return [
+            (entry_id.decode() if isinstance(entry_id, bytes) else entry_id,
+             fields[b"member"].decode() if b"member" in fields else fields["member"])
+            for entry_id, fields in entries
+        ]
+
+    async def trim_log(self, log_key: str, before_ms: int) -> None:
+        # stream id의 앞부분은 서버 시각(ms)이므로 그 이전 로그를 정리
+        await self._redis.xtrim(log_key, minid=str(before_ms), approximate=False)
+
+    async def incr(self, key: str) -> int:
+        return await self._redis.incr(key)
+
+    async def acquire_lock(self, key: str, token: str, ttl_ms: int) -> bool:
+        return bool(await self._redis.set(key, token, nx=True, px=ttl_ms))
+
+    async def release_lock(self, key: str, token: str) -> None:
+        # 자신이 잡은 락일 때만 해제 (만료 후 다른 워커가 잡은 락은 건드리지 않음)
+        await self._redis.eval(RELEASE_LOCK_SCRIPT, 1, key, token)
+
+    async def sliding_window_hit(self, keys: list[str], limits: list[int], window_ms: int, member: str) -> int:
+        return await self._sliding_window(keys=keys, args=[window_ms, member, *limits])
+
+    async def get_json(self, key: str):
+        return self._codec.decode(await self.get(key))
+
+    async def get_json_with_ttl(self, key: str) -> tuple:
+        # 값과 남은 TTL(ms)을 파이프라인 한 번(왕복 1회)으로 조회
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.pttl(key)
+            data, ttl_ms = await pipe.execute()
+        return self._codec.decode(data), ttl_ms
+
+    async def mget_json(self, keys: list[str]) -> list:
+        values = await self._redis.mget(keys)
+        return [self._codec.decode(data) for data in values]
+
+    async def set_many(self, mapping: dict, ex: int = 300, nx: bool = False) -> list[bool]:
+        # 여러 키를 파이프라인 한 번(왕복 1회)으로 저장
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, self._encode(value), ex=ex, nx=nx)
+            return [bool(result) for result in await pipe.execute()]
+
+    async def publish_invalidation(self, key: str) -> None:
+        await self._redis.publish(self._channel, key)
+
+    def add_invalidation_listener(self, listener: Callable[[Optional[str]], None]) -> None:
+        """
+        다른 워커에서 발행한 키 무효화를 함께 받아야 하는 프로세스 내 캐시를 등록합니다.
+        (None은 놓친 메시지가 있을 수 있으니 전체를 비우라는 의미)
+        """
+        self._listeners.append(listener)
+
+    def _invalidate_local(self, key: Optional[str]) -> None:
+        for listener in self._listeners:
+            listener(key)
+
+    async def listen_invalidations(self) -> None:
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    # 구독이 끊겼다 다시 연결되면 놓친 메시지가 있을 수 있으므로 전체 무효화
+                    self._invalidate_local(None)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._invalidate_local(message["data"].decode())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"❌ 캐시 무효화 구독 실패, 재연결 대기: {e}")
+                await asyncio.sleep(1)
+
+    def stats(self) -> dict:
+        return {"l1_enabled": False, "serializer": settings.CACHE_SERIALIZER}
+
+
+class TieredCache(RedisCache):
+    """
+    2단 캐시: 프로세스 내 LRU(L1) + Redis(L2)
+    - l1_prefixes로 시작하는 키만 L1에 보관합니다. (예: `user:`)
+    - delete 시 Redis pub/sub으로 무효화 메시지를 발행하고,
+      각 워커는 listen_invalidations()로 받아 자신의 L1에서 제거합니다.
+    - 구독이 끊겼다 다시 연결되면 놓친 메시지가 있을 수 있으므로 L1 전체를 비웁니다.
+    - 무효화마다 증가하는 순번을 키별로 기록하고, Redis 조회/저장 중에 해당 키가 무효화되었으면
+      L1에 넣지 않습니다. (무효화 이전에 읽은 값이 L1 TTL 동안 남는 것을 방지)
+    """
+
+    def __init__(self, maxsize: int, ttl: float, prefixes: tuple[str, ...], channel: str):
+        super().__init__(channel=channel)
+        self._l1 = LocalLRUCache(maxsize=maxsize, ttl=ttl)
+        self._prefixes = prefixes
+        # 무효화 순번: 키별 마지막 무효화 순번, 전체 비움 순번
+        self._invalidation_seq = 0
+        self._invalidated_at = LocalLRUCache(maxsize=maxsize, ttl=ttl)
+        self._cleared_at = 0
+
+    def _l1_enabled(self, key: str) -> bool:
+        return key.startswith(self._prefixes)
+
+    def _record_invalidation(self, key: Optional[str]) -> None:
+        self._invalidation_seq += 1
+        if key is None:
+            self._l1.clear()
+            self._cleared_at = self._invalidation_seq
+        else:
+            self._l1.delete(key)
+            self._invalidated_at.set(key, self._invalidation_seq)
+
+    def _invalidated_since(self, key: str, seq: int) -> bool:
+        # 순번 기록이 LRU에서 밀려났을 수 있을 만큼 무효화가 많았으면 무효화된 것으로 간주
+        return (
+            self._cleared_at > seq
+            or self._invalidation_seq - seq >= self._invalidated_at.maxsize
+            or (self._invalidated_at.get(key) or 0) > seq
+        )
+
+    def _populate_l1(self, key: str, value, seq: int, ttl: Optional[float] = None) -> None:
+        if self._l1_enabled(key) and not self._invalidated_since(key, seq):
+            self._l1.set(key, value, ttl=ttl)
 
     async def get_json(self, key: str):
-        data = await self.get(key)
-        return json.loads(data) if data else None
+        if not self._l1_enabled(key):
+            return await super().get_json(key)
+
+        value = self._l1.get(key)
+        if value is not None:
+            return value
+
+        seq = self._invalidation_seq
+        value = await super().get_json(key)
+        if value is not None:
+            self._populate_l1(key, value, seq)
+        return value
+
+    async def get_json_with_ttl(self, key: str) -> tuple:
+        if not self._l1_enabled(key):
+            return await super().get_json_with_ttl(key)
+
+        # L1 히트는 Redis를 조회하지 않으므로 TTL을 알 수 없음(-1)
+        value = self._l1.get(key)
+        if value is not None:
+            return value, -1
+
+        seq = self._invalidation_seq
+        value, ttl_ms = await super().get_json_with_ttl(key)
+        if value is not None:
+            self._populate_l1(key, value, seq)
+        return value, ttl_ms
+
+    async def set(self, key: str, value, ex: int = 300, nx: bool = False) -> bool:
+        seq = self._invalidation_seq
+        written = await super().set(key, value, ex=ex, nx=nx)
+        if written and not isinstance(value, str):
+            self._populate_l1(key, value, seq, ttl=min(ex, self._l1.ttl))
+        return written
+
+    async def mget_json(self, keys: list[str]) -> list:
+        values = [self._l1.get(key) if self._l1_enabled(key) else None for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing:
+            seq = self._invalidation_seq
+            fetched = await super().mget_json([keys[i] for i in missing])
+            for i, value in zip(missing, fetched):
+                values[i] = value
+                if value is not None:
+                    self._populate_l1(keys[i], value, seq)
+        return values
+
+    async def set_many(self, mapping: dict, ex: int = 300, nx: bool = False) -> list[bool]:
+        seq = self._invalidation_seq
+        written = await super().set_many(mapping, ex=ex, nx=nx)
+        for (key, value), ok in zip(mapping.items(), written):
+            if ok and not isinstance(value, str):
+                self._populate_l1(key, value, seq, ttl=min(ex, self._l1.ttl))
+        return written
+
+    async def delete(self, key: str):
+        # 삭제가 반영되기 전에 시작된 조회도 L1에 넣지 않도록 삭제 전후로 기록
+        self._record_invalidation(key)
+        await super().delete(key)
+        self._record_invalidation(key)
+        await self.publish_invalidation(key)
+
+    def _invalidate_local(self, key: Optional[str]) -> None:
+        self._record_invalidation(key)
+        super()._invalidate_local(key)
+
+    def stats(self) -> dict:
+        return {
+            "l1_enabled": True,
+            "serializer": settings.CACHE_SERIALIZER,
+            "l1_hits": self._l1.hits,
+            "l1_misses": self._l1.misses,
+            "l1_size": len(self._l1),
+            "l1_maxsize": self._l1.maxsize,
+        }
+
 
 # 전역 인스턴스
-redis_cache = RedisCache()
+if settings.CACHE_L1_ENABLED:
+    redis_cache = TieredCache(
+        maxsize=settings.CACHE_L1_MAXSIZE,
+        ttl=settings.CACHE_L1_TTL,
+        prefixes=tuple(p.strip() for p in settings.CACHE_L1_PREFIXES.split(",") if p.strip()),
+        channel=settings.CACHE_INVALIDATION_CHANNEL,
+    )
+else:
+    redis_cache = RedisCache()
@@ -1,5 +1,7 @@
 from app.common.logger import logger
+from app.common.metrics import observe
 
+@observe("redis.get")
 async def safe_redis_get(redis, key: str):
     try:
         value = await redis.get_json(key)
@@ -10,13 +12,47 @@ async def safe_redis_get(redis, key: str):
         logger.warning(f"❌ Redis 캐시 GET 실패: {e}")
         return None
 
-async def safe_redis_set(redis, key: str, value, ex: int = 300):
+@observe("redis.get")
+async def safe_redis_get_with_ttl(redis, key: str) -> tuple:
+    """
+    값과 남은 TTL(ms)을 함께 조회합니다. 실패하면 (None, -2)
+    """
     try:
-        await redis.set(key, value, ex=ex)
+        value, ttl_ms = await redis.get_json_with_ttl(key)
+        if value:
+            logger.info(f"✅ Redis 캐시 HIT: {key}")
+        return value, ttl_ms
+    except Exception as e:
+        logger.warning(f"❌ Redis 캐시 GET 실패: {e}")
+        return None, -2
+
+@observe("redis.set")
+async def safe_redis_set(redis, key: str, value, ex: int = 300, nx: bool = False):
+    try:
+        await redis.set(key, value, ex=ex, nx=nx)
         logger.info(f"✅ Redis 캐시 SET 완료: {key}")
     except Exception as e:
         logger.warning(f"❌ Redis 캐시 SET 실패: {e}")
 
+@observe("redis.mget")
+async def safe_redis_mget(redis, keys: list[str]) -> list:
+    try:
+        values = await redis.mget_json(keys)
+        logger.info(f"✅ Redis 캐시 MGET: {sum(v is not None for v in values)}/{len(keys)} HIT")
+        return values
+    except Exception as e:
+        logger.warning(f"❌ Redis 캐시 MGET 실패: {e}")
+        return [None] * len(keys)
+
+@observe("redis.set_many")
+async def safe_redis_set_many(redis, mapping: dict, ex: int = 300, nx: bool = False):
+    try:
+        await redis.set_many(mapping, ex=ex, nx=nx)
+        logger.info(f"✅ Redis 캐시 다건 SET 완료: {len(mapping)}건")
+    except Exception as e:
+        logger.warning(f"❌ Redis 캐시 다건 SET 실패: {e}")
+
+@observe("redis.delete")
 async def safe_redis_delete(redis, key: str):
     try:
         await redis.delete(key)
@@ -24,9 +60,30 @@ async def safe_redis_delete(redis, key: str):
     except Exception as e:
         logger.warning(f"❌ Redis 캐시 삭제 실패: {e}")
 
-async def safe_redis_delete_pattern(redis, pattern: str):
+@observe("redis.publish_invalidation")
+async def safe_redis_publish_invalidation(redis, key: str):
+    try:
+        await redis.publish_invalidation(key)
+        logger.info(f"♻️ 캐시 무효화 발행 완료: {key}")
+    except Exception as e:
+        logger.warning(f"❌ 캐시 무효화 발행 실패: {e}")
+
+@observe("redis.get_version")
+async def safe_redis_get_version(redis, key: str) -> int:
+    """
+    캐시 네임스페이스의 세대(generation) 번호를 조회합니다. 없거나 실패하면 0
+    """
+    try:
+        value = await redis.get(key)
+        return int(value) if value else 0
+    except Exception as e:
+        logger.warning(f"❌ Redis 캐시 버전 조회 실패: {e}")
+        return 0
+
+@observe("redis.incr")
+async def safe_redis_incr(redis, key: str):
     try:
-        await redis.delete_pattern(pattern)
-        logger.info(f"♻️ Redis 캐시 패턴 삭제 완료: {pattern}")
+        version = await redis.incr(key)
+        logger.info(f"♻️ Redis 캐시 네임스페이스 갱신: {key}={version}")
     except Exception as e:
-        logger.warning(f"❌ Redis 캐시 패턴 삭제 실패: {e}")
+        logger.warning(f"❌ Redis 캐시 네임스페이스 갱신 실패: {e}")
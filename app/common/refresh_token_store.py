@@ -0,0 +1,58 @@
+from typing import Optional
+
+from app.common.config import settings
+from app.common.exception import TokenStoreUnavailableException
+from app.common.logger import logger
+from app.common.redis import redis_cache
+
+
+class RefreshTokenStore:
+    """
+    Refresh token 회전(rotation) 상태 저장소 (Redis)
+    - `refresh:{jti}` → fam: 아직 사용되지 않은(유효한) refresh token
+    - `refresh_family:{fam}` → jti: 토큰 계열별 현재 유효한 refresh token
+    - 사용 시 GETDEL로 원자적으로 소비하므로 같은 토큰은 한 번만 회전할 수 있고,
+      이미 소비된 토큰이 다시 오면 재사용(탈취)으로 보고 계열 전체를 폐기합니다.
+    - 소비/폐기 중 Redis 오류는 재사용 여부를 판단할 수 없으므로 503으로 응답합니다. (fail-closed)
+    """
+
+    def __init__(self, redis, ttl: int):
+        self._redis = redis
+        self._ttl = ttl
+
+    async def save(self, jti: str, family: str) -> None:
+        try:
+            await self._redis.set_many_raw(
+                {f"refresh:{jti}": family, f"refresh_family:{family}": jti}, ex=self._ttl
+            )
+        except Exception as e:
+            # 저장 실패 시 해당 refresh token은 사용할 수 없으며, 다시 로그인해야 함
+            logger.warning(f"❌ Refresh token 저장 실패: {e}")
+
+    async def consume(self, jti: str) -> Optional[str]:
+        """
+        토큰을 소비하고 계열 ID를 반환합니다. 이미 사용되었거나 없으면 None
+        """
+        try:
+            family = await self._redis.getdel(f"refresh:{jti}")
+        except Exception as e:
+            logger.warning(f"❌ Refresh token 소비 실패: {e}")
+            raise TokenStoreUnavailableException()
+        if isinstance(family, bytes):
+            family = family.decode()
+        return family
+
+    async def revoke_family(self, family: str) -> None:
+        try:
+            jti = await self._redis.getdel(f"refresh_family:{family}")
+            if jti:
+                await self._redis.delete(f"refresh:{jti.decode() if isinstance(jti, bytes) else jti}")
+        except Exception as e:
+            logger.warning(f"❌ Refresh token 계열 폐기 실패: {e}")
+            raise TokenStoreUnavailableException()
+
+
+# 전역 인스턴스
+refresh_token_store = RefreshTokenStore(
+    redis_cache, ttl=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+)
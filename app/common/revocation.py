@@ -0,0 +1,106 @@
+import asyncio
+import time
+from typing import Optional
+
+from app.common.bloom_filter import BloomFilter
+from app.common.config import settings
+from app.common.exception import TokenStoreUnavailableException
+from app.common.logger import logger
+from app.common.redis import redis_cache
+
+REVOKED_LOG_KEY = "revoked:log"
+
+
+class RevocationList:
+    """
+    토큰 폐기 목록 (jti 기준)
+    - Redis: `revoked:{jti}` (토큰 만료 시각까지 TTL)가 원본이고,
+      `revoked:log` stream으로 변경 내역을 남깁니다. (id는 Redis 서버가 부여하므로 워커 시계와 무관하게 순서가 보장됨)
+    - 워커마다 Bloom filter를 두고 sync()로 변경 내역을 증분 반영합니다.
+      대부분의 토큰은 Bloom filter에 없으므로 네트워크 I/O 없이 통과하고,
+      Bloom filter에 걸린 경우에만 Redis로 확인합니다. (오탐 제거)
+    - 다른 워커에서 폐기한 토큰은 sync 주기(REVOCATION_SYNC_INTERVAL) 안에 반영됩니다.
+    """
+
+    def __init__(self, redis, capacity: int, error_rate: float, max_token_lifetime: int):
+        self._redis = redis
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._max_token_lifetime = max_token_lifetime
+        self._bloom = BloomFilter(capacity, error_rate)
+        # 마지막으로 반영한 로그 id. 다음 동기화는 이 id 이후만 조회
+        self._last_id: Optional[str] = None
+
+    @staticmethod
+    def _key(jti: str) -> str:
+        return f"revoked:{jti}"
+
+    async def revoke(self, jti: str, exp: float) -> None:
+        ttl = int(exp - time.time()) + 1
+        if ttl <= 0:
+            return
+        try:
+            await self._redis.set_and_log(self._key(jti), "1", ex=ttl, log_key=REVOKED_LOG_KEY, member=jti)
+        except Exception as e:
+            logger.warning(f"❌ 토큰 폐기 실패: {e}")
+            raise TokenStoreUnavailableException()
+        self._bloom.add(jti)
+
+    async def is_revoked(self, jti: Optional[str]) -> bool:
+        if not jti or jti not in self._bloom:
+            return False
+        try:
+            return await self._redis.exists(self._key(jti))
+        except Exception as e:
+            # Bloom filter에 걸렸는데 확인할 수 없으면 폐기된 것으로 간주 (fail-closed)
+            logger.warning(f"❌ 토큰 폐기 여부 확인 실패: {e}")
+            return True
+
+    async def sync(self) -> None:
+        """
+        마지막으로 반영한 로그 id 이후의 폐기 내역을 Bloom filter에 추가합니다.
+        """
+        entries = await self._redis.read_log(REVOKED_LOG_KEY, self._last_id)
+        self._apply(entries, self._bloom)
+
+    def _apply(self, entries: list[tuple[str, str]], bloom: BloomFilter) -> None:
+        for entry_id, jti in entries:
+            bloom.add(jti)
+            self._last_id = entry_id
+
+    async def rebuild(self) -> None:
+        """
+        만료된 내역을 정리하고 Bloom filter를 새로 만듭니다.
+        """
+        await self._redis.trim_log(REVOKED_LOG_KEY, int((time.time() - self._max_token_lifetime) * 1000))
+        entries = await self._redis.read_log(REVOKED_LOG_KEY)
+        bloom = BloomFilter(max(self._capacity, len(entries) * 2), self._error_rate)
+        self._last_id = None
+        self._apply(entries, bloom)
+        self._bloom = bloom
+        logger.info(f"♻️ 토큰 폐기 목록 재구성: {len(entries)}건")
+
+    async def run_sync(self, interval: float, rebuild_interval: float) -> None:
+        next_rebuild = 0.0
+        while True:
+            try:
+                # 예정된 시각이 되었거나, 항목 수가 현재 Bloom filter 용량을 넘어 오탐률이 올라간 경우 재구성
+                if time.monotonic() >= next_rebuild or self._bloom.count > self._bloom.capacity:
+                    await self.rebuild()
+                    next_rebuild = time.monotonic() + rebuild_interval
+                else:
+                    await self.sync()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"❌ 토큰 폐기 목록 동기화 실패: {e}")
+            await asyncio.sleep(interval)
+
+
+# 전역 인스턴스
+revocation_list = RevocationList(
+    redis_cache,
+    capacity=settings.REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.REVOCATION_BLOOM_ERROR_RATE,
+    max_token_lifetime=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
+)
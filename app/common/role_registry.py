@@ -0,0 +1,96 @@
+import asyncio
+import time
+from typing import Optional
+
+from sqlalchemy import text
+
+from app.common.config import settings
+from app.common.exception import RoleNotFoundException
+from app.common.logger import logger
+from app.common.single_flight import SingleFlight
+from app.db.session import async_session_factory
+
+
+class RoleRegistry:
+    """
+    역할(roles) 테이블의 프로세스 내 사본
+    - 앱 시작 시 load()로 전체를 읽어 role_id ↔ 이름을 메모리에서 조회합니다.
+    - refresh_interval마다 다시 읽고, 모르는 역할을 만나면 즉시 다시 읽습니다.
+      (미스로 인한 재조회는 min_reload_interval 간격으로 제한)
+    - 다시 읽어도 없는 역할은 None 대신 RoleNotFoundException(503)으로 실패합니다.
+    - 역할 이름은 인증/사용자 조회 응답에 필수이므로 시작 시 로드에 실패하면 기동하지 않습니다.
+      (이후 갱신 실패 시에는 마지막으로 읽은 목록을 계속 사용)
+    """
+
+    def __init__(self, session_factory, refresh_interval: float, min_reload_interval: float = 1.0):
+        self._session_factory = session_factory
+        self.refresh_interval = refresh_interval
+        self.min_reload_interval = min_reload_interval
+        self._names: dict[int, str] = {}
+        self._ids: dict[str, int] = {}
+        self._loaded_at = 0.0
+        self._single_flight = SingleFlight()
+
+    def set_roles(self, roles: dict[int, str]) -> None:
+        self._names = dict(roles)
+        self._ids = {name: role_id for role_id, name in roles.items()}
+        self._loaded_at = time.monotonic()
+
+    async def load(self) -> None:
+        async def _load():
+            async with self._session_factory() as session:
+                result = await session.execute(text("SELECT id, name FROM roles"))
+                self.set_roles({role_id: name for role_id, name in result.all()})
+            logger.info(f"✅ 역할 목록 로드 완료: {len(self._names)}건")
+
+        await self._single_flight.do("roles", _load)
+
+    async def load_on_startup(self, attempts: int, delay: float) -> None:
+        for attempt in range(1, attempts + 1):
+            try:
+                await self.load()
+                return
+            except Exception as e:
+                if attempt == attempts:
+                    logger.error(f"❌ 역할 목록 로드 실패, 기동 중단: {e}")
+                    raise
+                logger.warning(f"❌ 역할 목록 로드 실패, 재시도 {attempt}/{attempts}: {e}")
+                await asyncio.sleep(delay)
+
+    async def _reload_on_miss(self) -> None:
+        if time.monotonic() - self._loaded_at < self.min_reload_interval:
+            return
+        await self.load()
+
+    def name_of(self, role_id: int) -> Optional[str]:
+        return self._names.get(role_id)
+
+    async def get_name(self, role_id: int) -> str:
+        if role_id not in self._names:
+            await self._reload_on_miss()
+        if role_id not in self._names:
+            logger.error(f"❌ 알 수 없는 역할 ID: {role_id}")
+            raise RoleNotFoundException()
+        return self._names[role_id]
+
+    async def get_id(self, name: str) -> int:
+        # RoleEnum은 str Enum이므로 값으로 조회
+        name = getattr(name, "value", name)
+        if name not in self._ids:
+            await self._reload_on_miss()
+        if name not in self._ids:
+            logger.error(f"❌ 알 수 없는 역할 이름: {name}")
+            raise RoleNotFoundException()
+        return self._ids[name]
+
+    async def run_periodic_refresh(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.load()
+            except Exception as e:
+                logger.warning(f"❌ 역할 목록 갱신 실패: {e}")
+
+
+# 전역 인스턴스
+role_registry = RoleRegistry(async_session_factory, refresh_interval=settings.ROLE_REGISTRY_REFRESH_INTERVAL)
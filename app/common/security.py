@@ -1,16 +1,180 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
 from passlib.context import CryptContext
 
-# bcrypt 해시 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.common.config import settings
+from app.common.exception import PasswordHashingBusyException
+from app.common.metrics import observe
+
+try:
+    import argon2  # noqa: F401 (passlib argon2 backend)
+    HAS_ARGON2 = True
+except ImportError:
+    HAS_ARGON2 = False
+
+
+def build_password_context(scheme: str, bcrypt_rounds: int, argon2_time_cost: int, argon2_memory_cost: int,
+                           argon2_parallelism: int) -> CryptContext:
+    """
+    비밀번호 해시 설정
+    - scheme으로 새 해시를 만들고, 다른 방식의 기존 해시도 검증합니다.
+    - 방식이나 비용이 설정과 다른 해시는 needs_update 대상입니다. (deprecated="auto")
+    """
+    if scheme == "argon2" and not HAS_ARGON2:
+        raise RuntimeError("PASSWORD_HASH_SCHEME=argon2를 사용하려면 argon2-cffi 패키지가 필요합니다.")
+    schemes = [scheme] + [other for other in ("argon2", "bcrypt") if other != scheme and (other != "argon2" or HAS_ARGON2)]
+    return CryptContext(
+        schemes=schemes,
+        default=scheme,
+        deprecated="auto",
+        bcrypt__rounds=bcrypt_rounds,
+        argon2__type="ID",
+        argon2__rounds=argon2_time_cost,
+        argon2__memory_cost=argon2_memory_cost,
+        argon2__parallelism=argon2_parallelism,
+    )
 
+
+# 비밀번호 해시 설정
+pwd_context = build_password_context(
+    settings.PASSWORD_HASH_SCHEME,
+    bcrypt_rounds=settings.BCRYPT_ROUNDS,
+    argon2_time_cost=settings.ARGON2_TIME_COST,
+    argon2_memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2_parallelism=settings.ARGON2_PARALLELISM,
+)
+
+@observe("bcrypt.hash")
 def hash_password(password: str) -> str:
     """
     비밀번호를 bcrypt로 해싱합니다.
     """
     return pwd_context.hash(password)
 
+def hash_passwords(passwords: list[str]) -> list[str]:
+    """
+    여러 비밀번호를 순서대로 해싱합니다. (executor 작업 단위)
+    """
+    return [pwd_context.hash(password) for password in passwords]
+
+def is_password_hash(value: str) -> bool:
+    """
+    이미 해싱된 비밀번호(bcrypt 등 pwd_context가 지원하는 형식)인지 확인합니다.
+    """
+    return pwd_context.identify(value) is not None
+
+@observe("bcrypt.verify")
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     평문 비밀번호와 해시된 비밀번호가 일치하는지 검증합니다.
     """
     return pwd_context.verify(plain_password, hashed_password)
+
+@observe("bcrypt.verify")
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """
+    비밀번호를 검증하고, 저장된 해시의 방식/비용이 현재 설정과 다르면 새 해시를 함께 반환합니다.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+# hash_many가 executor에 한 번에 제출하는 최대 해싱 개수
+HASH_MANY_CHUNK_SIZE = 32
+
+
+class PasswordHasher:
+    """
+    bcrypt 해싱/검증을 이벤트 루프 밖의 executor에서 실행합니다.
+    - executor_type: "thread" 또는 "process"
+    - max_pending: 실행 + 대기 중인 작업 상한. 초과 시 즉시 503을 반환합니다.
+    """
+
+    def __init__(self, executor_type: str = "thread", max_workers: int = 0, max_pending: int = 64):
+        self.executor_type = executor_type
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self._pending = 0
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hasher"
+                )
+        return self._executor
+
+    async def _run(self, fn, *args):
+        if self._pending >= self.max_pending:
+            raise PasswordHashingBusyException()
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        return await self._run(verify_and_update_password, plain_password, hashed_password)
+
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        """
+        대량 가져오기용 병렬 해싱
+        - max_pending으로 거절하지 않고 완료를 기다리므로 로그인/회원가입과 같은 executor에서 쓰면 안 됩니다.
+          (import_password_hasher 또는 CLI 전용 hasher 사용)
+        - 작은 단위(HASH_MANY_CHUNK_SIZE)로 나눠 제출하여 종료 시 대기 중인 작업을 바로 취소할 수 있습니다.
+        """
+        if not passwords:
+            return []
+        loop = asyncio.get_running_loop()
+        size = min(-(-len(passwords) // self.max_workers), HASH_MANY_CHUNK_SIZE)
+        chunks = [passwords[i:i + size] for i in range(0, len(passwords), size)]
+        results = await asyncio.gather(
+            *(loop.run_in_executor(self._get_executor(), hash_passwords, chunk) for chunk in chunks)
+        )
+        return [hashed for chunk in results for hashed in chunk]
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 전역 인스턴스
+password_hasher = PasswordHasher(
+    executor_type=settings.PASSWORD_HASH_EXECUTOR,
+    max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+# API 대량 가져오기 전용 (대량 해싱이 로그인/회원가입 검증 대기열을 막지 않도록 분리)
+import_password_hasher = PasswordHasher(executor_type="thread", max_workers=settings.USER_IMPORT_HASH_WORKERS)
+
+async def hash_password_async(password: str) -> str:
+    """
+    이벤트 루프를 막지 않고 비밀번호를 해싱합니다.
+    """
+    return await password_hasher.hash(password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    이벤트 루프를 막지 않고 비밀번호를 검증합니다.
+    """
+    return await password_hasher.verify(plain_password, hashed_password)
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """
+    이벤트 루프를 막지 않고 비밀번호를 검증하며, 필요하면 새 해시를 함께 반환합니다.
+    """
+    return await password_hasher.verify_and_update(plain_password, hashed_password)
@@ -0,0 +1,98 @@
+import json
+from typing import Any
+
+import orjson
+
+try:
+    import msgpack
+except ImportError:  # msgpack은 선택 의존성
+    msgpack = None
+
+
+class CacheSerializer:
+    """
+    Redis 캐시 값 직렬화기
+    - 저장 값 앞에 1바이트 형식 태그를 붙여, 읽을 때 태그로 형식을 판별합니다.
+    - 태그 없는 값(이전 버전이 저장한 JSON 문자열)도 읽을 수 있으므로
+      배포 중 형식이 섞여 있어도 안전하게 전환됩니다.
+    """
+    tag: bytes = b""
+
+    def dumps(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+class JsonSerializer(CacheSerializer):
+    tag = b"\x01"
+
+    def dumps(self, value: Any) -> bytes:
+        return self.tag + json.dumps(value).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer(CacheSerializer):
+    tag = b"\x02"
+
+    def dumps(self, value: Any) -> bytes:
+        return self.tag + orjson.dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackSerializer(CacheSerializer):
+    tag = b"\x03"
+
+    def __init__(self):
+        if msgpack is None:
+            raise RuntimeError("CACHE_SERIALIZER=msgpack 사용 시 msgpack 패키지가 필요합니다.")
+
+    def dumps(self, value: Any) -> bytes:
+        return self.tag + msgpack.packb(value)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data)
+
+
+SERIALIZERS = {
+    "json": JsonSerializer,
+    "orjson": OrjsonSerializer,
+    "msgpack": MsgpackSerializer,
+}
+
+
+class VersionedCodec:
+    """
+    쓰기는 설정된 직렬화기 하나로, 읽기는 태그에 맞는 직렬화기로 수행합니다.
+    """
+
+    def __init__(self, name: str):
+        self.writer: CacheSerializer = SERIALIZERS[name]()
+        self._readers: dict[int, CacheSerializer] = {self.writer.tag[0]: self.writer}
+
+    def _reader(self, tag: int) -> CacheSerializer | None:
+        reader = self._readers.get(tag)
+        if reader is None:
+            serializer_cls = next((cls for cls in SERIALIZERS.values() if cls.tag[0] == tag), None)
+            if serializer_cls is not None:
+                reader = self._readers[tag] = serializer_cls()
+        return reader
+
+    def encode(self, value: Any) -> bytes:
+        return self.writer.dumps(value)
+
+    def decode(self, data: bytes | str | None) -> Any:
+        if not data:
+            return None
+        if isinstance(data, str):
+            return orjson.loads(data)
+        reader = self._reader(data[0])
+        if reader is None:
+            # 태그 없는 이전 형식(JSON 텍스트)
+            return orjson.loads(data)
+        return reader.loads(data[1:])
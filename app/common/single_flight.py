@@ -0,0 +1,45 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class _LeaderCancelled(Exception):
+    """leader가 취소되었음을 대기자에게 알리는 내부 신호 (대기자는 직접 다시 로드합니다)"""
+
+
+class SingleFlight:
+    """
+    같은 키에 대한 동시 호출을 하나의 실행으로 합칩니다. (워커 내)
+    - 먼저 들어온 호출(leader)만 fn을 실행하고, 나머지는 그 결과나 예외를 함께 받습니다.
+    - leader 요청이 취소되면 대기자에게 CancelledError를 넘기지 않고, 대기자 중 하나가 새 leader가 되어 다시 실행합니다.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        while (future := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없을 때 'exception was never retrieved' 경고 방지
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
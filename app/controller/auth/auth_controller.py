@@ -1,6 +1,10 @@
 from fastapi import APIRouter, Depends
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.domain.auth.auth_schema import SignupRequest, SigninRequest, TokenResponse
+from app.domain.auth.auth_schema import SignupRequest, SigninRequest, TokenResponse, RefreshRequest, \
+    SignoutRequest, Principal, IntrospectRequest, IntrospectResponse
+from app.controller.auth.auth_deps import get_current_user, security, introspection_client_required, \
+    rate_limited
 from app.db.session import get_db_session
 from app.repository.persistence.auth_repository_impl import AuthRepositoryImpl
 from app.service.auth_service import AuthService
@@ -8,7 +12,7 @@ from app.service.auth_service import AuthService
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
-@router.post("/signup", status_code=201)
+@router.post("/signup", status_code=201, dependencies=[Depends(rate_limited("signup"))])
 async def signup(
     data: SignupRequest,
     db: AsyncSession = Depends(get_db_session),
@@ -18,6 +22,7 @@ async def signup(
 
     - 이메일, 비밀번호, 이름을 입력받아 신규 사용자를 등록합니다.
     - 이메일 중복 시 409 Conflict 예외를 반환합니다.
+    - IP/이메일별 요청 횟수를 넘으면 429 Too Many Requests(Retry-After)를 반환합니다.
     - 가입 후 토큰은 발급하지 않으며, `/signin`을 통해 로그인해야 합니다.
 
     📥 Request Body:
@@ -35,7 +40,7 @@ async def signup(
     return {"message": "회원가입이 완료되었습니다."}
 
 
-@router.post("/signin", response_model=TokenResponse)
+@router.post("/signin", response_model=TokenResponse, dependencies=[Depends(rate_limited("signin"))])
 async def signin(
     data: SigninRequest,
     db: AsyncSession = Depends(get_db_session),
@@ -45,6 +50,7 @@ async def signin(
 
     - 이메일/비밀번호를 기반으로 로그인 후 JWT 토큰을 발급합니다.
     - 비밀번호 불일치 또는 존재하지 않는 이메일일 경우 401 Unauthorized 반환합니다.
+    - IP/이메일별 요청 횟수를 넘으면 비밀번호 검증 전에 429 Too Many Requests(Retry-After)를 반환합니다.
 
     📥 Request Body:
     - email: 사용자 이메일
@@ -60,3 +66,91 @@ async def signin(
     repo = AuthRepositoryImpl(db)
     service = AuthService(repo)
     return await service.signin(data)
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(
+    data: RefreshRequest,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    🔄 토큰 재발급 API
+
+    - refresh token으로 새 access token / refresh token 쌍을 발급합니다. (비밀번호 검증 없음)
+    - 사용한 refresh token은 즉시 폐기되며(rotation), 응답의 새 refresh token을 사용해야 합니다.
+    - 이미 사용된 refresh token이 다시 오면 탈취로 간주하여 같은 로그인 세션의 토큰을 모두 폐기하고 401을 반환합니다.
+
+    📥 Request Body:
+    - refresh_token: 로그인 또는 이전 재발급 시 받은 refresh token
+
+    ⚙️ 내부 처리:
+    - Redis `refresh:{jti}` GETDEL로 원자적으로 소비
+    - 사용자 활성 여부는 principal 캐시로 확인
+
+    📤 Response:
+    - 200 OK
+    - {
+        "access_token": "...",
+        "refresh_token": "..."
+      }
+    """
+    repo = AuthRepositoryImpl(db)
+    service = AuthService(repo)
+    return await service.refresh(data.refresh_token)
+
+
+@router.post("/signout")
+async def signout(
+    data: SignoutRequest | None = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    🚪 로그아웃 API
+
+    - 현재 access token을 즉시 폐기합니다. (만료 전이라도 이후 요청은 401)
+    - refresh token을 함께 보내면 같은 로그인 세션의 refresh token도 폐기합니다.
+
+    📥 Request Body (선택):
+    - refresh_token: 로그인 또는 재발급 시 받은 refresh token
+
+    ⚙️ 내부 처리:
+    - Redis `revoked:{jti}`(토큰 만료까지 TTL)에 기록하고, 각 워커는 Bloom filter로 동기화
+    - 다른 워커에는 REVOCATION_SYNC_INTERVAL(기본 1초) 이내에 반영
+
+    📤 Response:
+    - 200 OK
+    - {"message": "로그아웃되었습니다."}
+    """
+    repo = AuthRepositoryImpl(db)
+    service = AuthService(repo)
+    await service.signout(credentials.credentials, data.refresh_token if data else None)
+    return {"message": "로그아웃되었습니다."}
+
+
+@router.post("/introspect", response_model=IntrospectResponse)
+async def introspect(
+    data: IntrospectRequest,
+    _: None = Depends(introspection_client_required),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    🔎 토큰 일괄 검증 API (게이트웨이용)
+
+    - 여러 access token의 유효 여부와 사용자 정보를 한 번의 요청으로 확인합니다. (최대 1000건)
+    - `X-Introspection-Token` 헤더(INTROSPECTION_TOKEN) 또는 Admin 토큰으로만 호출할 수 있습니다.
+
+    📥 Request Body:
+    - tokens: 검증할 access token 목록
+
+    ⚙️ 내부 처리:
+    - 서명/만료 검증(검증 캐시) → 폐기 목록(Bloom filter) → 사용자 활성 여부
+    - 사용자 정보는 principal 캐시 MGET 후 미스만 단일 쿼리로 DB 조회
+
+    📤 Response:
+    - results: 토큰별 {active, sub, role, exp} (요청 순서 유지, 유효하지 않으면 {"active": false})
+    """
+    repo = AuthRepositoryImpl(db)
+    service = AuthService(repo)
+    return IntrospectResponse(results=await service.introspect(data.tokens))
@@ -1,44 +1,86 @@
-from fastapi import Depends
+import hmac
+
+from fastapi import Depends, Header, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.common.exception import AccessDeniedException, UserNotFoundException, InvalidTokenException, \
-    AdminPermissionRequiredException
-from app.common.jwt_utils import decode_token
+from app.common.config import settings
+from app.common.exception import AccessDeniedException, InvalidTokenException, AdminPermissionRequiredException, \
+    TooManyRequestsException
+from app.common.jwt_utils import decode_token, REFRESH_TOKEN_TYPE
+from app.common.metrics import observe
+from app.common.rate_limiter import rate_limiter, retry_after_header, resolve_client_ip, parse_networks
+from app.common.revocation import revocation_list
 from app.db.session import get_db_session
-from app.db.models.user_model import User
-from sqlalchemy import select
+from app.domain.auth.auth_schema import Principal
+from app.repository.persistence.auth_repository_impl import AuthRepositoryImpl
+from app.service.auth_service import AuthService
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+trusted_proxies = parse_networks(settings.TRUSTED_PROXIES)
 
+@observe("auth.get_current_user")
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db_session),
-) -> User:
+) -> Principal:
     token = credentials.credentials
     payload = decode_token(token)
-    if payload is None or "sub" not in payload:
+    # refresh token으로는 API를 호출할 수 없음 (typ 없는 이전 토큰은 access token으로 취급)
+    if payload is None or "sub" not in payload or payload.get("typ") == REFRESH_TOKEN_TYPE:
+        raise InvalidTokenException()
+    # 로그아웃 등으로 폐기된 토큰 (대부분 Bloom filter에서 I/O 없이 통과)
+    if await revocation_list.is_revoked(payload.get("jti")):
         raise InvalidTokenException()
 
-    user_id = int(payload["sub"])
-    result = await db.execute(
-        select(User).options(selectinload(User.role)).where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
-
-    if not user or not user.is_active:
-        raise UserNotFoundException()
-
-    return user
+    service = AuthService(AuthRepositoryImpl(db))
+    return await service.get_principal(int(payload["sub"]))
 
-def admin_required(current_user: User = Depends(get_current_user)) -> User:
-    if current_user.role.name != "Admin":
+def admin_required(current_user: Principal = Depends(get_current_user)) -> Principal:
+    if current_user.role_name != "Admin":
         raise AdminPermissionRequiredException()
     return current_user
 
-def self_or_admin_required(user_id: int, current_user: User = Depends(get_current_user)) -> User:
-    role_name = getattr(current_user.role, "name", None)
-    if role_name != "Admin" and current_user.id != user_id:
+def self_or_admin_required(user_id: int, current_user: Principal = Depends(get_current_user)) -> Principal:
+    if current_user.role_name != "Admin" and current_user.id != user_id:
         raise AccessDeniedException()
-    return current_user
\ No newline at end of file
+    return current_user
+
+async def introspection_client_required(
+    x_introspection_token: str | None = Header(default=None),
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security),
+    db: AsyncSession = Depends(get_db_session),
+) -> None:
+    # 게이트웨이는 X-Introspection-Token으로, 그 외에는 Admin 토큰으로만 호출 가능
+    if settings.INTROSPECTION_TOKEN and x_introspection_token \
+            and hmac.compare_digest(x_introspection_token.encode(), settings.INTROSPECTION_TOKEN.encode()):
+        return
+    if credentials is None:
+        raise InvalidTokenException()
+    admin_required(await get_current_user(credentials, db))
+
+def rate_limited(scope: str):
+    """
+    IP별, 본문의 이메일별 요청 횟수를 제한하는 의존성 (비밀번호 해싱/검증 전에 실행)
+    """
+    async def dependency(request: Request) -> None:
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+
+        # nginx 뒤에서는 연결 주소가 모두 nginx이므로 신뢰하는 프록시가 전달한 클라이언트 IP를 사용
+        client_ip = resolve_client_ip(request.client.host if request.client else None, request.headers, trusted_proxies)
+        limits = [(f"rl:{scope}:ip:{client_ip}", settings.RATE_LIMIT_IP_LIMIT)]
+        try:
+            # 본문은 Request에 캐싱되므로 이후 요청 모델 파싱에서 다시 읽지 않음
+            email = (await request.json()).get("email")
+        except Exception:
+            email = None
+        if isinstance(email, str):
+            limits.append((f"rl:{scope}:email:{email.strip().lower()}", settings.RATE_LIMIT_EMAIL_LIMIT))
+
+        retry_after = await rate_limiter.hit(limits)
+        if retry_after > 0:
+            raise TooManyRequestsException(retry_after_header(retry_after))
+
+    return dependency
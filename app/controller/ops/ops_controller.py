@@ -0,0 +1,81 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from app.common.exception import ProfileNotFoundException
+from app.common.principal_cache import principal_cache
+from app.common.profiler import profile_store
+from app.common.redis import redis_cache
+from app.controller.auth.auth_deps import admin_required
+from app.db.session import engine
+from app.domain.auth.auth_schema import Principal
+
+router = APIRouter(prefix="/ops", tags=["Ops"])
+
+
+@router.get("/cache")
+async def get_cache_stats(
+    current_user: Principal = Depends(admin_required),
+):
+    """
+    📈 캐시 통계 조회 API
+
+    - 현재 워커의 L1(프로세스 내) 캐시와 인증 주체 캐시의 hit/miss 카운터를 반환합니다.
+    - Admin만 접근 가능합니다.
+
+    📤 Response:
+    - {"cache": {...}, "principal": {...}}
+    """
+    return {
+        "cache": redis_cache.stats(),
+        "principal": principal_cache.stats(),
+    }
+
+
+@router.get("/db-pool")
+async def get_db_pool_stats(
+    current_user: Principal = Depends(admin_required),
+):
+    """
+    🗄️ DB 커넥션 풀 통계 조회 API
+
+    - 현재 워커의 커넥션 풀 사용량과 체크아웃 대기 시간을 반환합니다.
+    - Admin만 접근 가능합니다.
+
+    📤 Response:
+    - pool_size / max_overflow / checked_out / overflow / peak_in_use
+    - checkouts / overflow_checkouts / timeouts / wait_avg_ms / wait_max_ms
+    """
+    return engine.pool.stats()
+
+
+@router.get("/profiles")
+async def get_profiles(
+    current_user: Principal = Depends(admin_required),
+):
+    """
+    🔬 요청 프로파일 목록 조회 API
+
+    - 샘플링 프로파일러가 저장한 요청별 프로파일 목록을 최신순으로 반환합니다.
+    - Admin만 접근 가능합니다.
+
+    📤 Response:
+    - {"profiles": [{"id", "created_at", "size"}, ...]}
+    """
+    return {"profiles": profile_store.list()}
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(
+    profile_id: str,
+    current_user: Principal = Depends(admin_required),
+):
+    """
+    🔬 요청 프로파일 조회 API
+
+    - 프로파일을 collapsed stack 형식(`frame;frame;... count`)으로 반환합니다.
+    - flamegraph.pl 또는 speedscope(https://www.speedscope.app)에 그대로 넣어 볼 수 있습니다.
+    - Admin만 접근 가능합니다.
+    """
+    content = profile_store.load(profile_id)
+    if content is None:
+        raise ProfileNotFoundException()
+    return content
@@ -1,19 +1,121 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse, ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.session import get_db_session
+from app.db.session import get_db_session, async_session_factory
 from app.controller.auth.auth_deps import self_or_admin_required, admin_required
-from app.db.models.user_model import User
-from app.domain.user.user_schema import UserUpdateRequest, UserQueryParams, UserListResponse
+from app.domain.auth.auth_schema import Principal
+from app.domain.user.user_enum import UserFileFormat
+from app.domain.user.user_schema import UserUpdateRequest, UserQueryParams, UserListResponse, \
+    UserBatchRequest, UserBatchResponse, UserImportResult
+from app.repository.persistence.user_import_repository_impl import UserImportRepositoryImpl
 from app.repository.persistence.user_repository_impl import UserRepositoryImpl
+from app.service.user_import_service import UserImportService
 from app.service.user_service import UserService
 
-router = APIRouter(prefix="/users", tags=["Users"])
+router = APIRouter(prefix="/users", tags=["Users"], default_response_class=ORJSONResponse)
+
+
+@router.post("/batch", response_model=UserBatchResponse)
+async def get_users_by_ids(
+    data: UserBatchRequest,
+    current_user: Principal = Depends(admin_required),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    👥 사용자 다건 조회 API
+
+    - 여러 사용자 ID를 한 번의 요청으로 조회합니다. (최대 1000건)
+    - Admin만 접근 가능합니다.
+
+    📥 Request Body:
+    - ids: 조회할 사용자 ID 목록
+
+    ⚙️ 내부 처리:
+    - Redis MGET으로 `user:{user_id}` 캐시 일괄 조회
+    - 캐시 미스만 `WHERE id = ANY(...)` 단일 쿼리로 DB 조회
+    - 조회 결과를 파이프라인으로 일괄 캐싱
+
+    📤 Response:
+    - users: 조회된 사용자 목록 (요청 순서 유지)
+    - missing: 존재하지 않는 사용자 ID 목록
+    """
+    repo = UserRepositoryImpl(db)
+    service = UserService(repo)
+    result = await service.get_users_by_ids(data.ids)
+    return ORJSONResponse(result.model_dump())
+
+
+@router.post("/import", response_model=UserImportResult)
+async def import_users(
+    request: Request,
+    format: UserFileFormat = UserFileFormat.CSV,
+    current_user: Principal = Depends(admin_required),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    📦 사용자 대량 가져오기 API
+
+    - CSV 또는 NDJSON 본문을 스트리밍으로 읽어 사용자를 일괄 생성합니다.
+    - Admin만 접근 가능합니다.
+
+    📥 Request:
+    - format: csv | ndjson (기본값 csv)
+    - Body: 행마다 email, password 또는 password_hash(bcrypt), name
+      (CSV는 첫 줄이 헤더)
+
+    ⚙️ 내부 처리:
+    - USER_IMPORT_BATCH_SIZE 단위로 평문 비밀번호 병렬 해싱
+    - asyncpg COPY로 임시 테이블 적재 후 `ON CONFLICT (email) DO NOTHING`으로 병합
+    - 모든 사용자는 Member 역할로 생성
+
+    📤 Response:
+    - inserted / conflicts / invalid 건수와 충돌·오류 예시
+    """
+    repo = UserImportRepositoryImpl(db)
+    service = UserImportService(repo)
+    return await service.import_users(request.stream(), format)
+
+
+@router.get("/export")
+async def export_users(
+    format: UserFileFormat = UserFileFormat.NDJSON,
+    current_user: Principal = Depends(admin_required),
+):
+    """
+    📤 사용자 내보내기 API
+
+    - 전체 사용자를 NDJSON 또는 CSV로 스트리밍합니다.
+    - Admin만 접근 가능합니다.
+
+    📥 Query Parameters:
+    - format: ndjson | csv (기본값 ndjson)
+
+    ⚙️ 내부 처리:
+    - 서버 사이드 커서(`AsyncSession.stream`)로 USER_EXPORT_CHUNK_SIZE 행씩 조회 (role JOIN)
+    - 조회한 청크를 바로 응답으로 내보내 테이블 크기와 관계없이 메모리 사용량 일정
+    - 응답 전송이 끝날 때까지 세션을 유지해야 하므로, 의존성 대신 스트림 안에서 세션을 엽니다.
+
+    📤 Response:
+    - id, email, name, role, is_active, created_at
+    """
+    async def stream():
+        async with async_session_factory() as session:
+            service = UserService(UserRepositoryImpl(session))
+            async for chunk in service.export_users(format):
+                yield chunk
+
+    media_type = "text/csv" if format == UserFileFormat.CSV else "application/x-ndjson"
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="users.{format.value}"'},
+    )
 
 
 @router.get("/{user_id}")
 async def get_user(
     user_id: int,
-    current_user: User = Depends(self_or_admin_required),
+    current_user: Principal = Depends(self_or_admin_required),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -42,7 +144,7 @@ async def get_user(
 async def update_user(
     user_id: int,
     update: UserUpdateRequest,
-    current_user: User = Depends(self_or_admin_required),
+    current_user: Principal = Depends(self_or_admin_required),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -61,7 +163,7 @@ async def update_user(
     - is_active: 활성 상태 여부 (Admin만 가능)
 
     ⚙️ 내부 처리:
-    - 수정 후 Redis 캐시 무효화 (`user:{user_id}`, `users:*`)
+    - 수정 후 Redis 캐시 무효화 (`user:{user_id}`, `principal:{user_id}`, `users:gen` 증가)
 
     📤 Response:
     - 수정된 사용자 정보 반환
@@ -74,13 +176,13 @@ async def update_user(
         "email": updated.email,
         "name": updated.name,
         "is_active": updated.is_active,
-        "role": updated.role.name,
+        "role": await service.get_role_name(updated),
     }
 
 @router.delete("/{user_id}")
 async def delete_user(
     user_id: int,
-    current_user: User = Depends(self_or_admin_required),
+    current_user: Principal = Depends(self_or_admin_required),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -95,8 +197,8 @@ async def delete_user(
 
     ⚙️ 내부 처리:
     - `deleted_at` 및 `is_active` 처리
-    - Redis 캐시 무효화 (`user:{user_id}`, `users:*`)
-    - MQ 비동기 이벤트 발행 (`publish_user_deleted` → RabbitMQ)
+    - Redis 캐시 무효화 (`user:{user_id}`, `principal:{user_id}`, `users:gen` 증가)
+    - 탈퇴 이벤트를 같은 트랜잭션으로 outbox 테이블에 저장 (outbox relay가 RabbitMQ로 발행)
 
     📤 Response:
     - {"message": "사용자 {user_id} 탈퇴 처리 완료"}
@@ -110,7 +212,7 @@ async def delete_user(
 @router.get("", response_model=UserListResponse)
 async def get_users(
     params: UserQueryParams = Depends(),
-    current_user: User = Depends(admin_required),
+    current_user: Principal = Depends(admin_required),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -125,14 +227,20 @@ async def get_users(
     📥 Query Params:
     - page: 페이지 번호
     - size: 페이지 크기
+    - cursor: 이전 응답의 `next_cursor` (지정 시 page 대신 keyset 페이징)
+    - include_total: total 계산 여부 (기본 true)
+    - total_mode: exact | cached | estimated (미지정 시 서버 설정값)
 
     ⚙️ 내부 처리:
-    - Query 파라미터 기준 Redis 캐시 사용 (`users:{md5_hash}`)
+    - Query 파라미터 기준 Redis 캐시 사용 (`users:v{generation}:{md5_hash}`)
     - 미존재 시 DB 조회 후 캐싱
+    - cursor 모드는 `(created_at, id)` 기준으로 탐색하므로 깊은 페이지도 일정한 속도로 조회됩니다.
 
     📤 Response:
-    - 사용자 리스트 + total count 포함 (`UserListResponse`)
+    - 사용자 리스트 + total count + next_cursor 포함 (`UserListResponse`)
     """
     repo = UserRepositoryImpl(db)
     service = UserService(repo)
-    return await service.get_users(params)
+    result = await service.get_users(params)
+    # 서비스에서 이미 검증된 모델이므로 FastAPI의 재검증/jsonable_encoder를 거치지 않고 바로 직렬화
+    return ORJSONResponse(result.model_dump())
@@ -0,0 +1,28 @@
+from datetime import datetime
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class OutboxEvent(Base):
+    """
+    트랜잭션 아웃박스 테이블 (outbox_events)
+    - 도메인 변경과 같은 트랜잭션에서 발행할 이벤트를 저장합니다.
+    - outbox relay가 배치로 읽어 RabbitMQ로 발행한 뒤 삭제합니다.
+    """
+    __tablename__ = "outbox_events"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, comment="PK: 이벤트 ID")
+    exchange: Mapped[str] = mapped_column(
+        String(100), nullable=False, comment="발행 대상 exchange"
+    )
+    routing_key: Mapped[str] = mapped_column(
+        String(100), nullable=False, comment="발행 routing key"
+    )
+    payload: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, comment="이벤트 본문 (JSON)"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False, comment="생성 시각"
+    )
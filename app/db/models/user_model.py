@@ -34,6 +34,7 @@ class User(Base, TimestampMixin):
         Index("idx_users_role_id", "role_id"),
         Index("idx_users_is_active", "is_active"),
         Index("idx_users_created_at", "created_at"),
+        Index("idx_users_created_at_id", "created_at", "id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, comment="PK: 사용자 ID")
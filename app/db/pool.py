@@ -0,0 +1,61 @@
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.common.metrics import STAGE_LATENCY
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    커넥션 체크아웃 대기 시간과 사용량을 기록하는 커넥션 풀
+    - 체크아웃 대기 시간은 `db.pool.checkout` 단계 히스토그램(/metrics)에도 기록합니다.
+    - 통계는 워커(프로세스)별 값입니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._checkout_latency = STAGE_LATENCY.labels("db.pool.checkout")
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.peak_in_use = 0
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self._checkout_latency.observe(elapsed)
+            self.wait_total += elapsed
+            self.wait_max = max(self.wait_max, elapsed)
+
+        self.checkouts += 1
+        in_use = self.checkedout()
+        self.peak_in_use = max(self.peak_in_use, in_use)
+        if in_use > self.size():
+            # pool_size를 넘어 overflow 커넥션을 사용 중
+            self.overflow_checkouts += 1
+        return connection
+
+    def stats(self) -> dict:
+        return {
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "timeout": self._timeout,
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": self.overflow(),
+            "peak_in_use": self.peak_in_use,
+            "checkouts": self.checkouts,
+            "overflow_checkouts": self.overflow_checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 3),
+        }
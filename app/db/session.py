@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.engine import URL
 from app.common.config import settings
+from app.db.pool import InstrumentedQueuePool
 
 # PostgreSQL 연결 URL 구성
 DATABASE_URL = URL.create(
@@ -12,11 +13,18 @@ DATABASE_URL = URL.create(
     database=settings.DB_NAME,
 )
 
-# Async 엔진 생성
+# Async 엔진 생성 (커넥션 풀 설정은 Settings의 DB_POOL_* 값 사용)
 engine = create_async_engine(
     DATABASE_URL,
     echo=settings.DB_ECHO,
-    pool_pre_ping=True,
+    poolclass=InstrumentedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args={"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE},
     future=True,
 )
 
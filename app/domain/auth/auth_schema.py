@@ -1,4 +1,5 @@
-from pydantic import BaseModel, EmailStr
+from typing import List
+from pydantic import BaseModel, EmailStr, Field
 
 class SignupRequest(BaseModel):
     email: EmailStr
@@ -9,7 +10,37 @@ class SigninRequest(BaseModel):
     email: EmailStr
     password: str
 
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+class SignoutRequest(BaseModel):
+    refresh_token: str | None = None
+
 class TokenResponse(BaseModel):
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
+
+class Principal(BaseModel):
+    """
+    인증된 요청의 주체 정보
+    - get_current_user가 반환하며, 권한 검사에 필요한 최소 정보만 담습니다.
+    """
+    id: int
+    role_name: str
+    is_active: bool
+
+class IntrospectRequest(BaseModel):
+    tokens: List[str] = Field(..., min_length=1, max_length=1000)
+
+class TokenIntrospection(BaseModel):
+    """
+    토큰 검증 결과 (RFC 7662 형식). 유효하지 않은 토큰은 active=False만 반환합니다.
+    """
+    active: bool
+    sub: str | None = None
+    role: str | None = None
+    exp: int | None = None
+
+class IntrospectResponse(BaseModel):
+    results: List[TokenIntrospection]  # 요청 순서 유지
@@ -3,3 +3,14 @@ from enum import Enum
 class RoleEnum(str, Enum):
     ADMIN = "Admin"
     MEMBER = "Member"
+
+
+class UserCountMode(str, Enum):
+    EXACT = "exact"          # 매 요청 count(*)
+    CACHED = "cached"        # count(*) 결과를 별도 TTL로 캐싱
+    ESTIMATED = "estimated"  # pg_class.reltuples 통계 기반 추정치
+
+
+class UserFileFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field, model_validator
 from typing import Optional, List
+from app.domain.user.user_enum import UserCountMode
 
 class UserUpdateRequest(BaseModel):
     email: Optional[EmailStr] = None
@@ -9,6 +10,9 @@ class UserUpdateRequest(BaseModel):
 class UserQueryParams(BaseModel):
     page: int = 1
     size: int = 10
+    cursor: Optional[str] = None  # 지정 시 page 대신 (created_at, id) 기준 keyset 페이징
+    include_total: bool = True
+    total_mode: Optional[UserCountMode] = None  # 미지정 시 USER_COUNT_MODE 설정값
 
 class UserListItem(BaseModel):
     id: int
@@ -18,7 +22,44 @@ class UserListItem(BaseModel):
     is_active: bool
 
 class UserListResponse(BaseModel):
-    total: int
+    total: Optional[int] = None  # include_total=false이면 null
     page: int
     size: int
     users: List[UserListItem]
+    next_cursor: Optional[str] = None
+
+class UserDetail(BaseModel):
+    id: int
+    email: str
+    name: Optional[str] = None
+    role: str
+
+class UserBatchRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=1000)
+
+class UserBatchResponse(BaseModel):
+    users: List[UserDetail]
+    missing: List[int]  # 존재하지 않는 사용자 ID
+
+class UserImportRow(BaseModel):
+    """
+    대량 가져오기 한 행
+    - password(평문) 또는 password_hash(bcrypt 해시) 중 하나가 필요합니다.
+    """
+    email: EmailStr
+    password: Optional[str] = None
+    password_hash: Optional[str] = None
+    name: Optional[str] = Field(default=None, max_length=100)
+
+    @model_validator(mode="after")
+    def check_password(self):
+        if not self.password and not self.password_hash:
+            raise ValueError("password 또는 password_hash가 필요합니다.")
+        return self
+
+class UserImportResult(BaseModel):
+    inserted: int = 0
+    conflicts: int = 0  # 이미 존재하거나 파일 내 중복된 이메일 수
+    invalid: int = 0    # 형식 오류로 건너뛴 행 수
+    conflict_emails: List[str] = []  # 충돌 이메일 예시 (최대 USER_IMPORT_ERROR_SAMPLE건)
+    errors: List[str] = []           # 오류 행 예시 (최대 USER_IMPORT_ERROR_SAMPLE건)
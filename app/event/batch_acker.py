@@ -0,0 +1,91 @@
+import asyncio
+from collections import deque
+
+from aio_pika.abc import AbstractIncomingMessage
+
+from app.common.logger import logger
+
+
+class BatchAcker:
+    """
+    처리가 끝난 메시지를 모아 `basic.ack(multiple=True)` 한 번으로 확인합니다.
+    - 동시 처리로 완료 순서가 뒤섞이므로, 앞선 delivery tag가 모두 끝난 연속 구간까지만 ack 합니다.
+    - batch_size만큼 모이거나 flush_interval이 지나면 ack를 보냅니다.
+      (batch_size는 prefetch_count보다 작게 설정해야 대기 없이 흘러갑니다)
+    - 채널이 다시 연결되면 reset()으로 이전 채널의 delivery tag를 모두 버립니다.
+      (이전 채널의 미확인 메시지는 브로커가 재전달하며, 새 채널의 tag는 1부터 다시 시작)
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._order: deque[int] = deque()
+        self._messages: dict[int, AbstractIncomingMessage] = {}
+        self._done: set[int] = set()
+        self._settled: set[int] = set()
+        self._last_ready: AbstractIncomingMessage | None = None
+        self._ready_count = 0
+
+    def track(self, message: AbstractIncomingMessage) -> None:
+        self._order.append(message.delivery_tag)
+        self._messages[message.delivery_tag] = message
+
+    def reset(self) -> None:
+        self._order.clear()
+        self._messages.clear()
+        self._done.clear()
+        self._settled.clear()
+        self._last_ready = None
+        self._ready_count = 0
+
+    def _is_tracked(self, message: AbstractIncomingMessage) -> bool:
+        # reset 이전 채널에서 받은 메시지는 무시 (같은 tag가 새 채널에서 재사용됨)
+        return self._messages.get(message.delivery_tag) is message
+
+    async def complete(self, message: AbstractIncomingMessage) -> None:
+        if not self._is_tracked(message):
+            return
+        self._done.add(message.delivery_tag)
+        await self._advance()
+
+    async def settled(self, message: AbstractIncomingMessage) -> None:
+        """
+        이미 개별적으로 nack/reject 된 메시지. ack 대상에서 제외하고 순서만 넘깁니다.
+        """
+        if not self._is_tracked(message):
+            return
+        self._settled.add(message.delivery_tag)
+        self._done.add(message.delivery_tag)
+        await self._advance()
+
+    async def _advance(self) -> None:
+        while self._order and self._order[0] in self._done:
+            tag = self._order.popleft()
+            self._done.discard(tag)
+            message = self._messages.pop(tag)
+            if tag in self._settled:
+                self._settled.discard(tag)
+                continue
+            self._last_ready = message
+            self._ready_count += 1
+
+        if self._ready_count >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if self._last_ready is None:
+            return
+        message, self._last_ready, self._ready_count = self._last_ready, None, 0
+        try:
+            await message.ack(multiple=True)
+        except Exception as e:
+            # 채널이 닫혔으면 ack 되지 않은 메시지는 브로커가 재전달함 (처리는 멱등)
+            logger.warning(f"[CONSUMER] 일괄 ack 실패: tag={message.delivery_tag}, error={e}")
+
+    async def run_periodic_flush(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"[CONSUMER] 주기적 ack 실패: {e}")
@@ -0,0 +1,110 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from aio_pika import Message
+from aio_pika.abc import AbstractChannel, AbstractExchange
+from aio_pika.exceptions import AMQPError, ChannelInvalidStateError
+
+from app.common.config import settings
+from app.common.logger import logger
+from app.common.metrics import observe
+from app.event.queue_config import get_connection
+
+# 채널/연결 문제로 판단하여 새 채널로 한 번 재시도할 예외
+RETRYABLE_ERRORS = (AMQPError, ChannelInvalidStateError, ConnectionError)
+
+
+class _PooledChannel:
+    def __init__(self, channel: AbstractChannel):
+        self.channel = channel
+        self.exchanges: dict[str, AbstractExchange] = {}
+
+
+class EventPublisher:
+    """
+    RabbitMQ 이벤트 발행기
+    - 장기 유지되는 채널 풀을 두고, 채널별로 선언된 exchange 핸들을 캐싱합니다.
+    - publisher_confirms=True이면 브로커의 ack까지 기다린 뒤 반환합니다.
+    - 닫히거나 오류가 난 채널은 폐기하고 get_connection()으로 새로 엽니다.
+    """
+
+    def __init__(self, pool_size: int = 4, publisher_confirms: bool = True):
+        self.pool_size = pool_size
+        self.publisher_confirms = publisher_confirms
+        self._semaphore = asyncio.Semaphore(pool_size)
+        self._idle: list[_PooledChannel] = []
+
+    async def _open(self) -> _PooledChannel:
+        conn = await get_connection()
+        channel = await conn.channel(publisher_confirms=self.publisher_confirms)
+        return _PooledChannel(channel)
+
+    @asynccontextmanager
+    async def _acquire(self) -> AsyncIterator[_PooledChannel]:
+        async with self._semaphore:
+            item = self._idle.pop() if self._idle else None
+            if item is None or item.channel.is_closed:
+                item = await self._open()
+            # 오류뿐 아니라 취소(CancelledError)로 빠져나갈 때도 채널을 반환하거나 닫음
+            # (확인 응답을 기다리던 채널은 상태를 알 수 없으므로 재사용하지 않음)
+            released = False
+            try:
+                yield item
+                released = True
+            finally:
+                if released:
+                    self._idle.append(item)
+                else:
+                    await self._discard(item)
+
+    @staticmethod
+    async def _discard(item: _PooledChannel) -> None:
+        try:
+            if not item.channel.is_closed:
+                await item.channel.close()
+        except Exception as e:
+            logger.warning(f"[QUEUE] 채널 정리 실패: {e}")
+
+    @staticmethod
+    async def _get_exchange(item: _PooledChannel, name: str) -> AbstractExchange:
+        exchange = item.exchanges.get(name)
+        if exchange is None:
+            exchange = await item.channel.declare_exchange(name, durable=True)
+            item.exchanges[name] = exchange
+        return exchange
+
+    @observe("mq.publish")
+    async def publish(self, exchange_name: str, routing_key: str, message: Message) -> None:
+        for attempt in range(2):
+            try:
+                async with self._acquire() as item:
+                    exchange = await self._get_exchange(item, exchange_name)
+                    await exchange.publish(message, routing_key=routing_key)
+                    return
+            except RETRYABLE_ERRORS as e:
+                if attempt:
+                    raise
+                logger.warning(f"[QUEUE] 발행 실패, 새 채널로 재시도: {e}")
+
+    async def warm_up(self) -> None:
+        """
+        애플리케이션 시작 시 채널 하나를 미리 열어 첫 요청의 채널 생성 비용을 없앱니다.
+        """
+        try:
+            async with self._acquire():
+                pass
+        except Exception as e:
+            logger.warning(f"[QUEUE] 채널 풀 준비 실패: {e}")
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for item in idle:
+            await self._discard(item)
+
+
+# 전역 인스턴스
+event_publisher = EventPublisher(
+    pool_size=settings.RABBITMQ_CHANNEL_POOL_SIZE,
+    publisher_confirms=settings.RABBITMQ_PUBLISHER_CONFIRMS,
+)
@@ -0,0 +1,88 @@
+import asyncio
+import json
+
+from aio_pika import DeliveryMode, Message
+from sqlalchemy import delete, select
+
+from app.common.config import settings
+from app.common.logger import logger
+from app.common.metrics import observe, start_metrics_server
+from app.db.models.outbox_model import OutboxEvent
+from app.db.session import async_session_factory
+from app.event.event_publisher import event_publisher, EventPublisher
+
+
+class OutboxRelay:
+    """
+    트랜잭션 아웃박스 relay
+    - `FOR UPDATE SKIP LOCKED`로 미발행 이벤트를 배치 단위로 잠그고 함께 발행한 뒤 삭제합니다.
+    - 여러 relay가 동시에 실행되어도 서로 다른 행을 가져가므로 수평 확장이 가능합니다.
+    - 발행 도중 실패하면 트랜잭션이 롤백되어 다음 주기에 재발행됩니다. (at-least-once)
+    """
+
+    def __init__(self, session_factory, publisher: EventPublisher, batch_size: int, poll_interval: float):
+        self._session_factory = session_factory
+        self._publisher = publisher
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+
+    async def _publish(self, event: OutboxEvent) -> None:
+        message = Message(
+            json.dumps(event.payload).encode(),
+            message_id=str(event.id),
+            content_type="application/json",
+            delivery_mode=DeliveryMode.PERSISTENT,
+        )
+        await self._publisher.publish(event.exchange, routing_key=event.routing_key, message=message)
+
+    @observe("outbox.relay_batch")
+    async def relay_once(self) -> int:
+        async with self._session_factory() as session:
+            async with session.begin():
+                result = await session.execute(
+                    select(OutboxEvent)
+                    .order_by(OutboxEvent.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                events = result.scalars().all()
+                if not events:
+                    return 0
+
+                await asyncio.gather(*(self._publish(event) for event in events))
+                await session.execute(
+                    delete(OutboxEvent).where(OutboxEvent.id.in_([event.id for event in events]))
+                )
+
+        logger.info(f"[OUTBOX] 이벤트 {len(events)}건 발행 완료")
+        return len(events)
+
+    async def run(self) -> None:
+        logger.info("[OUTBOX] relay 시작")
+        while True:
+            try:
+                relayed = await self.relay_once()
+            except Exception as e:
+                logger.error(f"[OUTBOX] 이벤트 발행 실패: {e}")
+                relayed = 0
+
+            # 배치가 가득 찼으면 바로 다음 배치를 처리
+            if relayed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+
+def main():
+    if settings.OUTBOX_RELAY_METRICS_PORT:
+        # relay는 별도 프로세스이므로 발행 지연 시간(mq.publish)을 자체 포트로 노출
+        start_metrics_server(settings.OUTBOX_RELAY_METRICS_PORT)
+    relay = OutboxRelay(
+        async_session_factory,
+        event_publisher,
+        batch_size=settings.OUTBOX_RELAY_BATCH_SIZE,
+        poll_interval=settings.OUTBOX_RELAY_POLL_INTERVAL,
+    )
+    asyncio.run(relay.run())
+
+
+if __name__ == "__main__":
+    main()
@@ -13,3 +13,9 @@ async def get_connection():
     if _connection is None or _connection.is_closed:
         _connection = await connect_robust(RABBITMQ_URL)
     return _connection
+
+async def close_connection():
+    global _connection
+    if _connection is not None and not _connection.is_closed:
+        await _connection.close()
+    _connection = None
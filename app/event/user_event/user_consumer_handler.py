@@ -1,16 +1,25 @@
 import json
-from aio_pika import IncomingMessage
+from aio_pika.abc import AbstractIncomingMessage
 from app.common.logger import logger
 
 
-async def handle_user_deleted(message: IncomingMessage):
-    async with message.process():
-        try:
-            data = json.loads(message.body.decode())
-            user_id = data.get("user_id")
-            logger.info(f"[CONSUMER] 사용자 탈퇴 이벤트 수신: user_id={user_id}")
+class PoisonMessageError(Exception):
+    """
+    재시도해도 처리할 수 없는 메시지 (본문 파싱 실패 등). 곧바로 DLQ로 보냅니다.
+    """
 
-            # TODO: 실제 후처리 서비스 로직 삽입
 
-        except Exception as e:
-            logger.error(f"[CONSUMER] 메시지 처리 실패: {e}")
+async def handle_user_deleted(message: AbstractIncomingMessage):
+    """
+    사용자 탈퇴 이벤트 처리
+    - ack/재시도는 consumer runner가 담당하므로 실패 시 예외를 그대로 올립니다.
+    """
+    try:
+        data = json.loads(message.body.decode())
+        user_id = data["user_id"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise PoisonMessageError(f"잘못된 메시지 본문: {e}") from e
+
+    logger.info(f"[CONSUMER] 사용자 탈퇴 이벤트 수신: user_id={user_id}")
+
+    # TODO: 실제 후처리 서비스 로직 삽입
@@ -1,26 +1,133 @@
 import asyncio
-from aio_pika import connect_robust
+from aio_pika import connect_robust, DeliveryMode, Message
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage
 from app.common.config import settings
 from app.common.logger import logger
-from app.event.user_event.user_consumer_handler import handle_user_deleted
+from app.event.batch_acker import BatchAcker
+from app.event.user_event.user_consumer_handler import handle_user_deleted, PoisonMessageError
+
+EXCHANGE_NAME = "user.events"
+ROUTING_KEY = "user.deleted"
+QUEUE_NAME = "user.deleted.queue"
+DEAD_LETTER_QUEUE_NAME = "user.deleted.dlq"
+RETRY_COUNT_HEADER = "x-retry-count"
+
+
+def retry_queue_name(attempt: int) -> str:
+    return f"user.deleted.retry.{attempt}"
+
+
+class UserDeletedConsumer:
+    """
+    사용자 탈퇴 이벤트 consumer
+    - prefetch_count만큼 미리 받아 최대 concurrency개를 동시에 처리합니다.
+    - 처리 결과와 관계없이 메시지는 BatchAcker로 묶어서 ack 합니다.
+    - 실패한 메시지는 재시도 회차별 지연 큐(TTL 만료 시 원래 exchange로 dead-letter)로 보내고,
+      max_retries를 넘기거나 파싱 불가능한 메시지는 DLQ로 보냅니다.
+    """
+
+    def __init__(self, channel: AbstractChannel):
+        self.channel = channel
+        self.acker = BatchAcker(settings.CONSUMER_ACK_BATCH_SIZE, settings.CONSUMER_ACK_FLUSH_INTERVAL)
+        self.max_retries = settings.CONSUMER_MAX_RETRIES
+        self._slots = asyncio.Semaphore(settings.CONSUMER_CONCURRENCY)
+        self._tasks: set[asyncio.Task] = set()
+
+    def on_reconnect(self, *_) -> None:
+        # 이전 채널의 delivery tag로 새 채널에 ack 하지 않도록 추적 중인 tag를 비움
+        logger.warning("[CONSUMER] 채널 재연결: 추적 중인 delivery tag 초기화")
+        self.acker.reset()
+
+    async def setup(self):
+        reopen_callbacks = getattr(self.channel, "reopen_callbacks", None)
+        if reopen_callbacks is not None:
+            reopen_callbacks.add(self.on_reconnect)
+        await self.channel.set_qos(prefetch_count=settings.CONSUMER_PREFETCH_COUNT)
+        exchange = await self.channel.declare_exchange(EXCHANGE_NAME, durable=True)
+
+        queue = await self.channel.declare_queue(QUEUE_NAME, durable=True)
+        await queue.bind(exchange, routing_key=ROUTING_KEY)
+
+        await self.channel.declare_queue(DEAD_LETTER_QUEUE_NAME, durable=True)
+        for attempt in range(1, self.max_retries + 1):
+            delay = settings.CONSUMER_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+            await self.channel.declare_queue(
+                retry_queue_name(attempt),
+                durable=True,
+                arguments={
+                    "x-message-ttl": int(delay * 1000),
+                    "x-dead-letter-exchange": EXCHANGE_NAME,
+                    "x-dead-letter-routing-key": ROUTING_KEY,
+                },
+            )
+        return queue
+
+    async def _republish(self, message: AbstractIncomingMessage, queue_name: str, retry_count: int):
+        headers = dict(message.headers or {})
+        headers[RETRY_COUNT_HEADER] = retry_count
+        await self.channel.default_exchange.publish(
+            Message(
+                message.body,
+                headers=headers,
+                message_id=message.message_id,
+                content_type=message.content_type,
+                delivery_mode=DeliveryMode.PERSISTENT,
+            ),
+            routing_key=queue_name,
+        )
+
+    async def _retry_or_dead_letter(self, message: AbstractIncomingMessage, error: Exception):
+        retry_count = int((message.headers or {}).get(RETRY_COUNT_HEADER, 0))
+        if isinstance(error, PoisonMessageError) or retry_count >= self.max_retries:
+            logger.error(f"[CONSUMER] DLQ 이동: retry={retry_count}, error={error}")
+            await self._republish(message, DEAD_LETTER_QUEUE_NAME, retry_count)
+        else:
+            logger.warning(f"[CONSUMER] 재시도 예약: retry={retry_count + 1}, error={error}")
+            await self._republish(message, retry_queue_name(retry_count + 1), retry_count + 1)
+
+    async def _process(self, message: AbstractIncomingMessage):
+        try:
+            try:
+                await handle_user_deleted(message)
+            except Exception as e:
+                await self._retry_or_dead_letter(message, e)
+        except Exception as e:
+            # 재시도 큐 발행마저 실패하면 ack 하지 않고 되돌려 브로커가 재전달하도록 함
+            logger.error(f"[CONSUMER] 메시지 처리 실패, 재전달 요청: {e}")
+            await message.nack(requeue=True)
+            await self.acker.settled(message)
+        else:
+            await self.acker.complete(message)
+        finally:
+            self._slots.release()
+
+    async def run(self):
+        queue = await self.setup()
+        flusher = asyncio.create_task(self.acker.run_periodic_flush())
+        logger.info("[CONSUMER] 사용자 탈퇴 큐 연결됨. 대기 중...")
+        try:
+            async with queue.iterator() as messages:
+                async for message in messages:
+                    await self._slots.acquire()
+                    self.acker.track(message)
+                    task = asyncio.create_task(self._process(message))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+        finally:
+            flusher.cancel()
+            await self.acker.flush()
 
 
 async def consume_user_deleted_events():
     conn = await connect_robust(settings.RABBITMQ_URL)
     channel = await conn.channel()
-    exchange = await channel.declare_exchange("user.events", durable=True)
-
-    queue = await channel.declare_queue("user.deleted.queue", durable=True)
-    await queue.bind(exchange, routing_key="user.deleted")
-
-    logger.info("[CONSUMER] 사용자 탈퇴 큐 연결됨. 대기 중...")
-    await queue.consume(handle_user_deleted)
+    consumer = UserDeletedConsumer(channel)
+    conn.reconnect_callbacks.add(consumer.on_reconnect)
+    await consumer.run()
 
 
 def main():
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(consume_user_deleted_events())
-    loop.run_forever()
+    asyncio.run(consume_user_deleted_events())
 
 
 if __name__ == "__main__":
@@ -4,25 +4,23 @@
 #     # 실제로는 RabbitMQ, Kafka 등으로 발행
 #     logger.info(f"[QUEUE] 탈퇴 사용자 후처리 이벤트 발행됨: user_id={user_id}")
 
-from aio_pika import Message
-from app.event.queue_config import get_connection
-from app.common.logger import logger
-import json
+from app.db.models.outbox_model import OutboxEvent
 
-async def publish_user_deleted(user_id: int):
-    conn = await get_connection()
-    channel = await conn.channel()
+USER_EVENTS_EXCHANGE = "user.events"
+USER_DELETED_ROUTING_KEY = "user.deleted"
 
-    exchange = await channel.declare_exchange("user.events", durable=True)
-
-    body = json.dumps({
+def user_deleted_payload(user_id: int) -> dict:
+    return {
         "event": "USER_DELETED",
         "user_id": user_id
-    }).encode()
+    }
 
-    await exchange.publish(
-        Message(body),
-        routing_key="user.deleted"
+def build_user_deleted_event(user_id: int) -> OutboxEvent:
+    """
+    사용자 탈퇴 이벤트를 아웃박스 레코드로 생성합니다. (탈퇴 트랜잭션과 함께 저장)
+    """
+    return OutboxEvent(
+        exchange=USER_EVENTS_EXCHANGE,
+        routing_key=USER_DELETED_ROUTING_KEY,
+        payload=user_deleted_payload(user_id),
     )
-
-    logger.info(f"[QUEUE] 탈퇴 사용자 이벤트 발행됨: user_id={user_id}")
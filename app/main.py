@@ -1,9 +1,42 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+from app.common.config import settings
+from app.common.jwt_keys import key_ring
+from app.common.metrics import render_metrics
+from app.common.profiler import ProfilerMiddleware
+from app.common.redis import redis_cache
+from app.common.revocation import revocation_list
+from app.common.role_registry import role_registry
+from app.common.security import password_hasher, import_password_hasher
 from app.controller.auth import auth_controller
+from app.controller.ops import ops_controller
 from app.controller.user import user_controller
 
 
-from fastapi import FastAPI
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 역할 목록 없이는 사용자/인증 응답을 만들 수 없으므로 로드 실패 시 기동 실패
+    await role_registry.load_on_startup(
+        attempts=settings.ROLE_REGISTRY_LOAD_ATTEMPTS, delay=settings.ROLE_REGISTRY_LOAD_RETRY_DELAY
+    )
+    role_refresh_task = asyncio.create_task(role_registry.run_periodic_refresh())
+    # 토큰 폐기 목록을 Redis에서 주기적으로 가져와 Bloom filter에 반영
+    revocation_task = asyncio.create_task(
+        revocation_list.run_sync(settings.REVOCATION_SYNC_INTERVAL, settings.REVOCATION_REBUILD_INTERVAL)
+    )
+    # 다른 워커의 캐시 무효화 메시지 구독 (L1 캐시 사용 여부와 무관하게 principal 캐시가 사용)
+    invalidation_task = asyncio.create_task(redis_cache.listen_invalidations())
+    yield
+    role_refresh_task.cancel()
+    revocation_task.cancel()
+    invalidation_task.cancel()
+    # 종료 시 비밀번호 해싱 executor 정리 (이벤트 발행은 outbox relay 프로세스에서 수행)
+    password_hasher.shutdown()
+    import_password_hasher.shutdown()
+
 
 app = FastAPI(
     title="FastAPI Auth Service",
@@ -11,12 +44,32 @@ app = FastAPI(
     version="1.0.0",
     openapi_tags=[],
     swagger_ui_oauth2_redirect_url=None,
-    swagger_ui_init_oauth=None
+    swagger_ui_init_oauth=None,
+    lifespan=lifespan,
 )
 
+if settings.PROFILER_ENABLED:
+    # 비활성화 시 미들웨어를 아예 등록하지 않아 요청 경로에 추가 비용이 없음
+    app.add_middleware(ProfilerMiddleware)
+
 app.include_router(auth_controller.router)
 app.include_router(user_controller.router)
+app.include_router(ops_controller.router)
 
 @app.get("/")
 async def root():
     return {"message": "FastAPI is running!"}
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    # Prometheus 스크랩용 (단계별 지연 시간 히스토그램)
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
+
+@app.get("/.well-known/jwks.json", include_in_schema=False)
+async def jwks():
+    # 다른 서비스가 토큰을 직접 검증할 수 있도록 공개키 목록(JWK Set)을 제공
+    return JSONResponse(
+        key_ring.jwks(),
+        headers={"Cache-Control": f"public, max-age={settings.JWT_JWKS_MAX_AGE}"},
+    )
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from app.db.models.user_model import User, Role
+from app.db.models.user_model import User
+from app.domain.auth.auth_schema import Principal
 
 class AuthRepository(ABC):
 
@@ -8,7 +9,15 @@ class AuthRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_member_role(self) -> Role:
+    async def get_principal(self, user_id: int) -> Principal | None:
+        pass
+
+    @abstractmethod
+    async def get_principals(self, user_ids: list[int]) -> list[Principal]:
+        pass
+
+    @abstractmethod
+    async def update_password(self, user_id: int, hashed_password: str) -> None:
         pass
 
     @abstractmethod
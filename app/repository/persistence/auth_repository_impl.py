@@ -1,20 +1,52 @@
-from sqlalchemy import select
+from sqlalchemy import select, update, lambda_stmt, any_, bindparam, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.models.user_model import User, Role
+from app.common.role_registry import role_registry
+from app.db.models.user_model import User
+from app.domain.auth.auth_schema import Principal
 from app.repository.auth_repository import AuthRepository
+from app.common.metrics import observe
 
 class AuthRepositoryImpl(AuthRepository):
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @observe("db.auth.get_user_by_email")
     async def get_user_by_email(self, email: str) -> User | None:
-        result = await self.db.execute(select(User).where(User.email == email))
+        result = await self.db.execute(lambda_stmt(lambda: select(User).where(User.email == email)))
         return result.scalar_one_or_none()
 
-    async def get_member_role(self) -> Role:
-        result = await self.db.execute(select(Role).where(Role.name == "Member"))
-        return result.scalar_one()
+    @observe("db.auth.get_principal")
+    async def get_principal(self, user_id: int) -> Principal | None:
+        # 필요한 컬럼만 조회하고, 역할 이름은 메모리의 역할 목록에서 조회
+        result = await self.db.execute(
+            lambda_stmt(lambda: select(User.id, User.role_id, User.is_active).where(User.id == user_id))
+        )
+        user = result.one_or_none()
+        if not user:
+            return None
 
+        role_name = await role_registry.get_name(user.role_id)
+        return Principal(id=user.id, role_name=role_name, is_active=user.is_active)
+
+    @observe("db.auth.get_principals")
+    async def get_principals(self, user_ids: list[int]) -> list[Principal]:
+        # 단일 쿼리(= ANY 배열 파라미터)로 여러 사용자의 주체 정보를 조회
+        result = await self.db.execute(
+            select(User.id, User.role_id, User.is_active)
+            .where(User.id == any_(bindparam("user_ids", user_ids, type_=ARRAY(Integer))))
+        )
+        return [
+            Principal(id=user.id, role_name=await role_registry.get_name(user.role_id), is_active=user.is_active)
+            for user in result.all()
+        ]
+
+    @observe("db.auth.update_password")
+    async def update_password(self, user_id: int, hashed_password: str) -> None:
+        await self.db.execute(update(User).where(User.id == user_id).values(password=hashed_password))
+        await self.db.commit()
+
+    @observe("db.auth.create_user")
     async def create_user(self, user: User) -> None:
         self.db.add(user)
         await self.db.commit()
@@ -0,0 +1,58 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repository.user_import_repository import UserImportRepository
+from app.common.metrics import observe
+
+STAGING_TABLE = "users_import_staging"
+STAGING_COLUMNS = ["email", "password", "name"]
+
+# 세션(커넥션) 단위 임시 테이블. 커밋마다 행이 비워지므로 배치마다 재사용합니다.
+CREATE_STAGING_SQL = f"""
+CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+    email varchar(255) NOT NULL,
+    password varchar(255) NOT NULL,
+    name varchar(100)
+) ON COMMIT DELETE ROWS
+"""
+
+# staging → users 병합. 이미 존재하는 이메일은 건너뛰고, 삽입되지 않은 이메일 예시를 함께 반환
+MERGE_SQL = f"""
+WITH inserted AS (
+    INSERT INTO users (email, password, name, role_id, is_active, created_at, updated_at)
+    SELECT DISTINCT ON (email) email, password, name, :role_id, TRUE, now(), now()
+    FROM {STAGING_TABLE}
+    ORDER BY email
+    ON CONFLICT (email) DO NOTHING
+    RETURNING email
+)
+SELECT
+    (SELECT count(*) FROM inserted) AS inserted,
+    ARRAY(
+        SELECT s.email FROM {STAGING_TABLE} s
+        WHERE NOT EXISTS (SELECT 1 FROM inserted i WHERE i.email = s.email)
+        LIMIT :conflict_sample
+    ) AS conflict_emails
+"""
+
+class UserImportRepositoryImpl(UserImportRepository):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @observe("db.user.copy_and_merge")
+    async def copy_and_merge(
+        self, records: list[tuple[str, str, str | None]], role_id: int, conflict_sample: int
+    ) -> tuple[int, list[str]]:
+        # SQLAlchemy 쪽에서 먼저 실행해 트랜잭션을 연 뒤, 같은 커넥션에서 asyncpg COPY 수행
+        await self.db.execute(text(CREATE_STAGING_SQL))
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            STAGING_TABLE, records=records, columns=STAGING_COLUMNS
+        )
+
+        result = await self.db.execute(
+            text(MERGE_SQL), {"role_id": role_id, "conflict_sample": conflict_sample}
+        )
+        inserted, conflict_emails = result.one()
+        await self.db.commit()
+        return inserted, list(conflict_emails)
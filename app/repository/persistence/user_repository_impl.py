@@ -1,47 +1,91 @@
+from typing import AsyncIterator, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
-from app.db.models.user_model import User
+from sqlalchemy import select, func, tuple_, text, any_, bindparam, Integer, Row, lambda_stmt
+from sqlalchemy.dialects.postgresql import ARRAY
+from app.common.cursor import decode_cursor
+from app.db.models.user_model import User, Role
+from app.db.models.outbox_model import OutboxEvent
 from app.domain.user.user_schema import UserQueryParams
 from app.repository.user_repository import UserRepository
+from app.common.metrics import observe
+
+# 자주 실행되는 쿼리는 lambda_stmt로 작성하여 구문 생성/캐시 키 계산 비용을 줄이고,
+# 컴파일된 SQL은 엔진의 compiled cache, 서버 측 prepared statement는 asyncpg 캐시를 재사용합니다.
+ESTIMATE_USERS_SQL = text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'users'::regclass")
 
 class UserRepositoryImpl(UserRepository):
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @observe("db.user.get_users")
     async def get_users(self, params: UserQueryParams) -> list[User]:
-        offset = (params.page - 1) * params.size
-        stmt = (
-            select(User)
-            .options(selectinload(User.role))
+        size = params.size
+        stmt = lambda_stmt(
+            lambda: select(User)
             .where(User.deleted_at.is_(None))
-            .order_by(User.created_at.desc())
-            .offset(offset)
-            .limit(params.size)
+            .order_by(User.created_at.desc(), User.id.desc())
+            .limit(size)
         )
+        if params.cursor:
+            # keyset 페이징: 마지막 행의 (created_at, id) 이후부터 인덱스 탐색
+            created_at, last_id = decode_cursor(params.cursor)
+            stmt += lambda s: s.where(tuple_(User.created_at, User.id) < tuple_(created_at, last_id))
+        else:
+            offset = (params.page - 1) * params.size
+            stmt += lambda s: s.offset(offset)
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    @observe("db.user.count_users")
     async def count_users(self, params: UserQueryParams) -> int:
-        count_stmt = select(func.count()).select_from(
-            select(User).where(User.deleted_at.is_(None)).subquery()
+        result = await self.db.execute(
+            lambda_stmt(lambda: select(func.count()).select_from(User).where(User.deleted_at.is_(None)))
         )
-        result = await self.db.execute(count_stmt)
         return result.scalar_one()
 
-    async def get_user_with_role(self, user_id: int) -> User | None:
+    @observe("db.user.estimate_users")
+    async def estimate_users(self) -> int:
+        # 통계 기반 추정치 (ANALYZE 이전이면 -1 반환)
+        result = await self.db.execute(ESTIMATE_USERS_SQL)
+        return result.scalar_one()
+
+    async def stream_users(self, chunk_size: int) -> AsyncIterator[Sequence[Row]]:
+        # 서버 사이드 커서로 chunk_size 행씩 가져와 전체 결과를 메모리에 올리지 않음
+        stmt = (
+            select(User.id, User.email, User.name, Role.name.label("role"), User.is_active, User.created_at)
+            .join(Role, User.role_id == Role.id)
+            .where(User.deleted_at.is_(None))
+            .order_by(User.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.db.stream(stmt)
+        async for rows in result.partitions():
+            yield rows
+
+    @observe("db.user.get_user_by_id")
+    async def get_user_by_id(self, user_id: int) -> User | None:
+        result = await self.db.execute(lambda_stmt(lambda: select(User).where(User.id == user_id)))
+        return result.scalar_one_or_none()
+
+    @observe("db.user.get_users_by_ids")
+    async def get_users_by_ids(self, user_ids: list[int]) -> list[User]:
+        # 단일 쿼리(= ANY 배열 파라미터)로 여러 사용자를 조회
         result = await self.db.execute(
             select(User)
-            .options(selectinload(User.role))
-            .where(User.id == user_id)
+            .where(User.id == any_(bindparam("user_ids", user_ids, type_=ARRAY(Integer))))
         )
-        return result.scalar_one_or_none()
+        return result.scalars().all()
 
+    @observe("db.user.update_user")
     async def update_user(self, user: User) -> None:
         self.db.add(user)
         await self.db.commit()
         await self.db.refresh(user)
 
-    async def delete_user(self, user: User) -> None:
+    @observe("db.user.delete_user")
+    async def delete_user(self, user: User, event: OutboxEvent | None = None) -> None:
         await self.db.delete(user)
+        if event is not None:
+            # 탈퇴와 같은 트랜잭션에서 아웃박스 이벤트 저장
+            self.db.add(event)
         await self.db.commit()
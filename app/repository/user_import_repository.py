@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+class UserImportRepository(ABC):
+
+    @abstractmethod
+    async def copy_and_merge(
+        self, records: list[tuple[str, str, str | None]], role_id: int, conflict_sample: int
+    ) -> tuple[int, list[str]]:
+        """
+        (email, password_hash, name) 레코드를 적재하고 (삽입 건수, 충돌 이메일 예시)를 반환합니다.
+        """
+        pass
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from app.db.models.user_model import User
+from app.db.models.outbox_model import OutboxEvent
 from app.domain.user.user_schema import UserQueryParams
-from typing import Optional
+from typing import Optional, AsyncIterator, Sequence
+from sqlalchemy import Row
 
 class UserRepository(ABC):
 
@@ -14,7 +16,22 @@ class UserRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_user_with_role(self, user_id: int) -> Optional[User]:
+    async def estimate_users(self) -> int:
+        pass
+
+    @abstractmethod
+    def stream_users(self, chunk_size: int) -> AsyncIterator[Sequence[Row]]:
+        """
+        (id, email, name, role, is_active, created_at) 행을 chunk_size 단위로 반환합니다.
+        """
+        pass
+
+    @abstractmethod
+    async def get_user_by_id(self, user_id: int) -> Optional[User]:
+        pass
+
+    @abstractmethod
+    async def get_users_by_ids(self, user_ids: list[int]) -> list[User]:
         pass
 
     @abstractmethod
@@ -22,5 +39,5 @@ class UserRepository(ABC):
         pass
 
     @abstractmethod
-    async def delete_user(self, user: User) -> None:
+    async def delete_user(self, user: User, event: Optional[OutboxEvent] = None) -> None:
         pass
@@ -1,9 +1,20 @@
-from app.common.exception import InvalidEmailOrPasswordException, EmailAlreadyExistsException
-from app.domain.auth.auth_schema import SignupRequest, SigninRequest, TokenResponse
-from app.common.security import hash_password, verify_password
-from app.common.jwt_utils import create_access_token, create_refresh_token
+import asyncio
+import uuid
+from app.common.exception import InvalidEmailOrPasswordException, EmailAlreadyExistsException, \
+    InvalidTokenException, UserNotFoundException
+from app.common.logger import logger
+from app.common.principal_cache import principal_cache
+from app.common.refresh_token_store import refresh_token_store
+from app.common.revocation import revocation_list
+from app.domain.auth.auth_schema import SignupRequest, SigninRequest, TokenResponse, Principal, \
+    TokenIntrospection
+from app.common.config import settings
+from app.common.security import hash_password_async, verify_and_update_password_async
+from app.common.jwt_utils import create_access_token, create_refresh_token, decode_token, REFRESH_TOKEN_TYPE
+from app.common.role_registry import role_registry
 from app.repository.auth_repository import AuthRepository
 from app.db.models.user_model import User
+from app.domain.user.user_enum import RoleEnum
 
 
 class AuthService:
@@ -14,21 +25,129 @@ class AuthService:
         if await self.repo.get_user_by_email(data.email):
             raise EmailAlreadyExistsException()
 
-        role = await self.repo.get_member_role()
         user = User(
             email=data.email,
-            password=hash_password(data.password),
+            password=await hash_password_async(data.password),
             name=data.name,
-            role_id=role.id
+            role_id=await role_registry.get_id(RoleEnum.MEMBER)
         )
         await self.repo.create_user(user)
 
     async def signin(self, data: SigninRequest) -> TokenResponse:
         user = await self.repo.get_user_by_email(data.email)
-        if not user or not verify_password(data.password, user.password):
+        if not user:
             raise InvalidEmailOrPasswordException()
+        verified, new_hash = await verify_and_update_password_async(data.password, user.password)
+        if not verified:
+            raise InvalidEmailOrPasswordException()
+
+        if new_hash and settings.PASSWORD_REHASH_ON_LOGIN:
+            # 해시 방식/비용 변경 반영 (평문 비밀번호를 알 수 있는 로그인 시점에만 가능)
+            try:
+                await self.repo.update_password(user.id, new_hash)
+            except Exception as e:
+                logger.warning(f"❌ 비밀번호 재해싱 저장 실패: user_id={user.id}, {e}")
+
+        return await self._issue_tokens(user.id, family=uuid.uuid4().hex)
+
+    async def refresh(self, refresh_token: str) -> TokenResponse:
+        """
+        refresh token을 회전(rotation)하여 새 토큰 쌍을 발급합니다. (bcrypt 검증 없음)
+        - 한 번 사용된 refresh token이 다시 오면 탈취로 간주하고 같은 계열을 모두 폐기합니다.
+        """
+        payload = decode_token(refresh_token)
+        if not payload or payload.get("typ") != REFRESH_TOKEN_TYPE or "jti" not in payload or "fam" not in payload:
+            raise InvalidTokenException()
+
+        family = await refresh_token_store.consume(payload["jti"])
+        if family != payload["fam"]:
+            logger.warning(f"⚠️ Refresh token 재사용 감지, 토큰 계열 폐기: sub={payload.get('sub')}")
+            await refresh_token_store.revoke_family(payload["fam"])
+            raise InvalidTokenException()
+
+        principal = await self.get_principal(int(payload["sub"]))
+        return await self._issue_tokens(principal.id, family=family)
+
+    async def signout(self, access_token: str, refresh_token: str | None = None) -> None:
+        """
+        access token을 폐기 목록에 추가하고, refresh token이 있으면 같은 로그인 세션의 refresh token을 폐기합니다.
+        """
+        payload = decode_token(access_token)
+        if payload and "jti" in payload:
+            await revocation_list.revoke(payload["jti"], payload["exp"])
+
+        if refresh_token:
+            refresh_payload = decode_token(refresh_token)
+            if refresh_payload and refresh_payload.get("typ") == REFRESH_TOKEN_TYPE \
+                    and refresh_payload.get("sub") == (payload or {}).get("sub") and "fam" in refresh_payload:
+                await refresh_token_store.revoke_family(refresh_payload["fam"])
+
+    async def introspect(self, tokens: list[str]) -> list[TokenIntrospection]:
+        """
+        여러 access token을 한 번에 검증합니다. (get_current_user와 같은 기준)
+        - 서명/만료 → 폐기 목록 → 사용자 활성 여부 순으로 확인하며,
+          사용자 조회는 principal 캐시 일괄 조회 후 미스만 단일 쿼리로 DB 조회합니다.
+        """
+        payloads = []
+        for token in tokens:
+            payload = decode_token(token)
+            if payload is None or "sub" not in payload or payload.get("typ") == REFRESH_TOKEN_TYPE:
+                payload = None
+            payloads.append(payload)
 
+        revoked = await asyncio.gather(
+            *(revocation_list.is_revoked(payload.get("jti")) for payload in payloads if payload)
+        )
+        revoked_iter = iter(revoked)
+        payloads = [payload if payload and not next(revoked_iter) else None for payload in payloads]
+
+        user_ids = list({int(payload["sub"]) for payload in payloads if payload})
+        principals = await self.get_principals(user_ids) if user_ids else {}
+
+        results = []
+        for payload in payloads:
+            principal = principals.get(int(payload["sub"])) if payload else None
+            if principal is None or not principal.is_active:
+                results.append(TokenIntrospection(active=False))
+                continue
+            results.append(
+                TokenIntrospection(active=True, sub=payload["sub"], role=principal.role_name, exp=payload["exp"])
+            )
+        return results
+
+    async def get_principals(self, user_ids: list[int]) -> dict[int, Principal]:
+        """
+        인증 주체 일괄 조회 (principal 캐시 → DB). 없는 사용자는 결과에서 제외
+        """
+        found = await principal_cache.get_many(user_ids)
+        misses = [user_id for user_id in user_ids if user_id not in found]
+        if misses:
+            loaded = await self.repo.get_principals(misses)
+            if loaded:
+                await principal_cache.set_many(loaded)
+            found.update({principal.id: principal for principal in loaded})
+        return found
+
+    async def _issue_tokens(self, user_id: int, family: str) -> TokenResponse:
+        jti = uuid.uuid4().hex
+        await refresh_token_store.save(jti, family)
         return TokenResponse(
-            access_token=create_access_token({"sub": str(user.id)}),
-            refresh_token=create_refresh_token({"sub": str(user.id)})
+            access_token=create_access_token({"sub": str(user_id)}),
+            refresh_token=create_refresh_token({"sub": str(user_id), "jti": jti, "fam": family})
         )
+
+    async def get_principal(self, user_id: int) -> Principal:
+        """
+        인증 주체 조회 (principal 캐시 → DB). 없거나 비활성화된 사용자는 404
+        """
+        principal = await principal_cache.get(user_id)
+        if principal is None:
+            principal = await self.repo.get_principal(user_id)
+            if principal is None:
+                raise UserNotFoundException()
+            await principal_cache.set(principal)
+
+        if not principal.is_active:
+            raise UserNotFoundException()
+
+        return principal
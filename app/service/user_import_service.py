@@ -0,0 +1,145 @@
+import csv
+import json
+from typing import AsyncIterator, Optional
+from pydantic import ValidationError
+from app.common.config import settings
+from app.common.logger import logger
+from app.common.redis import redis_cache
+from app.common.redis_utils import safe_redis_incr
+from app.common.role_registry import role_registry
+from app.common.security import PasswordHasher, import_password_hasher, is_password_hash
+from app.domain.user.user_enum import UserFileFormat, RoleEnum
+from app.domain.user.user_schema import UserImportRow, UserImportResult
+from app.repository.user_import_repository import UserImportRepository
+from app.service.user_service import USERS_GENERATION_KEY
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    바이트 청크 스트림을 줄 단위로 나눕니다. (한 행은 한 줄이어야 함)
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+async def _iter_rows(chunks: AsyncIterator[bytes], fmt: UserFileFormat) -> AsyncIterator[tuple[int, object]]:
+    """
+    (줄 번호, 행) 스트림. 파싱 불가 행은 예외 객체를 행 대신 반환합니다.
+    """
+    header = None
+    line_no = 0
+    async for raw in _iter_lines(chunks):
+        line_no += 1
+        line = raw.decode("utf-8-sig" if line_no == 1 else "utf-8", errors="replace").strip()
+        if not line:
+            continue
+        try:
+            if fmt == UserFileFormat.NDJSON:
+                yield line_no, json.loads(line)
+                continue
+            values = next(csv.reader([line]))
+            if header is None:
+                header = [column.strip() for column in values]
+                continue
+            yield line_no, {column: value or None for column, value in zip(header, values)}
+        except (ValueError, csv.Error) as e:
+            yield line_no, e
+
+
+class UserImportService:
+    """
+    사용자 대량 가져오기
+    - CSV/NDJSON 스트림을 USER_IMPORT_BATCH_SIZE 단위로 처리하여 메모리 사용량을 일정하게 유지합니다.
+    - 배치마다 평문 비밀번호를 병렬 해싱(이미 해싱된 값은 그대로 사용)한 뒤
+      COPY로 임시 테이블에 적재하고, users에 병합합니다. (이메일 중복은 건너뛰고 집계)
+    - 해싱은 COPY보다 수천 배 느리므로 평문 비밀번호 행은 max_plain_passwords까지만 받고,
+      초과 행은 invalid로 집계합니다. (None이면 제한 없음 - CLI)
+    """
+
+    def __init__(
+        self,
+        repo: UserImportRepository,
+        hasher: PasswordHasher = import_password_hasher,
+        batch_size: int = settings.USER_IMPORT_BATCH_SIZE,
+        max_plain_passwords: Optional[int] = settings.USER_IMPORT_MAX_PLAIN_PASSWORDS or None,
+    ):
+        self.repo = repo
+        self.hasher = hasher
+        self.batch_size = batch_size
+        self.max_plain_passwords = max_plain_passwords
+        self.sample_size = settings.USER_IMPORT_ERROR_SAMPLE
+
+    async def import_users(self, chunks: AsyncIterator[bytes], fmt: UserFileFormat) -> UserImportResult:
+        result = UserImportResult()
+        # 역할이 없으면 RoleNotFoundException(503)으로 실패하므로 role_id가 NULL인 행은 병합되지 않음
+        role_id = await role_registry.get_id(RoleEnum.MEMBER)
+
+        batch: list[UserImportRow] = []
+        plain_count = 0
+        async for line_no, row in _iter_rows(chunks, fmt):
+            parsed = self._validate(line_no, row, result)
+            if parsed is None:
+                continue
+            if not parsed.password_hash:
+                plain_count += 1
+                if self.max_plain_passwords is not None and plain_count > self.max_plain_passwords:
+                    self._record_invalid(
+                        line_no,
+                        f"평문 비밀번호는 요청당 {self.max_plain_passwords}행까지 가능합니다. "
+                        f"password_hash(bcrypt)를 사용하거나 CLI로 가져오세요.",
+                        result,
+                    )
+                    continue
+            batch.append(parsed)
+            if len(batch) >= self.batch_size:
+                await self._flush(batch, role_id, result)
+                batch = []
+        if batch:
+            await self._flush(batch, role_id, result)
+
+        if result.inserted:
+            # 목록 캐시 세대 갱신
+            await safe_redis_incr(redis_cache, USERS_GENERATION_KEY)
+        logger.info(
+            f"[IMPORT] 사용자 가져오기 완료: inserted={result.inserted}, "
+            f"conflicts={result.conflicts}, invalid={result.invalid}"
+        )
+        return result
+
+    def _validate(self, line_no: int, row, result: UserImportResult) -> UserImportRow | None:
+        try:
+            if isinstance(row, Exception):
+                raise row
+            parsed = UserImportRow.model_validate(row)
+            if parsed.password_hash and not is_password_hash(parsed.password_hash):
+                raise ValueError("지원하지 않는 password_hash 형식입니다.")
+            return parsed
+        except (ValueError, ValidationError) as e:
+            self._record_invalid(line_no, e, result)
+            return None
+
+    def _record_invalid(self, line_no: int, reason, result: UserImportResult) -> None:
+        result.invalid += 1
+        if len(result.errors) < self.sample_size:
+            result.errors.append(f"line {line_no}: {reason}")
+
+    async def _flush(self, batch: list[UserImportRow], role_id: int, result: UserImportResult) -> None:
+        plain = [row for row in batch if not row.password_hash]
+        hashes = await self.hasher.hash_many([row.password for row in plain])
+        for row, hashed in zip(plain, hashes):
+            row.password_hash = hashed
+
+        records = [(row.email, row.password_hash, row.name) for row in batch]
+        remaining = max(self.sample_size - len(result.conflict_emails), 0)
+        inserted, conflict_emails = await self.repo.copy_and_merge(records, role_id, remaining)
+
+        result.inserted += inserted
+        result.conflicts += len(records) - inserted
+        result.conflict_emails.extend(conflict_emails[:remaining])
+        logger.info(f"[IMPORT] 배치 병합: {inserted}/{len(records)}건 삽입")
@@ -1,51 +1,121 @@
 from datetime import datetime, UTC
+from app.common.cache_loader import get_or_load
 from app.common.exception import UserNotFoundException, IsActivePermissionException
+from app.common.config import settings
+from app.common.cursor import encode_cursor
 from app.common.logger import logger
 from app.db.models.user_model import User
-from app.domain.user.user_schema import UserUpdateRequest, UserQueryParams, UserListResponse, UserListItem
+from app.domain.user.user_enum import UserCountMode, UserFileFormat
+from app.domain.user.user_schema import UserUpdateRequest, UserQueryParams, UserListResponse, UserListItem, \
+    UserBatchResponse
 from app.repository.user_repository import UserRepository
-from app.event.user_event.user_publisher import publish_user_deleted
+from app.event.user_event.user_publisher import build_user_deleted_event
 from app.common.redis import redis_cache
+from app.common.principal_cache import principal_cache
+from app.common.role_registry import role_registry
+from app.domain.auth.auth_schema import Principal
 from app.common.redis_utils import (
     safe_redis_get,
     safe_redis_set,
+    safe_redis_mget,
+    safe_redis_set_many,
     safe_redis_delete,
-    safe_redis_delete_pattern,
+    safe_redis_get_version,
+    safe_redis_incr,
 )
+import csv
 import hashlib
+import io
 import json
+from typing import AsyncIterator
+
+# 사용자 목록 캐시 세대 번호. 쓰기 시 INCR 한 번으로 이전 세대의 목록 캐시를 모두 무효화하고,
+# 이전 세대 키들은 TTL로 자연 만료됩니다.
+USERS_GENERATION_KEY = "users:gen"
 
 
 class UserService:
     def __init__(self, repo: UserRepository):
         self.repo = repo
 
-    async def get_user(self, user_id: int, current_user: User) -> dict:
-        cache_key = f"user:{user_id}"
-        cached = await safe_redis_get(redis_cache, cache_key)
-        if cached:
-            return cached
+    async def get_user(self, user_id: int, current_user: Principal) -> dict:
+        # 캐시 미스 시 같은 키의 동시 요청은 한 번의 DB 조회로 합쳐짐
+        return await get_or_load(redis_cache, f"user:{user_id}", lambda: self._load_user(user_id), ex=300)
 
-        user = await self.repo.get_user_with_role(user_id)
+    async def _load_user(self, user_id: int) -> dict:
+        user = await self.repo.get_user_by_id(user_id)
         if not user:
             raise UserNotFoundException()
 
-        user_data = {
+        return await self._to_user_data(user)
+
+    @staticmethod
+    async def get_role_name(user: User) -> str:
+        # role이 이미 로드된 경우에만 사용하고(지연 로딩 방지), 아니면 메모리의 역할 목록에서 조회
+        role = user.__dict__.get("role")
+        if role is not None:
+            return role.name
+        return await role_registry.get_name(user.role_id)
+
+    async def _to_user_data(self, user: User) -> dict:
+        return {
             "id": user.id,
             "email": user.email,
             "name": user.name,
-            "role": user.role.name,
+            "role": await self.get_role_name(user),
         }
 
-        await safe_redis_set(redis_cache, cache_key, user_data, ex=300)
-        return user_data
+    async def get_users_by_ids(self, user_ids: list[int]) -> UserBatchResponse:
+        # Redis MGET 1회 → 미스만 DB 조회 1회 → 파이프라인 SET 1회
+        user_ids = list(dict.fromkeys(user_ids))
+        cached = await safe_redis_mget(redis_cache, [f"user:{user_id}" for user_id in user_ids])
+        found = {user_id: value for user_id, value in zip(user_ids, cached) if value}
+
+        misses = [user_id for user_id in user_ids if user_id not in found]
+        if misses:
+            loaded = {user.id: await self._to_user_data(user) for user in await self.repo.get_users_by_ids(misses)}
+            if loaded:
+                await safe_redis_set_many(
+                    redis_cache, {f"user:{user_id}": data for user_id, data in loaded.items()}, ex=300
+                )
+            found.update(loaded)
+
+        return UserBatchResponse(
+            users=[found[user_id] for user_id in user_ids if user_id in found],
+            missing=[user_id for user_id in user_ids if user_id not in found],
+        )
 
-    async def update_user(self, user_id: int, update: UserUpdateRequest, current_user: User) -> User:
-        user = await self.repo.get_user_with_role(user_id)
+    async def export_users(self, fmt: UserFileFormat) -> AsyncIterator[str]:
+        """
+        전체 사용자를 NDJSON/CSV 텍스트 청크로 반환합니다.
+        - 서버 사이드 커서에서 USER_EXPORT_CHUNK_SIZE 행씩 읽어 청크 하나로 직렬화합니다.
+        """
+        columns = ["id", "email", "name", "role", "is_active", "created_at"]
+        if fmt == UserFileFormat.CSV:
+            yield ",".join(columns) + "\n"
+
+        async for rows in self.repo.stream_users(settings.USER_EXPORT_CHUNK_SIZE):
+            if fmt == UserFileFormat.CSV:
+                buffer = io.StringIO()
+                writer = csv.writer(buffer, lineterminator="\n")
+                writer.writerows(
+                    (row.id, row.email, row.name, row.role, row.is_active, row.created_at.isoformat())
+                    for row in rows
+                )
+                yield buffer.getvalue()
+            else:
+                yield "".join(
+                    json.dumps({**row._asdict(), "created_at": row.created_at.isoformat()},
+                               ensure_ascii=False) + "\n"
+                    for row in rows
+                )
+
+    async def update_user(self, user_id: int, update: UserUpdateRequest, current_user: Principal) -> User:
+        user = await self.repo.get_user_by_id(user_id)
         if not user:
             raise UserNotFoundException()
 
-        if update.is_active is not None and current_user.role.name != "Admin":
+        if update.is_active is not None and current_user.role_name != "Admin":
             raise IsActivePermissionException()
 
         if update.name is not None:
@@ -57,49 +127,82 @@ class UserService:
 
         await self.repo.update_user(user)
         await safe_redis_delete(redis_cache, f"user:{user_id}")
-        await safe_redis_delete_pattern(redis_cache, "users:*")
+        await principal_cache.invalidate(user_id)
+        await safe_redis_incr(redis_cache, USERS_GENERATION_KEY)
         return user
 
-    async def delete_user(self, user_id: int, current_user: User) -> None:
-        user = await self.repo.get_user_with_role(user_id)
+    async def delete_user(self, user_id: int, current_user: Principal) -> None:
+        user = await self.repo.get_user_by_id(user_id)
         if not user:
             raise UserNotFoundException()
 
         user.deleted_at = datetime.now(UTC)
         user.is_active = False
 
-        await self.repo.delete_user(user)
+        # 탈퇴 이벤트는 아웃박스에 함께 커밋되고, outbox relay가 RabbitMQ로 발행
+        await self.repo.delete_user(user, build_user_deleted_event(user.id))
         await safe_redis_delete(redis_cache, f"user:{user_id}")
-        await safe_redis_delete_pattern(redis_cache, "users:*")
-        await publish_user_deleted(user.id)
+        await principal_cache.invalidate(user_id)
+        await safe_redis_incr(redis_cache, USERS_GENERATION_KEY)
 
     async def get_users(self, params: UserQueryParams) -> UserListResponse:
+        namespace = await self._users_namespace()
         query_key = json.dumps(params.model_dump(), sort_keys=True)
-        cache_key = f"users:{hashlib.md5(query_key.encode()).hexdigest()}"
-        cached = await safe_redis_get(redis_cache, cache_key)
-        if cached:
-            return UserListResponse(**cached)
+        cache_key = f"{namespace}:{hashlib.md5(query_key.encode()).hexdigest()}"
+        result = await get_or_load(redis_cache, cache_key, lambda: self._load_users(params, namespace), ex=60)
+        return UserListResponse(**result)
 
+    async def _load_users(self, params: UserQueryParams, namespace: str) -> dict:
         users = await self.repo.get_users(params)
-        total = await self.repo.count_users(params)
+        total = await self._count_users(params, namespace)
 
         user_items = [
             UserListItem(
                 id=u.id,
                 email=u.email,
                 name=u.name,
-                role=u.role.name,
+                role=await self.get_role_name(u),
                 is_active=u.is_active,
             )
             for u in users
         ]
 
+        next_cursor = None
+        if len(users) == params.size:
+            last = users[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
         result = UserListResponse(
             total=total,
             page=params.page,
             size=params.size,
             users=user_items,
+            next_cursor=next_cursor,
         )
 
-        await safe_redis_set(redis_cache, cache_key, result.model_dump(), ex=60)
-        return result
+        return result.model_dump()
+
+    async def _users_namespace(self) -> str:
+        version = await safe_redis_get_version(redis_cache, USERS_GENERATION_KEY)
+        return f"users:v{version}"
+
+    async def _count_users(self, params: UserQueryParams, namespace: str) -> int | None:
+        if not params.include_total:
+            return None
+
+        mode = params.total_mode or UserCountMode(settings.USER_COUNT_MODE)
+        if mode == UserCountMode.ESTIMATED:
+            # reltuples는 soft delete 행을 포함한 통계 추정치
+            estimate = await self.repo.estimate_users()
+            if estimate >= 0:
+                return estimate
+        elif mode == UserCountMode.CACHED:
+            cache_key = f"{namespace}:total"
+            cached = await safe_redis_get(redis_cache, cache_key)
+            if cached is not None:
+                return cached
+            total = await self.repo.count_users(params)
+            await safe_redis_set(redis_cache, cache_key, total, ex=settings.USER_COUNT_CACHE_TTL)
+            return total
+
+        return await self.repo.count_users(params)
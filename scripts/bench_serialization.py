@@ -0,0 +1,63 @@
+"""
+사용자 목록(100건) 직렬화 벤치마크
+
+- 캐시 값 직렬화(json / orjson / msgpack)의 속도와 크기,
+  응답 직렬화(FastAPI 기본 JSONResponse 경로 / ORJSONResponse)의 속도를 비교합니다.
+
+사용 예:
+    $ PYTHONPATH=. python scripts/bench_serialization.py --users 100 --repeat 2000
+"""
+import argparse
+import json
+import time
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.common.serializer import VersionedCodec
+from app.domain.user.user_schema import UserListResponse, UserListItem
+
+
+def build_payload(count: int) -> UserListResponse:
+    users = [
+        UserListItem(id=i, email=f"user{i}@example.com", name=f"사용자{i}", role="Member", is_active=True)
+        for i in range(count)
+    ]
+    return UserListResponse(total=1_000_000, page=1, size=count, users=users,
+                            next_cursor=datetime(2025, 7, 12).isoformat())
+
+
+def bench(label: str, fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - started) / repeat * 1_000_000
+    print(f"  {label:<34} {elapsed:>9.1f} µs")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    model = build_payload(args.users)
+    data = model.model_dump()
+
+    print(f"[캐시 값] 사용자 {args.users}건")
+    for name in ("json", "orjson", "msgpack"):
+        codec = VersionedCodec(name)
+        encoded = codec.encode(data)
+        bench(f"{name} encode ({len(encoded)} bytes)", lambda: codec.encode(data), args.repeat)
+        bench(f"{name} decode", lambda: codec.decode(encoded), args.repeat)
+
+    print("[응답]")
+    bench("JSONResponse(jsonable_encoder)", lambda: JSONResponse(jsonable_encoder(model)), args.repeat)
+    bench("ORJSONResponse(model_dump)", lambda: ORJSONResponse(model.model_dump()), args.repeat)
+    bench("json.dumps (참고)", lambda: json.dumps(data), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+로그인(bcrypt) 부하 중 `GET /` 지연 시간 벤치마크
+
+- 동시 로그인 요청을 지속적으로 발생시키는 동안 `/`를 주기적으로 호출하여
+  p50/p95/p99 지연 시간을 측정합니다.
+- 먼저 로그인 부하 없이 기준치를 측정한 뒤, 같은 조건에서 부하를 걸어 비교합니다.
+
+사용 예:
+    $ python scripts/bench_signin_latency.py --base-url http://localhost --signin-concurrency 16
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def probe_root(client: httpx.AsyncClient, duration: float, interval: float) -> list[float]:
+    latencies = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        await client.get("/")
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def signin_loop(client: httpx.AsyncClient, stop: asyncio.Event, email: str, password: str, counts: dict):
+    while not stop.is_set():
+        response = await client.post("/auth/signin", json={"email": email, "password": password})
+        counts[response.status_code] = counts.get(response.status_code, 0) + 1
+
+
+def report(label: str, latencies: list[float]) -> None:
+    print(
+        f"[{label}] n={len(latencies)} "
+        f"p50={statistics.median(latencies):.2f}ms "
+        f"p95={percentile(latencies, 95):.2f}ms "
+        f"p99={percentile(latencies, 99):.2f}ms "
+        f"max={max(latencies):.2f}ms"
+    )
+
+
+async def run(args) -> None:
+    limits = httpx.Limits(max_connections=args.signin_concurrency + 4)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=30, limits=limits) as client:
+        baseline = await probe_root(client, args.duration, args.interval)
+        report("baseline", baseline)
+
+        stop = asyncio.Event()
+        counts: dict[int, int] = {}
+        workers = [
+            asyncio.create_task(signin_loop(client, stop, args.email, args.password, counts))
+            for _ in range(args.signin_concurrency)
+        ]
+        under_load = await probe_root(client, args.duration, args.interval)
+        stop.set()
+        await asyncio.gather(*workers)
+
+        report(f"signin x{args.signin_concurrency}", under_load)
+        print(f"signin status counts: {counts}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost")
+    parser.add_argument("--email", default="admin@example.com")
+    parser.add_argument("--password", default="admin1234")
+    parser.add_argument("--signin-concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 구간 길이(초)")
+    parser.add_argument("--interval", type=float, default=0.02, help="`/` 호출 간격(초)")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
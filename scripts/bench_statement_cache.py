@@ -0,0 +1,118 @@
+"""
+리포지토리 핫 쿼리의 구문 생성/컴파일 비용 벤치마크
+
+- 매 호출마다 select()를 새로 만드는 방식과 lambda_stmt 방식의 호출당 시간을 비교합니다.
+- DB 왕복 비용을 빼고 구문 생성·캐시 키 계산·컴파일 비용만 보기 위해 인메모리 SQLite를 사용합니다.
+- "compile (no cache)"는 compiled cache 없이 매번 SQL을 컴파일할 때의 비용입니다. (참고용)
+
+사용 예:
+    $ PYTHONPATH=. python scripts/bench_statement_cache.py --repeat 20000
+"""
+import argparse
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, func, insert, lambda_stmt, select, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.db.models.user_model import Role, User
+
+
+def plain_by_id(user_id):
+    return select(User).where(User.id == user_id)
+
+
+def lambda_by_id(user_id):
+    return lambda_stmt(lambda: select(User).where(User.id == user_id))
+
+
+def plain_by_email(email):
+    return select(User).where(User.email == email)
+
+
+def lambda_by_email(email):
+    return lambda_stmt(lambda: select(User).where(User.email == email))
+
+
+def plain_page(size, cursor):
+    created_at, last_id = cursor
+    return (
+        select(User)
+        .where(User.deleted_at.is_(None))
+        .where(tuple_(User.created_at, User.id) < tuple_(created_at, last_id))
+        .order_by(User.created_at.desc(), User.id.desc())
+        .limit(size)
+    )
+
+
+def lambda_page(size, cursor):
+    created_at, last_id = cursor
+    stmt = lambda_stmt(
+        lambda: select(User)
+        .where(User.deleted_at.is_(None))
+        .order_by(User.created_at.desc(), User.id.desc())
+        .limit(size)
+    )
+    stmt += lambda s: s.where(tuple_(User.created_at, User.id) < tuple_(created_at, last_id))
+    return stmt
+
+
+def plain_count():
+    return select(func.count()).select_from(User).where(User.deleted_at.is_(None))
+
+
+def lambda_count():
+    return lambda_stmt(lambda: select(func.count()).select_from(User).where(User.deleted_at.is_(None)))
+
+
+def setup_session() -> Session:
+    engine = create_engine("sqlite://")
+    Role.__table__.create(engine)
+    User.__table__.create(engine)
+    session = Session(engine)
+    session.execute(insert(Role), [{"id": 1, "name": "Admin"}, {"id": 2, "name": "Member"}])
+    session.execute(insert(User), [
+        {"id": i, "email": f"user{i}@example.com", "password": "x", "name": f"user{i}", "role_id": 2,
+         "is_active": True, "created_at": datetime(2025, 1, 1), "updated_at": datetime(2025, 1, 1)}
+        for i in range(1, 1001)
+    ])
+    session.commit()
+    return session
+
+
+def bench(label: str, fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for i in range(repeat):
+        fn(i)
+    elapsed = (time.perf_counter() - started) / repeat * 1_000_000
+    print(f"  {label:<28} {elapsed:>8.1f} µs")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20000)
+    args = parser.parse_args()
+
+    session = setup_session()
+    dialect = postgresql.asyncpg.dialect()
+    cursor = (datetime(2025, 1, 2), 500)
+    cases = {
+        "get_user_by_id": (lambda i: plain_by_id(i % 1000 + 1), lambda i: lambda_by_id(i % 1000 + 1)),
+        "get_user_by_email": (lambda i: plain_by_email(f"user{i % 1000 + 1}@example.com"),
+                              lambda i: lambda_by_email(f"user{i % 1000 + 1}@example.com")),
+        "get_users (page)": (lambda i: plain_page(10, cursor), lambda i: lambda_page(10, cursor)),
+        "count_users": (lambda i: plain_count(), lambda i: lambda_count()),
+    }
+
+    for name, (plain, cached) in cases.items():
+        print(f"[{name}]")
+        bench("compile (no cache)", lambda i: plain(i).compile(dialect=dialect), args.repeat)
+        plain_us = bench("select() + execute", lambda i: session.execute(plain(i)).all(), args.repeat)
+        lambda_us = bench("lambda_stmt + execute", lambda i: session.execute(cached(i)).all(), args.repeat)
+        print(f"  -> {plain_us / lambda_us:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
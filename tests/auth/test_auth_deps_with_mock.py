@@ -0,0 +1,184 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi.security import HTTPAuthorizationCredentials
+from app.controller.auth.auth_deps import get_current_user, introspection_client_required
+from app.common.config import settings
+from app.common.jwt_utils import create_access_token, create_refresh_token
+from prometheus_client import REGISTRY
+from app.common.metrics import render_metrics
+from app.common.principal_cache import principal_cache
+from app.common.revocation import RevocationList
+from app.common.jwt_utils import decode_token
+from app.common.role_registry import role_registry
+from app.domain.auth.auth_schema import Principal
+
+
+def _credentials(user_id: int) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token({"sub": str(user_id)}))
+
+# 인증 주체 캐시 히트 시 DB를 조회하지 않는 케이스
+@pytest.mark.asyncio
+async def test_get_current_user_principal_cache_hit():
+    # Given: 캐시에 활성 사용자 주체 정보가 존재함
+    db = AsyncMock()
+    cached = Principal(id=5, role_name="Member", is_active=True)
+
+    # When: 인증 의존성 실행
+    with patch.object(principal_cache, "get", new_callable=AsyncMock, return_value=cached):
+        result = await get_current_user(_credentials(5), db)
+
+    # Then: 캐시된 주체가 반환되고, DB는 호출되지 않음
+    assert result == cached
+    db.execute.assert_not_called()
+
+# 캐시 미스 시 DB 조회 후 주체 정보를 캐싱하는 케이스
+@pytest.mark.asyncio
+async def test_get_current_user_cache_miss_then_store():
+    # Given: 캐시에 주체 정보가 없고, DB에는 사용자가 존재하며, 역할 목록이 로드되어 있음
+    role_registry.set_roles({1: "Admin", 2: "Member"})
+    result = MagicMock()
+    result.one_or_none.return_value = MagicMock(id=7, role_id=1, is_active=True)
+    db = AsyncMock()
+    db.execute.return_value = result
+
+    # When: 인증 의존성 실행
+    with patch.object(principal_cache, "get", new_callable=AsyncMock, return_value=None), \
+         patch.object(principal_cache, "set", new_callable=AsyncMock) as mock_set:
+        principal = await get_current_user(_credentials(7), db)
+
+    # Then: DB 조회 1회(roles 조회 없음) 결과로 주체가 구성되고 캐시에 저장됨
+    assert principal == Principal(id=7, role_name="Admin", is_active=True)
+    db.execute.assert_awaited_once()
+    mock_set.assert_awaited_once_with(principal)
+
+# 비활성화된 사용자는 캐시에 있어도 차단되는 케이스
+@pytest.mark.asyncio
+async def test_get_current_user_inactive_principal_rejected():
+    # Given: 캐시에 비활성 사용자 주체 정보가 존재함
+    db = AsyncMock()
+    cached = Principal(id=9, role_name="Member", is_active=False)
+
+    # When / Then: 404 예외 발생
+    with patch.object(principal_cache, "get", new_callable=AsyncMock, return_value=cached):
+        with pytest.raises(Exception) as e:
+            await get_current_user(_credentials(9), db)
+
+    assert "존재하지 않는 사용자입니다." in str(e.value)
+
+# 인증 단계별 소요 시간이 히스토그램에 기록되고 Prometheus 형식으로 노출되는 케이스
+@pytest.mark.asyncio
+async def test_get_current_user_records_stage_latency():
+    # Given: 현재까지 기록된 인증/JWT 단계 관측 횟수
+    def count(stage: str) -> float:
+        return REGISTRY.get_sample_value("app_stage_latency_seconds_count", {"stage": stage}) or 0
+
+    before_auth, before_jwt = count("auth.get_current_user"), count("jwt.decode")
+    cached = Principal(id=5, role_name="Member", is_active=True)
+
+    # When: 인증 의존성 실행
+    with patch.object(principal_cache, "get", new_callable=AsyncMock, return_value=cached):
+        await get_current_user(_credentials(5), AsyncMock())
+
+    # Then: 단계별로 한 번씩 기록되고 /metrics 본문에 포함됨
+    assert count("auth.get_current_user") == before_auth + 1
+    assert count("jwt.decode") == before_jwt + 1
+    body, _ = render_metrics()
+    assert b'app_stage_latency_seconds_count{stage="auth.get_current_user"}' in body
+
+# refresh token으로 API 호출 시 401을 반환하는 케이스
+@pytest.mark.asyncio
+async def test_get_current_user_rejects_refresh_token():
+    # Given: access token 대신 refresh token
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_refresh_token({"sub": "5"}))
+
+    # When / Then: 401 예외 발생
+    with pytest.raises(Exception) as e:
+        await get_current_user(credentials, AsyncMock())
+
+    assert "토큰이 유효하지 않습니다." in str(e.value)
+
+# 폐기 목록에 없는 토큰은 Redis 조회 없이 통과하고, 폐기된 토큰은 401을 반환하는 케이스
+@pytest.mark.asyncio
+async def test_get_current_user_rejects_revoked_token():
+    # Given: 두 개의 access token 중 하나만 폐기됨
+    revocations = RevocationList(AsyncMock(), capacity=1000, error_rate=0.001, max_token_lifetime=3600)
+    revocations._redis.exists.return_value = True
+    active, revoked = _credentials(5), _credentials(5)
+    claims = decode_token(revoked.credentials)
+    await revocations.revoke(claims["jti"], claims["exp"])
+    cached = Principal(id=5, role_name="Member", is_active=True)
+
+    # When: 두 토큰으로 인증 의존성 실행
+    with patch("app.controller.auth.auth_deps.revocation_list", revocations), \
+         patch.object(principal_cache, "get", new_callable=AsyncMock, return_value=cached):
+        assert await get_current_user(active, AsyncMock()) == cached
+        with pytest.raises(Exception) as e:
+            await get_current_user(revoked, AsyncMock())
+
+    # Then: 폐기된 토큰만 Redis로 확인 후 401
+    assert "토큰이 유효하지 않습니다." in str(e.value)
+    revocations._redis.exists.assert_awaited_once_with(f"revoked:{claims['jti']}")
+
+# 다른 워커의 폐기 내역을 증분 동기화하는 케이스
+@pytest.mark.asyncio
+async def test_revocation_list_sync_is_incremental():
+    # Given: Redis 변경 로그에 다른 워커가 폐기한 jti가 있음
+    revocations = RevocationList(AsyncMock(), capacity=1000, error_rate=0.001, max_token_lifetime=3600)
+    revocations._redis.read_log.side_effect = [[("100-0", "jti-1"), ("105-0", "jti-2")], [("110-0", "jti-3")]]
+
+    # When: 두 번 동기화
+    await revocations.sync()
+    await revocations.sync()
+
+    # Then: 두 번째는 마지막으로 반영한 로그 id 이후를 조회하고, 모든 jti가 Bloom filter에 반영됨
+    assert revocations._redis.read_log.await_args_list[0].args == ("revoked:log", None)
+    assert revocations._redis.read_log.await_args_list[1].args == ("revoked:log", "105-0")
+    assert all(jti in revocations._bloom for jti in ("jti-1", "jti-2", "jti-3"))
+    assert "jti-unknown" not in revocations._bloom
+
+# 검증된 토큰은 서명 검증 없이 캐시된 claims를 반환하는 케이스
+def test_decode_token_uses_verified_token_cache():
+    # Given: 한 번 검증된 access token
+    token = create_access_token({"sub": "5"})
+    first = decode_token(token)
+
+    # When: 같은 토큰을 다시 디코딩
+    with patch("app.common.jwt_utils.jwt.decode") as mock_decode:
+        second = decode_token(token)
+
+    # Then: 서명 검증을 생략하고 같은 claims의 사본을 반환
+    mock_decode.assert_not_called()
+    assert second == first and second is not first
+
+# 새 폐기 내역이 없으면 반복 동기화해도 항목 수가 늘지 않고, 용량을 넘은 뒤 재구성하면 다시 용량 이내가 되는 케이스
+@pytest.mark.asyncio
+async def test_revocation_list_count_tracks_new_jtis_and_rebuild_resizes():
+    # Given: 용량 2인 폐기 목록, Redis 로그에는 같은 ms에 기록된 3건 (같은 내역을 반복 조회)
+    revocations = RevocationList(AsyncMock(), capacity=2, error_rate=0.001, max_token_lifetime=3600)
+    log = [("100-0", "jti-1"), ("100-1", "jti-2"), ("100-2", "jti-3")]
+    revocations._redis.read_log.return_value = log
+
+    # When: 세 번 동기화 후 재구성
+    for _ in range(3):
+        await revocations.sync()
+    count_after_sync = revocations._bloom.count
+    await revocations.rebuild()
+
+    # Then: 항목 수는 새 jti만큼만 늘고, 재구성된 Bloom filter의 용량은 항목 수 이상
+    assert count_after_sync == 3
+    assert revocations._bloom.count == 3
+    assert revocations._bloom.count <= revocations._bloom.capacity
+
+# 게이트웨이 토큰이 일치하면 통과하고, ASCII가 아닌 헤더 값은 500이 아니라 401을 반환하는 케이스
+@pytest.mark.asyncio
+async def test_introspection_client_required_compares_token_bytes():
+    # Given: 인트로스펙션 토큰이 설정됨
+    with patch.object(settings, "INTROSPECTION_TOKEN", "secret"):
+        # When: 일치하는 토큰과 ASCII가 아닌 토큰으로 각각 호출
+        allowed = await introspection_client_required("secret", None, AsyncMock())
+        with pytest.raises(Exception) as e:
+            await introspection_client_required("비밀", None, AsyncMock())
+
+    # Then: 일치하는 토큰은 통과, ASCII가 아닌 토큰은 인증 실패(401)
+    assert allowed is None
+    assert getattr(e.value, "status_code", None) == 401
@@ -1,18 +1,27 @@
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
+from fastapi import HTTPException
 from app.service.auth_service import AuthService
 from app.db.models.user_model import User, Role
 from app.domain.auth.auth_schema import SignupRequest, SigninRequest
-from app.common.security import hash_password
+from passlib.hash import bcrypt
+from app.common.config import settings
+from app.common.security import hash_password, verify_password, password_hasher
+from app.common.role_registry import role_registry
+from app.common.refresh_token_store import refresh_token_store
+from app.common.revocation import revocation_list
+from app.common.principal_cache import principal_cache
+from app.common.jwt_utils import create_access_token, create_refresh_token, decode_token
+from app.domain.auth.auth_schema import Principal
 
 # 회원가입 성공 케이스 테스트
 @pytest.mark.asyncio
 async def test_signup_success():
-    # Given: 사용자 정보가 존재하지 않고, 기본 역할(Role)이 반환됨
+    # Given: 사용자 정보가 존재하지 않고, 역할 목록이 메모리에 로드되어 있음
     repo = AsyncMock()
     repo.get_user_by_email.return_value = None
-    repo.get_member_role.return_value = Role(id=1, name="Member")
     repo.create_user.return_value = None
+    role_registry.set_roles({1: "Admin", 2: "Member"})
 
     service = AuthService(repo)
     signup_data = SignupRequest(
@@ -26,8 +35,8 @@ async def test_signup_success():
 
     # Then: 올바르게 저장 메서드들이 호출되고, 비밀번호는 해시 처리되어야 함
     repo.get_user_by_email.assert_called_once_with("test@example.com")
-    repo.get_member_role.assert_called_once()
     repo.create_user.assert_called_once()
+    assert repo.create_user.call_args[0][0].role_id == 2
     assert repo.create_user.call_args[0][0].password != "securepass"
 
 # 중복 이메일로 회원가입 실패 케이스
@@ -71,11 +80,14 @@ async def test_signin_success():
     signin_data = SigninRequest(email="loginuser@example.com", password=raw_password)
 
     # When: 로그인 요청
-    result = await service.signin(signin_data)
+    with patch.object(refresh_token_store, "save", new_callable=AsyncMock) as mock_save:
+        result = await service.signin(signin_data)
 
-    # Then: 토큰이 포함된 응답 반환
+    # Then: 토큰이 포함된 응답 반환, refresh token ID가 저장됨
     assert "access_token" in result.model_dump()
     assert "refresh_token" in result.model_dump()
+    claims = decode_token(result.refresh_token)
+    mock_save.assert_awaited_once_with(claims["jti"], claims["fam"])
 
 # 로그인 실패 - 비밀번호 불일치
 @pytest.mark.asyncio
@@ -104,3 +116,161 @@ async def test_signin_wrong_password():
         await service.signin(signin_data)
 
     assert "이메일 또는 비밀번호가 일치하지 않습니다." in str(e.value)
+
+# 해싱 executor 포화 시 503 반환 케이스
+@pytest.mark.asyncio
+async def test_signin_rejected_when_hasher_saturated():
+    # Given: 해싱 대기열이 가득 찬 상태
+    user = User(id=1, email="busy@example.com", password=hash_password("pw"), role=Role(name="Member"))
+    repo = AsyncMock()
+    repo.get_user_by_email.return_value = user
+
+    service = AuthService(repo)
+    signin_data = SigninRequest(email="busy@example.com", password="pw")
+
+    # When / Then: 검증을 시도하지 않고 즉시 503 예외 발생
+    with patch.object(password_hasher, "max_pending", 0):
+        with pytest.raises(HTTPException) as e:
+            await service.signin(signin_data)
+
+    assert e.value.status_code == 503
+
+# refresh token 회전: 기존 토큰을 소비하고 같은 계열로 새 토큰 발급
+@pytest.mark.asyncio
+async def test_refresh_rotates_token_within_family():
+    # Given: 저장소에 유효한 refresh token, 캐시에 활성 사용자
+    token = create_refresh_token({"sub": "3", "jti": "old-jti", "fam": "fam-1"})
+    service = AuthService(AsyncMock())
+    principal = Principal(id=3, role_name="Member", is_active=True)
+
+    # When: 토큰 재발급
+    with patch.object(refresh_token_store, "consume", new_callable=AsyncMock, return_value="fam-1") as mock_consume, \
+         patch.object(refresh_token_store, "save", new_callable=AsyncMock) as mock_save, \
+         patch.object(principal_cache, "get", new_callable=AsyncMock, return_value=principal):
+        result = await service.refresh(token)
+
+    # Then: 기존 jti 소비 후 같은 계열의 새 jti 저장
+    claims = decode_token(result.refresh_token)
+    mock_consume.assert_awaited_once_with("old-jti")
+    mock_save.assert_awaited_once_with(claims["jti"], "fam-1")
+    assert claims["jti"] != "old-jti"
+    assert claims["fam"] == "fam-1"
+    assert decode_token(result.access_token)["typ"] == "access"
+
+# 이미 사용된 refresh token 재사용 시 계열 전체 폐기
+@pytest.mark.asyncio
+async def test_refresh_reuse_revokes_family():
+    # Given: 이미 소비된 refresh token
+    token = create_refresh_token({"sub": "3", "jti": "used-jti", "fam": "fam-2"})
+    service = AuthService(AsyncMock())
+
+    # When / Then: 401 예외와 함께 계열 폐기
+    with patch.object(refresh_token_store, "consume", new_callable=AsyncMock, return_value=None), \
+         patch.object(refresh_token_store, "revoke_family", new_callable=AsyncMock) as mock_revoke:
+        with pytest.raises(HTTPException) as e:
+            await service.refresh(token)
+
+    assert e.value.status_code == 401
+    mock_revoke.assert_awaited_once_with("fam-2")
+
+# 로그아웃 시 access token과 같은 로그인 세션의 refresh token을 폐기
+@pytest.mark.asyncio
+async def test_signout_revokes_access_token_and_family():
+    # Given: 로그인 세션의 access / refresh token
+    access_token = create_access_token({"sub": "3"})
+    refresh_token = create_refresh_token({"sub": "3", "jti": "r-jti", "fam": "fam-3"})
+    service = AuthService(AsyncMock())
+
+    # When: 로그아웃
+    with patch.object(revocation_list, "revoke", new_callable=AsyncMock) as mock_revoke, \
+         patch.object(refresh_token_store, "revoke_family", new_callable=AsyncMock) as mock_revoke_family:
+        await service.signout(access_token, refresh_token)
+
+    # Then: access token의 jti를 만료 시각까지 폐기하고, refresh token 계열도 폐기
+    claims = decode_token(access_token)
+    mock_revoke.assert_awaited_once_with(claims["jti"], claims["exp"])
+    mock_revoke_family.assert_awaited_once_with("fam-3")
+
+# 여러 토큰을 일괄 검증: 캐시 미스 사용자만 한 번에 DB 조회하고, 유효하지 않은 토큰은 active=False
+@pytest.mark.asyncio
+async def test_introspect_batch_loads_principals_in_bulk():
+    # Given: 캐시에 있는 사용자(1), 캐시에 없는 사용자(2, 3 - 3은 비활성), refresh token, 위조 토큰
+    repo = AsyncMock()
+    repo.get_principals.return_value = [
+        Principal(id=2, role_name="Admin", is_active=True),
+        Principal(id=3, role_name="Member", is_active=False),
+    ]
+    service = AuthService(repo)
+    tokens = [
+        create_access_token({"sub": "1"}),
+        create_access_token({"sub": "2"}),
+        create_access_token({"sub": "3"}),
+        create_refresh_token({"sub": "1"}),
+        "not-a-token",
+        create_access_token({"sub": "2"}),
+    ]
+
+    # When: 일괄 검증
+    with patch.object(principal_cache, "get_many", new_callable=AsyncMock,
+                      return_value={1: Principal(id=1, role_name="Member", is_active=True)}), \
+         patch.object(principal_cache, "set_many", new_callable=AsyncMock) as mock_set_many:
+        results = await service.introspect(tokens)
+
+    # Then: 요청 순서대로 결과를 반환하고, 캐시 미스 사용자만 한 번에 조회하여 캐싱
+    assert [result.active for result in results] == [True, True, False, False, False, True]
+    assert (results[0].sub, results[0].role) == ("1", "Member")
+    assert results[1].role == "Admin" and results[1].exp == decode_token(tokens[1])["exp"]
+    assert sorted(repo.get_principals.await_args.args[0]) == [2, 3]
+    mock_set_many.assert_awaited_once()
+
+# 저장된 해시의 비용이 설정과 다르면 로그인 성공 시 새 비용으로 다시 해싱하여 저장
+@pytest.mark.asyncio
+async def test_signin_rehashes_password_when_cost_changed():
+    # Given: 현재 설정(BCRYPT_ROUNDS)보다 낮은 비용으로 저장된 비밀번호
+    stored_hash = bcrypt.using(rounds=4).hash("pw")
+    user = User(id=1, email="old@example.com", password=stored_hash, role=Role(name="Member"))
+    repo = AsyncMock()
+    repo.get_user_by_email.return_value = user
+    service = AuthService(repo)
+
+    # When: 로그인
+    with patch.object(refresh_token_store, "save", new_callable=AsyncMock):
+        await service.signin(SigninRequest(email="old@example.com", password="pw"))
+
+    # Then: 설정된 비용의 새 해시로 저장되고, 새 해시로도 같은 비밀번호가 검증됨
+    user_id, new_hash = repo.update_password.await_args.args
+    assert user_id == 1
+    assert bcrypt.from_string(new_hash).rounds == settings.BCRYPT_ROUNDS
+    assert verify_password("pw", new_hash)
+
+# Redis 장애 시 refresh token 재발급은 500이 아니라 503을 반환
+@pytest.mark.asyncio
+async def test_refresh_returns_503_when_token_store_unavailable():
+    # Given: 유효한 refresh token, Redis 연결 실패
+    token = create_refresh_token({"sub": "3", "jti": "some-jti", "fam": "fam-4"})
+    service = AuthService(AsyncMock())
+
+    # When / Then: 503 예외 발생 (Retry-After 포함)
+    with patch.object(refresh_token_store._redis, "getdel", new_callable=AsyncMock,
+                      side_effect=ConnectionError("redis down")):
+        with pytest.raises(HTTPException) as e:
+            await service.refresh(token)
+
+    assert e.value.status_code == 503
+    assert e.value.headers == {"Retry-After": "1"}
+
+# Redis 장애로 access token을 폐기할 수 없으면 로그아웃은 500이 아니라 503을 반환
+@pytest.mark.asyncio
+async def test_signout_returns_503_when_revocation_store_unavailable():
+    # Given: 유효한 access token, Redis 연결 실패
+    access_token = create_access_token({"sub": "3"})
+    service = AuthService(AsyncMock())
+
+    # When / Then: 503 예외 발생 (Retry-After 포함)
+    with patch.object(revocation_list._redis, "set_and_log", new_callable=AsyncMock,
+                      side_effect=ConnectionError("redis down")):
+        with pytest.raises(HTTPException) as e:
+            await service.signout(access_token)
+
+    assert e.value.status_code == 503
+    assert e.value.headers == {"Retry-After": "1"}
@@ -0,0 +1,68 @@
+import base64
+import hashlib
+import hmac
+import json
+from unittest.mock import patch
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from jose import jwt
+from app.common.jwt_keys import KeyRing
+from app.common.jwt_utils import create_access_token, decode_token
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+def _forge_hs256(claims: dict, secret: bytes, kid: str) -> str:
+    signing_input = f"{_b64(json.dumps({'alg': 'HS256', 'kid': kid}).encode())}.{_b64(json.dumps(claims).encode())}"
+    signature = hmac.new(secret, signing_input.encode(), hashlib.sha256).digest()
+    return f"{signing_input}.{_b64(signature)}"
+
+def _write_key(directory, kid: str) -> bytes:
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    (directory / f"{kid}.pem").write_bytes(pem)
+    return private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+
+# 키 교체 후에도 이전 키로 서명된 토큰을 검증하고, JWKS에 두 키를 모두 공개하는 케이스
+def test_key_rotation_keeps_previous_key_valid(tmp_path):
+    # Given: 이전 키로 발급된 토큰
+    _write_key(tmp_path, "2025-01")
+    old_ring = KeyRing("ES256", secret="", keys_dir=str(tmp_path))
+    with patch("app.common.jwt_utils.key_ring", old_ring):
+        old_token = create_access_token({"sub": "1"})
+
+    # When: 새 키를 추가하여 서명 키로 교체
+    _write_key(tmp_path, "2025-02")
+    ring = KeyRing("ES256", secret="", keys_dir=str(tmp_path))
+    with patch("app.common.jwt_utils.key_ring", ring):
+        new_token = create_access_token({"sub": "2"})
+        old_claims = decode_token(old_token)
+
+    # Then: 새 토큰은 새 kid로 서명되고, 이전 토큰도 검증되며, JWKS에는 두 공개키가 포함됨
+    assert jwt.get_unverified_header(old_token)["kid"] == "2025-01"
+    assert jwt.get_unverified_header(new_token)["kid"] == "2025-02"
+    assert old_claims["sub"] == "1"
+    keys = ring.jwks()["keys"]
+    assert [key["kid"] for key in keys] == ["2025-01", "2025-02"]
+    assert all(key["kty"] == "EC" and "d" not in key for key in keys)
+
+# 알 수 없는 kid이거나 공개키를 HMAC 비밀키로 악용한 토큰은 거부하는 케이스
+def test_decode_rejects_unknown_kid_and_algorithm_confusion(tmp_path):
+    # Given: ES256 키 목록과, 공개키 PEM을 HS256 비밀키로 사용해 위조한 토큰
+    public_pem = _write_key(tmp_path, "k1")
+    ring = KeyRing("ES256", secret="", keys_dir=str(tmp_path))
+    forged = _forge_hs256({"sub": "1"}, public_pem, kid="k1")
+    unknown = jwt.encode({"sub": "1"}, "secret", algorithm="HS256", headers={"kid": "nope"})
+    legacy = jwt.encode({"sub": "1"}, "secret", algorithm="HS256")
+
+    # When: 디코딩
+    with patch("app.common.jwt_utils.key_ring", ring):
+        results = [decode_token(token) for token in (forged, unknown, legacy)]
+
+    # Then: 모두 거부됨 (kid 없는 HMAC 토큰은 전환 허용 설정이 없으면 거부)
+    assert results == [None, None, None]
@@ -0,0 +1,90 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException
+from app.common.rate_limiter import RateLimiter, parse_networks
+from app.controller.auth.auth_deps import rate_limited
+
+
+def _limiter() -> RateLimiter:
+    return RateLimiter(AsyncMock(), window=60, local_maxsize=100)
+
+# 로컬 토큰 버킷이 비면 Redis를 조회하지 않고 거절하는 케이스
+@pytest.mark.asyncio
+async def test_rate_limiter_rejects_locally_after_bucket_empty():
+    # Given: 이메일당 분당 3회 제한, Redis는 항상 허용
+    limiter = _limiter()
+    limiter._redis.sliding_window_hit.return_value = 0
+
+    # When: 같은 이메일로 4회 요청
+    results = [await limiter.hit([("rl:signin:email:a@example.com", 3)]) for _ in range(4)]
+
+    # Then: 3회까지 허용(Redis 확인), 4번째는 로컬에서 약 20초(60/3) 후 재시도로 거절
+    assert results[:3] == [0, 0, 0]
+    assert 19 < results[3] <= 20
+    assert limiter._redis.sliding_window_hit.await_count == 3
+
+# 다른 워커까지 합산한 Redis 슬라이딩 윈도우 결과로 거절하고, Redis 장애 시에는 허용하는 케이스
+@pytest.mark.asyncio
+async def test_rate_limiter_uses_redis_window_and_fails_open():
+    # Given: Redis 기준으로 이미 제한을 넘은 상태, 이후 Redis 장애
+    limiter = _limiter()
+    limiter._redis.sliding_window_hit.side_effect = [1500, ConnectionError("down")]
+    limits = [("rl:signin:ip:10.0.0.1", 30), ("rl:signin:email:a@example.com", 5)]
+
+    # When: 두 번 요청
+    rejected = await limiter.hit(limits)
+    allowed = await limiter.hit(limits)
+
+    # Then: 첫 요청은 1.5초 후 재시도로 거절, 두 키를 한 번에 확인하며, 장애 시에는 허용
+    assert rejected == 1.5
+    assert allowed == 0
+    keys, limits_arg = limiter._redis.sliding_window_hit.await_args_list[0].args
+    assert keys == ["rl:signin:ip:10.0.0.1", "rl:signin:email:a@example.com"]
+    assert limits_arg == [30, 5]
+
+# 로그인 의존성이 IP와 본문의 이메일(소문자)로 제한하고, 초과 시 429와 Retry-After를 반환하는 케이스
+@pytest.mark.asyncio
+async def test_rate_limited_dependency_raises_429_with_retry_after():
+    # Given: 요청 본문에 이메일이 있고, 제한을 넘은 상태
+    request = MagicMock()
+    request.client.host = "10.0.0.1"
+    request.json = AsyncMock(return_value={"email": " User@Example.com", "password": "pw"})
+
+    # When / Then: 429 예외 발생
+    with patch("app.controller.auth.auth_deps.rate_limiter.hit", new_callable=AsyncMock,
+               return_value=2.2) as mock_hit:
+        with pytest.raises(HTTPException) as e:
+            await rate_limited("signin")(request)
+
+    assert e.value.status_code == 429
+    assert e.value.headers == {"Retry-After": "3"}
+    mock_hit.assert_awaited_once_with(
+        [("rl:signin:ip:10.0.0.1", 30), ("rl:signin:email:user@example.com", 5)]
+    )
+
+# nginx 뒤의 서로 다른 클라이언트는 별도 키로 제한하고, 신뢰하지 않는 연결의 헤더는 무시하는 케이스
+@pytest.mark.asyncio
+async def test_rate_limited_dependency_uses_forwarded_ip_from_trusted_proxy():
+    # Given: 같은 nginx(172.18.0.5)를 거친 두 클라이언트와, 헤더를 위조한 직접 연결
+    def _request(peer: str, forwarded: str):
+        request = MagicMock()
+        request.client.host = peer
+        request.headers = {"x-forwarded-for": forwarded}
+        request.json = AsyncMock(side_effect=ValueError)
+        return request
+
+    requests = [
+        _request("172.18.0.5", "203.0.113.7"),
+        _request("172.18.0.5", "1.2.3.4, 198.51.100.9"),
+        _request("198.51.100.20", "203.0.113.7"),
+    ]
+
+    # When: 각 요청에 대해 의존성 실행
+    with patch("app.controller.auth.auth_deps.trusted_proxies", parse_networks("172.16.0.0/12")), \
+         patch("app.controller.auth.auth_deps.rate_limiter.hit", new_callable=AsyncMock, return_value=0) as mock_hit:
+        for request in requests:
+            await rate_limited("signin")(request)
+
+    # Then: 프록시를 거친 요청은 실제 클라이언트 IP(위조된 앞부분 제외)로, 직접 연결은 연결 주소로 제한
+    keys = [call.args[0][0][0] for call in mock_hit.await_args_list]
+    assert keys == ["rl:signin:ip:203.0.113.7", "rl:signin:ip:198.51.100.9", "rl:signin:ip:198.51.100.20"]
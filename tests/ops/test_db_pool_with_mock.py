@@ -0,0 +1,30 @@
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+from app.db.pool import InstrumentedQueuePool
+
+# 풀 크기를 넘는 체크아웃과 대기 시간 초과가 통계에 기록되는 케이스
+@pytest.mark.asyncio
+async def test_instrumented_pool_records_overflow_and_timeouts():
+    # Given: pool_size 1, max_overflow 1, 대기 시간 0.01초인 풀
+    pool = InstrumentedQueuePool(creator=MagicMock, pool_size=1, max_overflow=1, timeout=0.01)
+
+    # When: 커넥션 3개를 연속 요청 (세 번째는 대기 후 실패)
+    first = await greenlet_spawn(pool.connect)
+    second = await greenlet_spawn(pool.connect)
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    # Then: 사용 중 2개(overflow 1), overflow 체크아웃 1회, 타임아웃 1회, 대기 시간 기록
+    stats = pool.stats()
+    assert stats["checked_out"] == 2
+    assert stats["peak_in_use"] == 2
+    assert stats["overflow_checkouts"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["wait_max_ms"] >= 10
+
+    # 반납 후에는 사용 중 커넥션이 없음
+    first.close()
+    second.close()
+    assert pool.stats()["checked_out"] == 0
@@ -0,0 +1,47 @@
+import time
+import pytest
+from unittest.mock import patch
+from app.common.config import settings
+from app.common.profiler import ProfilerMiddleware, ProfileStore
+
+
+async def busy_app(scope, receive, send):
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def _call(middleware, headers: list):
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/users/1", "headers": headers}
+    await middleware(scope, None, send)
+    return dict(sent[0]["headers"])
+
+# 관리자 토큰 헤더가 있는 요청만 프로파일링하여 저장하는 케이스
+@pytest.mark.asyncio
+async def test_profiler_middleware_profiles_requests_with_token(tmp_path):
+    # Given: 토큰이 설정된 프로파일러, 샘플링 비율 0
+    store = ProfileStore(str(tmp_path), max_profiles=10)
+    middleware = ProfilerMiddleware(busy_app, store=store)
+
+    # When: 토큰 헤더가 있는 요청과 없는 요청을 각각 처리
+    with patch.object(settings, "PROFILER_TOKEN", "secret"), \
+         patch.object(settings, "PROFILER_SAMPLE_RATE", 0.0):
+        profiled = await _call(middleware, [(b"x-profile", b"secret")])
+        skipped = await _call(middleware, [])
+        non_ascii = await _call(middleware, [(b"x-profile", "비밀".encode())])
+
+    # Then: 토큰 요청만 X-Profile-Id가 붙고, collapsed stack이 저장됨
+    profile_id = profiled[b"x-profile-id"].decode()
+    assert b"x-profile-id" not in skipped
+    assert b"x-profile-id" not in non_ascii
+    assert [profile["id"] for profile in store.list()] == [profile_id]
+    content = store.load(profile_id)
+    assert "busy_app (test_profiler_with_mock.py" in content
+    assert store.load("../etc/passwd") is None
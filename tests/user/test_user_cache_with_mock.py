@@ -0,0 +1,252 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from app.common.cache_loader import get_or_load
+from app.common.single_flight import SingleFlight
+from app.common.config import settings
+from app.common.redis import RedisCache, TieredCache
+from app.common.principal_cache import PrincipalCache
+from app.db.models.user_model import User, Role
+from app.domain.auth.auth_schema import Principal
+from app.service.user_service import UserService
+
+
+def _tiered_cache() -> TieredCache:
+    cache = TieredCache(maxsize=10, ttl=30, prefixes=("user:",), channel="cache:invalidate")
+    cache._redis = AsyncMock()
+    return cache
+
+# L1 캐시 히트 시 Redis를 조회하지 않는 케이스
+@pytest.mark.asyncio
+async def test_tiered_cache_serves_hot_key_from_l1():
+    # Given: Redis에 사용자 캐시가 존재함
+    cache = _tiered_cache()
+    cache._redis.get.return_value = '{"id": 1, "email": "hot@example.com"}'
+
+    # When: 같은 키를 두 번 조회
+    first = await cache.get_json("user:1")
+    second = await cache.get_json("user:1")
+
+    # Then: Redis는 한 번만 조회되고, 두 번째는 L1에서 반환됨
+    assert first == second == {"id": 1, "email": "hot@example.com"}
+    cache._redis.get.assert_awaited_once_with("user:1")
+    assert cache.stats()["l1_hits"] == 1
+    assert cache.stats()["l1_misses"] == 1
+
+# L1 대상이 아닌 키는 매번 Redis를 조회하는 케이스
+@pytest.mark.asyncio
+async def test_tiered_cache_bypasses_l1_for_other_prefixes():
+    # Given: 목록 캐시 키
+    cache = _tiered_cache()
+    cache._redis.get.return_value = '{"total": 1}'
+
+    # When: 두 번 조회
+    await cache.get_json("users:v0:abc")
+    await cache.get_json("users:v0:abc")
+
+    # Then: 두 번 모두 Redis 조회
+    assert cache._redis.get.await_count == 2
+
+# 삭제 시 무효화 메시지를 발행하고, 수신한 무효화는 L1과 리스너에 반영되는 케이스
+@pytest.mark.asyncio
+async def test_tiered_cache_delete_publishes_invalidation():
+    # Given: L1에 사용자 캐시가 있고, 무효화 리스너가 등록됨
+    cache = _tiered_cache()
+    await cache.set("user:1", {"id": 1})
+    received = []
+    cache.add_invalidation_listener(received.append)
+
+    # When: 키 삭제 및 다른 워커로부터 무효화 메시지 수신
+    await cache.delete("user:1")
+    await cache.set("user:2", {"id": 2})
+    cache._invalidate_local("user:2")
+
+    # Then: pub/sub으로 무효화가 발행되고, L1과 리스너에서 제거됨
+    cache._redis.publish.assert_awaited_once_with("cache:invalidate", "user:1")
+    assert cache._l1.get("user:1") is None
+    assert cache._l1.get("user:2") is None
+    assert received == ["user:2"]
+
+# 캐시 미스 시 동시 요청이 한 번의 DB 조회로 합쳐지는 케이스 (single-flight)
+@pytest.mark.asyncio
+async def test_get_user_concurrent_misses_coalesced():
+    # Given: 캐시가 비어 있고, DB 조회가 잠시 걸림
+    user = User(id=4, email="hot@example.com", name="Hot", role=Role(name="Member"))
+
+    async def slow_lookup(user_id):
+        await asyncio.sleep(0.01)
+        return user
+
+    repo = AsyncMock()
+    repo.get_user_by_id.side_effect = slow_lookup
+    service = UserService(repo)
+    current_user = Principal(id=1, role_name="Admin", is_active=True)
+
+    # When: 같은 사용자를 동시에 20번 조회
+    with patch("app.common.redis.redis_cache.get_json", return_value=None), \
+         patch("app.common.redis.redis_cache.set", new_callable=AsyncMock) as mock_set:
+        results = await asyncio.gather(*(service.get_user(4, current_user) for _ in range(20)))
+
+    # Then: DB 조회와 캐시 저장은 한 번씩만 수행되고, 모두 같은 결과를 받음
+    assert all(result["email"] == "hot@example.com" for result in results)
+    repo.get_user_by_id.assert_awaited_once_with(4)
+    mock_set.assert_awaited_once()
+
+# 다른 워커가 락을 잡고 적재 중이면 DB 대신 채워진 캐시를 사용하는 케이스
+@pytest.mark.asyncio
+async def test_get_or_load_waits_for_other_worker_lock():
+    # Given: 워커 간 락 사용, 락은 이미 다른 워커가 보유, 잠시 후 캐시가 채워짐
+    redis = AsyncMock()
+    redis.get_json.side_effect = [None, None, {"id": 5}]
+    redis.acquire_lock.return_value = False
+    loader = AsyncMock()
+
+    # When: 캐시 조회 및 적재
+    with patch.object(settings, "CACHE_STAMPEDE_LOCK_ENABLED", True):
+        result = await get_or_load(redis, "user:5", loader)
+
+    # Then: loader는 실행되지 않고 다른 워커가 채운 값을 반환
+    assert result == {"id": 5}
+    loader.assert_not_awaited()
+
+# 새 형식(태그 + 바이너리)으로 저장하고, 이전 형식(JSON 문자열)도 읽는 케이스
+@pytest.mark.asyncio
+async def test_redis_cache_versioned_serializer_reads_legacy_json():
+    # Given: msgpack 직렬화 캐시, Redis에는 새 형식 값과 이전 JSON 값이 섞여 있음
+    cache = RedisCache(serializer="msgpack")
+    cache._redis = AsyncMock()
+    await cache.set("user:1", {"id": 1, "name": "새 형식"})
+    stored = cache._redis.set.await_args.args[1]
+    cache._redis.mget.return_value = [stored, b'{"id": 2, "name": "legacy"}', None]
+
+    # When: 여러 키 조회
+    values = await cache.mget_json(["user:1", "user:2", "user:3"])
+
+    # Then: 형식 태그(0x03)로 저장되고, 두 형식 모두 복원됨
+    assert stored[:1] == b"\x03"
+    assert values == [{"id": 1, "name": "새 형식"}, {"id": 2, "name": "legacy"}, None]
+
+# 무효화 직전에 DB에서 읽은 이전 주체 정보가 무효화 이후에 다시 캐시되지 않는 케이스
+@pytest.mark.asyncio
+async def test_principal_cache_rejects_stale_write_after_invalidate():
+    # Given: 메모리 기반 Redis 대용 객체와 주체 캐시
+    store = {}
+
+    async def _set(key, value, ex=300, nx=False):
+        if nx and key in store:
+            return False
+        store[key] = value
+        return True
+
+    redis = AsyncMock()
+    redis.get_json.side_effect = lambda key: store.get(key)
+    redis.set.side_effect = _set
+    redis.add_invalidation_listener = MagicMock()
+    cache = PrincipalCache(redis, local_maxsize=10, local_ttl=5, ttl=300, tombstone_ttl=10)
+    stale = Principal(id=7, role_name="Member", is_active=True)
+
+    # When: 캐시 미스 후 DB에서 활성 상태를 읽은 사이에 비활성화 + 무효화가 먼저 커밋되고, 이전 값 저장 시도
+    await cache.invalidate(7)
+    await cache.set(stale)
+
+    # Then: Redis와 프로세스 내 캐시 모두 이전 값을 반환하지 않음
+    assert store["principal:7"] == {"invalidated": True}
+    assert await cache.get(7) is None
+
+# 같은 키를 로드하던 leader 요청이 취소되어도 대기 중인 요청은 다시 로드해 결과를 받음
+@pytest.mark.asyncio
+async def test_single_flight_follower_retries_when_leader_cancelled():
+    # Given: 첫 호출은 멈춰 있고, 두 번째 호출부터 값을 반환하는 로더
+    flight = SingleFlight()
+    started = asyncio.Event()
+    calls = 0
+
+    async def _load():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await asyncio.sleep(10)
+        return "value"
+
+    leader = asyncio.create_task(flight.do("k", _load))
+    await started.wait()
+    follower = asyncio.create_task(flight.do("k", _load))
+    await asyncio.sleep(0)
+
+    # When: leader 요청이 취소됨 (클라이언트 연결 끊김 등)
+    leader.cancel()
+
+    # Then: leader만 취소되고, 대기자는 CancelledError 없이 다시 로드한 값을 받음
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await follower == "value"
+    assert calls == 2
+
+# L1 캐시를 사용하지 않아도 다른 워커의 무효화 메시지로 프로세스 내 인증 주체 캐시가 즉시 제거되는 케이스
+@pytest.mark.asyncio
+async def test_principal_cache_invalidated_across_workers_without_l1():
+    # Given: L1 없는 Redis 캐시를 쓰는 두 워커, 다른 워커(B)의 프로세스 내 캐시에 활성 상태가 남아 있음
+    worker_a, worker_b = RedisCache(), RedisCache()
+    worker_a._redis, worker_b._redis = AsyncMock(), AsyncMock()
+    worker_b._redis.get.return_value = None
+    cache_a = PrincipalCache(worker_a, local_maxsize=10, local_ttl=5, ttl=300, tombstone_ttl=10)
+    cache_b = PrincipalCache(worker_b, local_maxsize=10, local_ttl=5, ttl=300, tombstone_ttl=10)
+    active = Principal(id=7, role_name="Member", is_active=True)
+    cache_b._local.set(7, active)
+
+    # When: 워커 A에서 비활성화로 무효화하고, 워커 B가 발행된 메시지를 수신한 뒤 이전 값 저장 시도
+    await cache_a.invalidate(7)
+    channel, key = worker_a._redis.publish.await_args.args
+    worker_b._invalidate_local(key)
+    await cache_b.set(active)
+
+    # Then: 무효화 채널로 발행되고, 워커 B는 프로세스 내 캐시 대신 Redis를 조회
+    assert (channel, key) == ("cache:invalidate", "principal:7")
+    assert await cache_b.get(7) is None
+
+# 조기 갱신(XFetch) 사용 시 값과 TTL을 한 번에 조회하고, 만료 직전 값만 미리 갱신하는 케이스
+@pytest.mark.asyncio
+async def test_get_or_load_early_refresh_reads_value_and_ttl_together():
+    # Given: 조기 갱신 사용, 남은 TTL이 충분한 키와 곧 만료되는 키
+    redis = AsyncMock()
+    redis.get_json_with_ttl.side_effect = [({"id": 1}, 300_000), ({"id": 2}, 1)]
+    loader = AsyncMock(return_value={"id": 2, "fresh": True})
+
+    # When: 두 키를 조회
+    with patch.object(settings, "CACHE_EARLY_REFRESH_BETA", 1.0), \
+         patch("app.common.cache_loader.random.random", return_value=0.5):
+        fresh = await get_or_load(redis, "user:1", AsyncMock())
+        refreshed = await get_or_load(redis, "user:2", loader)
+
+    # Then: 캐시 히트당 조회는 1회(별도 PTTL 없음), 곧 만료되는 키만 다시 적재
+    assert fresh == {"id": 1}
+    assert refreshed == {"id": 2, "fresh": True}
+    assert redis.get_json_with_ttl.await_count == 2
+    redis.get_json.assert_not_awaited()
+    redis.pttl.assert_not_awaited()
+    loader.assert_awaited_once()
+
+# Redis 조회 중에 무효화 메시지를 받으면 조회한 이전 값을 L1에 넣지 않는 케이스
+@pytest.mark.asyncio
+async def test_tiered_cache_skips_l1_populate_when_invalidated_during_read():
+    # Given: Redis에서 이전 값을 읽는 동안 다른 워커의 무효화 메시지가 도착함
+    cache = _tiered_cache()
+    stale = cache._codec.encode({"id": 1, "name": "old"})
+
+    async def _get(key):
+        cache._invalidate_local(key)
+        return stale
+
+    cache._redis.get.side_effect = _get
+
+    # When: L1 미스 상태에서 조회
+    value = await cache.get_json("user:1")
+
+    # Then: 이번 요청은 읽은 값을 반환하지만, L1에는 남기지 않아 다음 조회는 Redis를 다시 읽음
+    assert value == {"id": 1, "name": "old"}
+    assert cache._l1.get("user:1") is None
+    cache._redis.get.side_effect = None
+    cache._redis.get.return_value = cache._codec.encode({"id": 1, "name": "new"})
+    assert await cache.get_json("user:1") == {"id": 1, "name": "new"}
+    assert cache._l1.get("user:1") == {"id": 1, "name": "new"}
@@ -0,0 +1,81 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from app.event.batch_acker import BatchAcker
+from app.event.user_event.user_consumer_runner import UserDeletedConsumer
+
+
+def _message(tag: int, body: bytes = b'{"user_id": 1}', headers: dict | None = None):
+    message = MagicMock()
+    message.delivery_tag = tag
+    message.body = body
+    message.headers = headers or {}
+    message.ack = AsyncMock()
+    message.nack = AsyncMock()
+    return message
+
+# 완료 순서가 뒤섞여도 연속 구간의 마지막 메시지로 한 번에 ack 하는지 확인
+@pytest.mark.asyncio
+async def test_batch_acker_acks_contiguous_range_with_multiple():
+    # Given: 3개의 메시지를 수신, 배치 크기 3
+    acker = BatchAcker(batch_size=3, flush_interval=60)
+    messages = [_message(tag) for tag in (1, 2, 3)]
+    for message in messages:
+        acker.track(message)
+
+    # When: 3 → 1 → 2 순서로 처리 완료
+    await acker.complete(messages[2])
+    await acker.complete(messages[0])
+    messages[0].ack.assert_not_awaited()
+    await acker.complete(messages[1])
+
+    # Then: 마지막 delivery tag(3)로 multiple ack 한 번만 전송
+    messages[2].ack.assert_awaited_once_with(multiple=True)
+    messages[0].ack.assert_not_awaited()
+    messages[1].ack.assert_not_awaited()
+
+# 처리 실패 시 재시도 큐로, 파싱 불가 메시지는 DLQ로 보내는지 확인
+@pytest.mark.asyncio
+async def test_consumer_routes_failures_to_retry_and_dead_letter_queues():
+    # Given: 처리 중 예외가 나는 메시지와 본문이 깨진 메시지
+    channel = MagicMock()
+    channel.default_exchange.publish = AsyncMock()
+    consumer = UserDeletedConsumer(channel)
+    failing = _message(1)
+    poison = _message(2, body=b"not-json")
+
+    # When: 두 메시지 처리
+    with patch("app.event.user_event.user_consumer_runner.handle_user_deleted",
+               new_callable=AsyncMock, side_effect=RuntimeError("boom")):
+        await consumer._slots.acquire()
+        await consumer._process(failing)
+    await consumer._slots.acquire()
+    await consumer._process(poison)
+
+    # Then: 첫 메시지는 1회차 재시도 큐로, 깨진 메시지는 DLQ로 발행
+    first, second = channel.default_exchange.publish.await_args_list
+    assert first.kwargs["routing_key"] == "user.deleted.retry.1"
+    assert first.args[0].headers["x-retry-count"] == 1
+    assert second.kwargs["routing_key"] == "user.deleted.dlq"
+
+# ack 실패가 예외로 전파되지 않고, 재연결 후에는 이전 채널의 tag를 ack 하지 않는지 확인
+@pytest.mark.asyncio
+async def test_batch_acker_survives_ack_failure_and_resets_on_reconnect():
+    # Given: 첫 ack가 채널 종료로 실패하는 메시지, 배치 크기 1
+    acker = BatchAcker(batch_size=1, flush_interval=60)
+    failing = _message(1)
+    failing.ack.side_effect = RuntimeError("channel closed")
+    acker.track(failing)
+
+    # When: 완료 처리(ack 실패) 후 재연결, 이전 채널의 메시지와 새 채널의 같은 tag 메시지 완료
+    await acker.complete(failing)
+    stale = _message(2)
+    acker.track(stale)
+    acker.reset()
+    fresh = _message(2)
+    acker.track(fresh)
+    await acker.complete(stale)
+    await acker.complete(fresh)
+
+    # Then: 예외 없이 진행되고, 이전 채널 메시지는 ack 하지 않으며 새 메시지만 ack
+    stale.ack.assert_not_awaited()
+    fresh.ack.assert_awaited_once_with(multiple=True)
@@ -0,0 +1,112 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi import HTTPException
+from app.common.role_registry import role_registry
+from app.common.security import hash_password, verify_password, PasswordHasher, password_hasher, \
+    import_password_hasher, HASH_MANY_CHUNK_SIZE
+from app.domain.user.user_enum import UserFileFormat
+from app.service.user_import_service import UserImportService
+
+
+async def _chunks(data: bytes, size: int = 7):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+# CSV 스트림을 배치 단위로 해싱/적재하고, 충돌과 오류 행을 집계하는 케이스
+@pytest.mark.asyncio
+async def test_import_users_csv_hashes_and_merges_in_batches():
+    # Given: 평문 비밀번호 행, 해싱된 비밀번호 행, 이메일 형식 오류 행 (배치 크기 2)
+    pre_hashed = hash_password("already")
+    csv_data = (
+        "email,password,password_hash,name\n"
+        "a@example.com,plain1234,,A\n"
+        f"b@example.com,,{pre_hashed},B\n"
+        "not-an-email,pass,,C\n"
+        "c@example.com,,,D\n"
+    ).encode()
+    role_registry.set_roles({1: "Admin", 2: "Member"})
+    repo = AsyncMock()
+    repo.copy_and_merge.return_value = (1, ["b@example.com"])
+    service = UserImportService(repo, batch_size=2)
+
+    # When: 가져오기 실행
+    with patch("app.common.redis.redis_cache.incr", new_callable=AsyncMock) as mock_incr:
+        result = await service.import_users(_chunks(csv_data), UserFileFormat.CSV)
+
+    # Then: 유효한 2행이 한 배치로 적재되고, 평문만 해싱됨
+    records, role_id, _ = repo.copy_and_merge.await_args.args
+    assert role_id == 2
+    assert [record[0] for record in records] == ["a@example.com", "b@example.com"]
+    assert verify_password("plain1234", records[0][1])
+    assert records[1][1] == pre_hashed
+    assert result.inserted == 1
+    assert result.conflicts == 1
+    assert result.conflict_emails == ["b@example.com"]
+    assert result.invalid == 2
+    assert result.errors[0].startswith("line 4:")
+    mock_incr.assert_awaited_once_with("users:gen")
+
+# API 가져오기는 로그인용 executor와 분리된 전용 executor에서 작은 단위로 해싱하는 케이스
+@pytest.mark.asyncio
+async def test_import_hashing_uses_dedicated_executor_in_small_chunks():
+    # Given: 기본 설정의 가져오기 서비스, 1개 스레드의 해싱 executor
+    service = UserImportService(AsyncMock())
+    hasher = PasswordHasher(executor_type="thread", max_workers=1)
+    submitted = []
+
+    def _hash_passwords(chunk):
+        submitted.append(len(chunk))
+        return [f"hashed:{password}" for password in chunk]
+
+    # When: 100개 비밀번호 해싱
+    with patch("app.common.security.hash_passwords", _hash_passwords):
+        hashes = await hasher.hash_many([str(i) for i in range(100)])
+    hasher.shutdown()
+
+    # Then: 로그인/회원가입 executor와 다른 hasher를 사용하고, 한 작업은 최대 HASH_MANY_CHUNK_SIZE개
+    assert service.hasher is import_password_hasher and service.hasher is not password_hasher
+    assert hashes == [f"hashed:{i}" for i in range(100)]
+    assert max(submitted) <= HASH_MANY_CHUNK_SIZE and sum(submitted) == 100
+
+# API 가져오기는 요청당 평문 비밀번호 행 수를 제한하고, 해싱된 행은 제한 없이 적재하는 케이스
+@pytest.mark.asyncio
+async def test_import_users_limits_plain_passwords_per_request():
+    # Given: 평문 3행과 해싱된 1행, 평문 상한 2
+    pre_hashed = hash_password("already")
+    csv_data = (
+        "email,password,password_hash,name\n"
+        "a@example.com,pass1,,A\n"
+        "b@example.com,pass2,,B\n"
+        "c@example.com,pass3,,C\n"
+        f"d@example.com,,{pre_hashed},D\n"
+    ).encode()
+    role_registry.set_roles({1: "Admin", 2: "Member"})
+    repo = AsyncMock()
+    repo.copy_and_merge.return_value = (3, [])
+    service = UserImportService(repo, max_plain_passwords=2)
+
+    # When: 가져오기 실행
+    with patch("app.common.redis.redis_cache.incr", new_callable=AsyncMock):
+        result = await service.import_users(_chunks(csv_data), UserFileFormat.CSV)
+
+    # Then: 상한을 넘은 평문 행만 invalid로 집계되고 나머지는 적재됨
+    records = repo.copy_and_merge.await_args.args[0]
+    assert [record[0] for record in records] == ["a@example.com", "b@example.com", "d@example.com"]
+    assert result.invalid == 1
+    assert result.errors[0].startswith("line 4: 평문 비밀번호는 요청당 2행까지")
+
+# Member 역할을 찾을 수 없으면 병합 전에 503으로 실패하는 케이스
+@pytest.mark.asyncio
+async def test_import_users_fails_before_merge_without_member_role():
+    # Given: Member 역할이 없는 역할 목록 (방금 로드되어 재조회하지 않음)
+    role_registry.set_roles({1: "Admin"})
+    repo = AsyncMock()
+    service = UserImportService(repo)
+
+    # When / Then: 503 예외, 병합하지 않음
+    with pytest.raises(HTTPException) as e:
+        await service.import_users(_chunks(b"email,password\na@example.com,pass1\n"), UserFileFormat.CSV)
+
+    assert e.value.status_code == 503
+    repo.copy_and_merge.assert_not_awaited()
+    role_registry.set_roles({1: "Admin", 2: "Member"})
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from prometheus_client import REGISTRY
+from app.event.event_publisher import EventPublisher
+from app.event.outbox_relay import OutboxRelay
+from app.event.user_event.user_publisher import build_user_deleted_event
+
+
+def _mock_connection():
+    exchange = AsyncMock()
+    channel = AsyncMock()
+    channel.is_closed = False
+    channel.declare_exchange.return_value = exchange
+    conn = AsyncMock()
+    conn.channel.return_value = channel
+    return conn, channel, exchange
+
+# 연속 발행 시 채널과 exchange를 재사용하는지 확인
+@pytest.mark.asyncio
+async def test_publish_reuses_pooled_channel_and_exchange():
+    # Given: 채널 풀 크기 1의 발행기
+    conn, channel, exchange = _mock_connection()
+    publisher = EventPublisher(pool_size=1)
+
+    relay = OutboxRelay(AsyncMock(), publisher, batch_size=10, poll_interval=1)
+    events = [build_user_deleted_event(user_id) for user_id in (1, 2)]
+    for event_id, event in enumerate(events, start=1):
+        event.id = event_id
+
+    # When: outbox relay가 사용자 탈퇴 이벤트를 두 번 발행
+    with patch("app.event.event_publisher.get_connection", new_callable=AsyncMock, return_value=conn):
+        for event in events:
+            await relay._publish(event)
+
+    # Then: 채널 생성과 exchange 선언은 한 번만 수행되고, 발행은 두 번 수행됨
+    conn.channel.assert_awaited_once()
+    channel.declare_exchange.assert_awaited_once_with("user.events", durable=True)
+    assert exchange.publish.await_count == 2
+    message = exchange.publish.await_args_list[1][0][0]
+    assert json.loads(message.body) == {"event": "USER_DELETED", "user_id": 2}
+
+# 닫힌 채널은 폐기하고 새 채널로 발행하는지 확인
+@pytest.mark.asyncio
+async def test_publish_reopens_closed_channel():
+    # Given: 이미 한 번 발행한 뒤 풀의 채널이 닫힘
+    conn, channel, exchange = _mock_connection()
+    publisher = EventPublisher(pool_size=1)
+
+    with patch("app.event.event_publisher.get_connection", new_callable=AsyncMock, return_value=conn):
+        await publisher.publish("user.events", "user.deleted", MagicMock())
+        channel.is_closed = True
+        _, new_channel, new_exchange = _mock_connection()
+        conn.channel.return_value = new_channel
+
+        # When: 다시 발행
+        await publisher.publish("user.events", "user.deleted", MagicMock())
+
+    # Then: 새 채널을 열어 exchange를 다시 선언하고 발행함
+    assert conn.channel.await_count == 2
+    new_channel.declare_exchange.assert_awaited_once()
+    new_exchange.publish.assert_awaited_once()
+
+# 발행 중 요청이 취소되어도 채널이 풀에서 새지 않고 닫히는지 확인
+@pytest.mark.asyncio
+async def test_publish_cancelled_closes_channel_and_releases_slot():
+    # Given: 채널 풀 크기 1, 브로커 확인 응답을 기다리는 중 취소되는 발행
+    conn, channel, exchange = _mock_connection()
+    exchange.publish.side_effect = asyncio.CancelledError()
+    publisher = EventPublisher(pool_size=1)
+
+    # When: 발행 취소
+    with patch("app.event.event_publisher.get_connection", new_callable=AsyncMock, return_value=conn):
+        with pytest.raises(asyncio.CancelledError):
+            await publisher.publish("user.events", "user.deleted", MagicMock())
+
+    # Then: 상태를 알 수 없는 채널은 닫고 풀에 반환하지 않으며, 풀 슬롯은 반환됨
+    channel.close.assert_awaited_once()
+    assert publisher._idle == []
+    assert not publisher._semaphore.locked()
+
+# relay의 실제 발행 경로가 mq.publish 단계로 기록되는지 확인
+@pytest.mark.asyncio
+async def test_publish_records_mq_publish_stage():
+    # Given: 현재까지 기록된 발행 단계 관측 횟수
+    def count() -> float:
+        return REGISTRY.get_sample_value("app_stage_latency_seconds_count", {"stage": "mq.publish"}) or 0
+
+    conn, _, _ = _mock_connection()
+    publisher = EventPublisher(pool_size=1)
+    before = count()
+
+    # When: 이벤트 발행
+    with patch("app.event.event_publisher.get_connection", new_callable=AsyncMock, return_value=conn):
+        await publisher.publish("user.events", "user.deleted", MagicMock())
+
+    # Then: 한 번 기록됨
+    assert count() == before + 1
@@ -0,0 +1,28 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from app.common.cursor import encode_cursor
+from app.domain.user.user_schema import UserQueryParams
+from app.repository.persistence.user_repository_impl import UserRepositoryImpl
+
+# lambda_stmt로 캐싱된 목록 쿼리가 호출마다 새 파라미터 값으로 바인딩되는 케이스
+@pytest.mark.asyncio
+async def test_get_users_lambda_statement_binds_current_values():
+    # Given: 실행된 구문을 기록하는 세션
+    db = AsyncMock()
+    db.execute.return_value = MagicMock()
+    repo = UserRepositoryImpl(db)
+    created_at = datetime(2025, 7, 12, 15, 30)
+
+    # When: offset 페이지 두 번, cursor 페이지 한 번 조회
+    await repo.get_users(UserQueryParams(page=1, size=10))
+    await repo.get_users(UserQueryParams(page=3, size=20))
+    await repo.get_users(UserQueryParams(size=5, cursor=encode_cursor(created_at, 42)))
+
+    # Then: 같은 SQL을 재사용하면서 파라미터는 각 호출의 값으로 채워짐
+    compiled = [call.args[0].compile(dialect=postgresql.asyncpg.dialect()) for call in db.execute.await_args_list]
+    assert str(compiled[0]) == str(compiled[1])
+    assert list(compiled[0].params.values()) == [10, 0]
+    assert list(compiled[1].params.values()) == [20, 40]
+    assert list(compiled[2].params.values()) == [created_at, 42, 5]
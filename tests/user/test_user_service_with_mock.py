@@ -7,12 +7,12 @@ async def test_update_user_success():
     # Given: 기존 사용자와 수정 요청 정보 설정
     user = User(id=1, email="old@example.com", name="Old Name", is_active=True, role=Role(name="Member"))
     repo = AsyncMock()
-    repo.get_user_with_role.return_value = user
+    repo.get_user_by_id.return_value = user
     repo.update_user.return_value = None
 
     service = UserService(repo)
     update = UserUpdateRequest(name="New Name", email="new@example.com")
-    requester = User(id=1, role=Role(name="Member"))  # 본인 요청
+    requester = Principal(id=1, role_name="Member", is_active=True)  # 본인 요청
 
     # When: 사용자 정보 수정 요청
     updated = await service.update_user(user_id=1, update=update, current_user=requester)
@@ -28,10 +28,10 @@ async def test_update_user_is_active_rejected_for_member():
     # Given: 일반 사용자(Member)로 로그인, is_active 수정 요청
     user = User(id=1, email="a@example.com", name="a", is_active=True, role=Role(name="Member"))
     repo = AsyncMock()
-    repo.get_user_with_role.return_value = user
+    repo.get_user_by_id.return_value = user
 
     service = UserService(repo)
-    requester = User(id=1, role=Role(name="Member"))
+    requester = Principal(id=1, role_name="Member", is_active=True)
     update = UserUpdateRequest(is_active=False)
 
     # When / Then: 수정 시도 시 403 예외 발생
@@ -68,7 +68,7 @@ async def test_get_user_cache_miss_then_store():
     # Given: 캐시에는 사용자 정보가 없고, DB에는 존재하는 사용자
     user = User(id=3, email="miss@example.com", name="Miss", role=Role(name="Member"))
     repo = AsyncMock()
-    repo.get_user_with_role.return_value = user
+    repo.get_user_by_id.return_value = user
     service = UserService(repo)
     current_user = User(id=1, role=Role(name="Admin"))  # 관리자 권한으로 조회
 
@@ -85,10 +85,15 @@ async def test_get_user_cache_miss_then_store():
         mock_set.assert_awaited_once()   # 캐시에 한 번 저장
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from collections import namedtuple
+from datetime import datetime
+from unittest.mock import AsyncMock, patch, call
 from app.service.user_service import UserService
+from app.common.role_registry import role_registry, RoleRegistry
 from app.db.models.user_model import User, Role
+from app.domain.user.user_enum import UserFileFormat
 from app.domain.user.user_schema import UserUpdateRequest, UserQueryParams
+from app.domain.auth.auth_schema import Principal
 
 # 단일 사용자 조회 시 캐시 히트 케이스
 @pytest.mark.asyncio
@@ -111,7 +116,7 @@ async def test_get_user_cache_hit():
         # Then: 캐시에서 데이터를 받아오고, DB는 호출되지 않음
         assert result == fake_data
         mock_cache.assert_awaited_once()
-        repo.get_user_with_role.assert_not_called()
+        repo.get_user_by_id.assert_not_called()
 
 # 사용자 목록 조회 시 캐시 히트 케이스
 @pytest.mark.asyncio
@@ -152,7 +157,7 @@ async def test_update_user_cache_invalidation():
     # Given: 기존 사용자와 업데이트 요청 존재
     user = User(id=10, email="u@example.com", name="U", is_active=True, role=Role(name="Member"))
     repo = AsyncMock()
-    repo.get_user_with_role.return_value = user
+    repo.get_user_by_id.return_value = user
     repo.update_user.return_value = None
 
     service = UserService(repo)
@@ -161,21 +166,25 @@ async def test_update_user_cache_invalidation():
 
     # When: 사용자 정보 업데이트
     with patch("app.common.redis.redis_cache.delete", new_callable=AsyncMock) as mock_delete, \
-         patch("app.common.redis.redis_cache.delete_pattern", new_callable=AsyncMock) as mock_delete_pattern:
+         patch("app.common.redis.redis_cache.set", new_callable=AsyncMock) as mock_set, \
+         patch("app.common.redis.redis_cache.publish_invalidation", new_callable=AsyncMock) as mock_publish, \
+         patch("app.common.redis.redis_cache.incr", new_callable=AsyncMock) as mock_incr:
 
         await service.update_user(user_id=10, update=update, current_user=current_user)
 
-        # Then: 단일 사용자 및 사용자 목록 캐시 무효화 함수 호출
-        mock_delete.assert_awaited_once_with("user:10")
-        mock_delete_pattern.assert_awaited_once_with("users:*")
+        # Then: 단일 사용자 캐시 삭제, 인증 주체 tombstone 저장 및 무효화 발행, 사용자 목록 캐시 무효화
+        assert mock_delete.await_args_list == [call("user:10")]
+        mock_set.assert_awaited_once_with("principal:10", {"invalidated": True}, ex=10, nx=False)
+        mock_publish.assert_awaited_once_with("principal:10")
+        mock_incr.assert_awaited_once_with("users:gen")
 
-# 사용자 삭제 시 캐시 삭제 및 이벤트 발행이 수행되는지 확인
+# 사용자 삭제 시 캐시 삭제 및 이벤트 저장이 수행되는지 확인
 @pytest.mark.asyncio
 async def test_delete_user_cache_invalidation():
     # Given: 삭제 대상 사용자, 삭제 요청자(Admin), Mock Repository 구성
     user = User(id=20, email="x@example.com", name="X", is_active=True, role=Role(name="Member"))
     repo = AsyncMock()
-    repo.get_user_with_role.return_value = user
+    repo.get_user_by_id.return_value = user
     repo.delete_user.return_value = None
 
     service = UserService(repo)
@@ -183,17 +192,228 @@ async def test_delete_user_cache_invalidation():
 
     # When: 사용자 삭제 요청 실행
     with patch("app.common.redis.redis_cache.delete", new_callable=AsyncMock) as mock_delete, \
-         patch("app.common.redis.redis_cache.delete_pattern", new_callable=AsyncMock) as mock_delete_pattern, \
-         patch("app.service.user_service.publish_user_deleted", new_callable=AsyncMock) as mock_event:
+         patch("app.common.redis.redis_cache.set", new_callable=AsyncMock) as mock_set, \
+         patch("app.common.redis.redis_cache.publish_invalidation", new_callable=AsyncMock) as mock_publish, \
+         patch("app.common.redis.redis_cache.incr", new_callable=AsyncMock) as mock_incr:
 
         await service.delete_user(user_id=20, current_user=current_user)
 
         # Then:
-        # - 개별 사용자 캐시 삭제
-        # - 사용자 목록 캐시 삭제 (패턴 기반)
-        # - 사용자 삭제 이벤트 발행
-        mock_delete.assert_awaited_once_with("user:20")
-        mock_delete_pattern.assert_awaited_once_with("users:*")
-        mock_event.assert_awaited_once_with(20)
+        # - 개별 사용자 캐시 삭제, 인증 주체 캐시는 tombstone 저장 후 다른 워커에 무효화 발행
+        # - 사용자 목록 캐시 세대 번호 증가
+        # - 사용자 삭제 이벤트가 탈퇴와 함께 아웃박스에 저장
+        assert mock_delete.await_args_list == [call("user:20")]
+        mock_set.assert_awaited_once_with("principal:20", {"invalidated": True}, ex=10, nx=False)
+        mock_publish.assert_awaited_once_with("principal:20")
+        mock_incr.assert_awaited_once_with("users:gen")
+        event = repo.delete_user.await_args[0][1]
+        assert event.payload == {"event": "USER_DELETED", "user_id": 20}
 
 
+
+# 페이지가 가득 찬 경우 다음 페이지 cursor가 반환되는 케이스
+@pytest.mark.asyncio
+async def test_get_users_returns_next_cursor_for_full_page():
+    from datetime import datetime
+    from app.common.cursor import decode_cursor
+
+    # Given: 요청 크기만큼 사용자가 조회됨
+    created_at = datetime(2025, 7, 12, 15, 30, 46)
+    repo = AsyncMock()
+    repo.get_users.return_value = [
+        User(id=2, email="b@example.com", name="b", is_active=True, created_at=created_at, role=Role(name="Member")),
+        User(id=1, email="a@example.com", name="a", is_active=True, created_at=created_at, role=Role(name="Member")),
+    ]
+    repo.count_users.return_value = 5
+
+    service = UserService(repo)
+    params = UserQueryParams(size=2)
+
+    # When: 사용자 목록 요청
+    with patch("app.common.redis.redis_cache.get_json", return_value=None), \
+         patch("app.common.redis.redis_cache.set", new_callable=AsyncMock):
+        result = await service.get_users(params)
+
+    # Then: 마지막 사용자의 (created_at, id)가 cursor로 인코딩됨
+    assert decode_cursor(result.next_cursor) == (created_at, 1)
+
+# include_total=false이면 count 쿼리를 실행하지 않는 케이스
+@pytest.mark.asyncio
+async def test_get_users_skips_total_when_not_requested():
+    # Given: total 없이 목록만 요청
+    repo = AsyncMock()
+    repo.get_users.return_value = []
+
+    service = UserService(repo)
+    params = UserQueryParams(include_total=False)
+
+    # When: 사용자 목록 요청
+    with patch("app.common.redis.redis_cache.get_json", return_value=None), \
+         patch("app.common.redis.redis_cache.set", new_callable=AsyncMock):
+        result = await service.get_users(params)
+
+    # Then: total은 null이고, count/추정 쿼리는 호출되지 않음
+    assert result.total is None
+    repo.count_users.assert_not_awaited()
+    repo.estimate_users.assert_not_awaited()
+
+# estimated 모드에서 통계 추정치를 total로 사용하는 케이스
+@pytest.mark.asyncio
+async def test_get_users_estimated_total():
+    from app.domain.user.user_enum import UserCountMode
+
+    # Given: pg_class 통계 추정치가 존재함
+    repo = AsyncMock()
+    repo.get_users.return_value = []
+    repo.estimate_users.return_value = 1_000_000
+
+    service = UserService(repo)
+    params = UserQueryParams(total_mode=UserCountMode.ESTIMATED)
+
+    # When: 사용자 목록 요청
+    with patch("app.common.redis.redis_cache.get_json", return_value=None), \
+         patch("app.common.redis.redis_cache.set", new_callable=AsyncMock):
+        result = await service.get_users(params)
+
+    # Then: 추정치가 반환되고, count(*)는 실행되지 않음
+    assert result.total == 1_000_000
+    repo.count_users.assert_not_awaited()
+
+# 목록 캐시 키에 현재 세대 번호가 포함되는지 확인
+@pytest.mark.asyncio
+async def test_get_users_cache_key_uses_generation():
+    # Given: 목록 캐시 세대 번호가 7
+    repo = AsyncMock()
+    repo.get_users.return_value = []
+    service = UserService(repo)
+
+    # When: 사용자 목록 요청 (캐시 미스)
+    with patch("app.common.redis.redis_cache.get", new_callable=AsyncMock, return_value="7"), \
+         patch("app.common.redis.redis_cache.get_json", return_value=None) as mock_get, \
+         patch("app.common.redis.redis_cache.set", new_callable=AsyncMock) as mock_set:
+        await service.get_users(UserQueryParams(include_total=False))
+
+    # Then: v7 네임스페이스로 조회 및 저장
+    assert mock_get.await_args[0][0].startswith("users:v7:")
+    assert mock_set.await_args[0][0].startswith("users:v7:")
+
+# 다건 조회 시 캐시 미스만 한 번에 DB 조회 후 일괄 캐싱하는 케이스
+@pytest.mark.asyncio
+async def test_get_users_by_ids_loads_only_misses():
+    # Given: 1번은 캐시에 있고, 2번은 DB에만 있고, 3번은 존재하지 않음
+    repo = AsyncMock()
+    repo.get_users_by_ids.return_value = [
+        User(id=2, email="b@example.com", name="b", role=Role(name="Member")),
+    ]
+    service = UserService(repo)
+    cached_user = {"id": 1, "email": "a@example.com", "name": "a", "role": "Admin"}
+
+    # When: 중복 포함 ID 목록으로 다건 조회
+    with patch("app.common.redis.redis_cache.mget_json", new_callable=AsyncMock,
+               return_value=[cached_user, None, None]) as mock_mget, \
+         patch("app.common.redis.redis_cache.set_many", new_callable=AsyncMock) as mock_set_many:
+        result = await service.get_users_by_ids([1, 2, 3, 1])
+
+    # Then: MGET 1회, 미스(2, 3)만 DB 조회 1회, 조회된 2번만 일괄 캐싱
+    mock_mget.assert_awaited_once_with(["user:1", "user:2", "user:3"])
+    repo.get_users_by_ids.assert_awaited_once_with([2, 3])
+    assert list(mock_set_many.await_args[0][0]) == ["user:2"]
+    assert [user.id for user in result.users] == [1, 2]
+    assert result.missing == [3]
+
+# 내보내기 시 커서 청크 단위로 CSV 텍스트를 만들어 반환하는 케이스
+@pytest.mark.asyncio
+async def test_export_users_streams_csv_chunks():
+    # Given: 서버 사이드 커서가 두 개의 청크를 반환
+    Row = namedtuple("Row", ["id", "email", "name", "role", "is_active", "created_at"])
+    created_at = datetime(2025, 7, 12, 15, 30)
+    partitions = [
+        [Row(1, "a@example.com", "a", "Admin", True, created_at)],
+        [Row(2, "b@example.com", None, "Member", False, created_at)],
+    ]
+
+    async def stream_users(chunk_size):
+        for rows in partitions:
+            yield rows
+
+    repo = AsyncMock()
+    repo.stream_users = stream_users
+    service = UserService(repo)
+
+    # When: CSV 형식으로 내보내기
+    chunks = [chunk async for chunk in service.export_users(UserFileFormat.CSV)]
+
+    # Then: 헤더 + 청크별 한 덩어리씩 반환
+    assert chunks == [
+        "id,email,name,role,is_active,created_at\n",
+        "1,a@example.com,a,Admin,True,2025-07-12T15:30:00\n",
+        "2,b@example.com,,Member,False,2025-07-12T15:30:00\n",
+    ]
+
+# role을 JOIN하지 않고 메모리의 역할 목록으로 역할 이름을 채우는 케이스
+@pytest.mark.asyncio
+async def test_get_user_resolves_role_name_from_registry():
+    # Given: role 관계 없이 role_id만 가진 사용자, 역할 목록 로드됨
+    role_registry.set_roles({1: "Admin", 2: "Member"})
+    repo = AsyncMock()
+    repo.get_user_by_id.return_value = User(id=3, email="c@example.com", name="c", role_id=2)
+    service = UserService(repo)
+
+    # When: 캐시 미스 상태에서 단건 조회
+    with patch("app.common.redis.redis_cache.get_json", return_value=None), \
+         patch("app.common.redis.redis_cache.set", new_callable=AsyncMock):
+        result = await service.get_user(3, current_user=User(id=1, role=Role(name="Admin")))
+
+    # Then: 역할 이름이 역할 목록에서 채워짐
+    assert result["role"] == "Member"
+
+# 시작 시 역할 목록 로드가 일시적으로 실패하면 재시도하고, 계속 실패하면 기동을 중단하는 케이스
+@pytest.mark.asyncio
+async def test_role_registry_startup_load_retries_then_fails():
+    # Given: 첫 조회는 실패하고 두 번째에 성공하는 DB, 항상 실패하는 DB
+    result = AsyncMock()
+    result.all = lambda: [(1, "Admin"), (2, "Member")]
+    flaky_session = AsyncMock()
+    flaky_session.execute.side_effect = [ConnectionError("db starting"), result]
+    broken_session = AsyncMock()
+    broken_session.execute.side_effect = ConnectionError("db down")
+
+    def _factory(session):
+        factory = AsyncMock()
+        factory.return_value.__aenter__.return_value = session
+        return lambda: factory.return_value
+
+    recovered = RoleRegistry(_factory(flaky_session), refresh_interval=300)
+    broken = RoleRegistry(_factory(broken_session), refresh_interval=300)
+
+    # When: 시작 시 로드
+    await recovered.load_on_startup(attempts=3, delay=0)
+    with pytest.raises(ConnectionError):
+        await broken.load_on_startup(attempts=2, delay=0)
+
+    # Then: 재시도 후 역할 목록이 로드되고, 계속 실패하면 예외가 전파되어 기동하지 않음
+    assert recovered.name_of(2) == "Member"
+    assert broken_session.execute.await_count == 2
+
+# 역할 목록을 다시 읽어도 없는 역할은 None 대신 503 예외로 실패하는 케이스
+@pytest.mark.asyncio
+async def test_role_registry_unknown_role_reloads_once_then_fails():
+    # Given: Member만 있는 DB에서 역할 목록을 읽는 레지스트리
+    result = AsyncMock()
+    result.all = lambda: [(2, "Member")]
+    session = AsyncMock()
+    session.execute.return_value = result
+    factory = AsyncMock()
+    factory.return_value.__aenter__.return_value = session
+    registry = RoleRegistry(lambda: factory.return_value, refresh_interval=300, min_reload_interval=0)
+
+    # When: 알 수 없는 역할 ID / 이름 조회
+    with pytest.raises(HTTPException) as by_id:
+        await registry.get_name(99)
+    with pytest.raises(HTTPException) as by_name:
+        await registry.get_id("Unknown")
+
+    # Then: 조회마다 한 번씩 다시 읽은 뒤 503으로 실패하고, 아는 역할은 정상 조회
+    assert by_id.value.status_code == 503 and by_name.value.status_code == 503
+    assert session.execute.await_count == 2
+    assert await registry.get_id("Member") == 2
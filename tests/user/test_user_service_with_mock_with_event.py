@@ -1,25 +1,59 @@
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
 from app.service.user_service import UserService
 from app.db.models.user_model import User, Role
+from app.db.models.outbox_model import OutboxEvent
+from app.event.outbox_relay import OutboxRelay
 
-# 사용자 삭제 시 soft delete 처리 및 이벤트 발행 확인 테스트
+# 사용자 삭제 시 soft delete 처리 및 아웃박스 이벤트 저장 확인 테스트
 @pytest.mark.asyncio
 async def test_delete_user_triggers_event():
     # Given: 존재하는 사용자와 요청자(Member), 삭제 관련 의존성 설정
     user = User(id=1, email="x", name="x", is_active=True, role=Role(name="Member"))
     repo = AsyncMock()
-    repo.get_user_with_role.return_value = user
+    repo.get_user_by_id.return_value = user
     repo.delete_user.return_value = None
 
     service = UserService(repo)
     requester = User(id=1, role=Role(name="Member"))  # 본인 삭제 요청
 
-    # When: 사용자 삭제 메서드 호출 (이벤트 발행 함수는 패치됨)
-    with patch("app.service.user_service.publish_user_deleted", new_callable=AsyncMock) as mock_publish:
-        await service.delete_user(user_id=1, current_user=requester)
+    # When: 사용자 삭제 메서드 호출
+    await service.delete_user(user_id=1, current_user=requester)
 
-        # Then: 사용자 is_active가 False로 바뀌고, deleted_at 설정됨, 이벤트 발행됨
-        assert user.is_active is False
-        assert user.deleted_at is not None
-        mock_publish.assert_awaited_once_with(1)
+    # Then: 사용자 is_active가 False로 바뀌고, deleted_at 설정됨, 이벤트가 같은 트랜잭션으로 저장됨
+    assert user.is_active is False
+    assert user.deleted_at is not None
+    deleted_user, event = repo.delete_user.await_args[0]
+    assert deleted_user is user
+    assert (event.exchange, event.routing_key) == ("user.events", "user.deleted")
+    assert event.payload == {"event": "USER_DELETED", "user_id": 1}
+
+# outbox relay가 잠근 배치를 모두 발행한 뒤 삭제하는지 확인
+@pytest.mark.asyncio
+async def test_outbox_relay_publishes_batch_then_deletes():
+    # Given: 미발행 이벤트 2건
+    events = [
+        OutboxEvent(id=1, exchange="user.events", routing_key="user.deleted", payload={"user_id": 1}),
+        OutboxEvent(id=2, exchange="user.events", routing_key="user.deleted", payload={"user_id": 2}),
+    ]
+    select_result = MagicMock()
+    select_result.scalars.return_value.all.return_value = events
+    session = AsyncMock()
+    session.begin = MagicMock(return_value=AsyncMock())
+    session.execute.side_effect = [select_result, None]
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = session
+    publisher = AsyncMock()
+
+    relay = OutboxRelay(session_factory, publisher, batch_size=10, poll_interval=0)
+
+    # When: relay 한 주기 실행
+    relayed = await relay.relay_once()
+
+    # Then: 2건 발행 후 SKIP LOCKED 조회 + 삭제 쿼리 실행
+    assert relayed == 2
+    assert publisher.publish.await_count == 2
+    select_stmt = session.execute.await_args_list[0][0][0]
+    assert "SKIP LOCKED" in str(select_stmt.compile(dialect=postgresql.dialect()))
+    assert session.execute.await_count == 2